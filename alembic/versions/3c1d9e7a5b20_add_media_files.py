@@ -0,0 +1,37 @@
+"""add media files
+
+Revision ID: 3c1d9e7a5b20
+Revises: fc006743ae85
+Create Date: 2026-10-18 15:10:12.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1d9e7a5b20'
+down_revision: Union[str, Sequence[str], None] = 'fc006743ae85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('media_files',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('path', sa.String(length=255), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('file_id', sa.String(length=255), nullable=False),
+    sa.Column('file_unique_id', sa.String(length=64), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('path', 'content_hash', name='uq_media_files_path_hash')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('media_files')
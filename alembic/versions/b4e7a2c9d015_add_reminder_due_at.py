@@ -0,0 +1,36 @@
+"""add reminder due_at
+
+Revision ID: b4e7a2c9d015
+Revises: 8f2b6c4d1e93
+Create Date: 2026-10-18 17:21:05.734102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e7a2c9d015'
+down_revision: Union[str, Sequence[str], None] = '8f2b6c4d1e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reminders', sa.Column('due_at', sa.DateTime(), nullable=True))
+    op.add_column('reminders', sa.Column('remind_username', sa.String(length=100), nullable=True))
+    op.add_column('reminders', sa.Column('request_message_id', sa.BigInteger(), nullable=True))
+    op.add_column('reminders', sa.Column('notice_message_id', sa.BigInteger(), nullable=True))
+    op.create_index('ix_reminders_due_at', 'reminders', ['due_at'], unique=False, postgresql_where=sa.text('due_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reminders_due_at', table_name='reminders', postgresql_where=sa.text('due_at IS NOT NULL'))
+    op.drop_column('reminders', 'notice_message_id')
+    op.drop_column('reminders', 'request_message_id')
+    op.drop_column('reminders', 'remind_username')
+    op.drop_column('reminders', 'due_at')
@@ -0,0 +1,41 @@
+"""add reminders lookup indexes
+
+Revision ID: d5a8c3e1f742
+Revises: b4e7a2c9d015
+Create Date: 2026-10-18 18:02:47.118530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8c3e1f742'
+down_revision: Union[str, Sequence[str], None] = 'b4e7a2c9d015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Дубликаты (chat_id, message_id) оставлены гонкой в save_reminder:
+    # сохраняется последняя запись
+    op.execute(
+        """
+        DELETE FROM reminders r
+        USING reminders newer
+        WHERE r.chat_id = newer.chat_id
+          AND r.message_id = newer.message_id
+          AND r.id < newer.id
+        """
+    )
+    op.create_index('uq_reminders_chat_message', 'reminders', ['chat_id', 'message_id'], unique=True)
+    op.create_index('ix_reminders_chat_created', 'reminders', ['chat_id', sa.text('created_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reminders_chat_created', table_name='reminders')
+    op.drop_index('uq_reminders_chat_message', table_name='reminders')
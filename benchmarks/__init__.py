@@ -0,0 +1,7 @@
+"""
+Пакет benchmarks.
+
+Содержит инструменты нагрузочного тестирования: локальный fake-сервер
+Telegram Bot API, генератор синтетических апдейтов, бенчмарки хендлеров
+и JSON-кодеков, профиль времени старта.
+"""
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Бенчмарк записи заявки клиента в таблицу users.
+
+Сравниваются два способа отметить заявку (телефон, дата активности,
+статус "Client"):
+
+- separate — три вызова UsersService (set_phone_number, update_last_data,
+  set_client_status): три сессии, в каждой UPDATE ... RETURNING;
+- combined — UsersService.record_client_request: один UPDATE ... RETURNING.
+
+Для каждого способа выводятся запросы к БД и транзакции на заявку,
+p50/p95/p99 задержки и заявки в секунду. Пользователи создаются с
+отрицательными user_id (у пользователей Telegram таких нет); прогон
+использует и после себя удаляет только созданные им строки. Нужна
+PostgreSQL из .env с применёнными миграциями.
+
+Запуск:
+    python -m benchmarks.client_request_bench --iterations 500 --concurrency 10
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import event, text
+
+from benchmarks.handlers_bench import percentile
+
+# Отрицательные user_id не бывают у пользователей Telegram
+FIRST_USER_ID = -900_000_000
+
+
+async def separate(users_service, user_id: int) -> None:
+    await users_service.set_phone_number(user_id, "+70000000000")
+    await users_service.update_last_data(user_id, datetime.now(timezone.utc))
+    await users_service.set_client_status(user_id)
+
+
+async def combined(users_service, user_id: int) -> None:
+    await users_service.record_client_request(user_id, "+70000000000")
+
+
+SCENARIOS: Dict[str, Callable[[Any, int], Awaitable[None]]] = {
+    "separate": separate,
+    "combined": combined,
+}
+
+
+async def run_scenario(
+        call: Callable[[int], Awaitable[None]],
+        iterations: int,
+        user_ids: List[int],
+        concurrency: int,
+) -> Dict[str, float]:
+    """
+    Выполняет iterations заявок не более чем по concurrency одновременно.
+
+    Returns:
+        Dict[str, float]: Перцентили задержки (мс) и заявки в секунду.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call(user_ids[i % len(user_ids)])
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(iterations)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests_per_second": iterations / elapsed,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    from database import AsyncSessionFactory
+    from database.accessor import engine
+    from services import users_service
+
+    engine.echo = False
+    counts = {"statements": 0, "commits": 0}
+
+    def on_execute(*_: Any) -> None:
+        counts["statements"] += 1
+
+    def on_commit(*_: Any) -> None:
+        counts["commits"] += 1
+
+    # Прогон использует и удаляет только созданные им строки
+    async with AsyncSessionFactory() as session:
+        user_ids = list((await session.execute(
+            text(
+                "INSERT INTO users (user_id, chat_id, status) "
+                "SELECT g, g, 'Guest' FROM generate_series("
+                "CAST(:first AS BIGINT), CAST(:last AS BIGINT)) g "
+                "ON CONFLICT DO NOTHING RETURNING user_id"
+            ),
+            {"first": FIRST_USER_ID, "last": FIRST_USER_ID + args.iterations - 1},
+        )).scalars())
+        await session.commit()
+    if not user_ids:
+        await engine.dispose()
+        raise SystemExit("Диапазон синтетических user_id занят")
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    event.listen(engine.sync_engine, "commit", on_commit)
+    try:
+        for name in args.scenarios:
+            call = SCENARIOS[name]
+            await run_scenario(
+                lambda user_id: call(users_service, user_id),
+                args.warmup, user_ids, args.concurrency,
+            )
+            counts.update(statements=0, commits=0)
+            summary = await run_scenario(
+                lambda user_id: call(users_service, user_id),
+                args.iterations, user_ids, args.concurrency,
+            )
+            print(
+                f"{name:9} {counts['statements'] / args.iterations:4.1f} запросов, "
+                f"{counts['commits'] / args.iterations:4.1f} транзакций на заявку  "
+                f"{summary['requests_per_second']:8.1f} заявок/с  "
+                f"p50 {summary['p50_ms']:6.2f} ms  "
+                f"p95 {summary['p95_ms']:6.2f} ms  "
+                f"p99 {summary['p99_ms']:6.2f} ms"
+            )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+        event.remove(engine.sync_engine, "commit", on_commit)
+        async with AsyncSessionFactory() as session:
+            await session.execute(
+                text("DELETE FROM users WHERE user_id = ANY(CAST(:ids AS BIGINT[]))"),
+                {"ids": user_ids},
+            )
+            await session.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS),
+                        choices=list(SCENARIOS))
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Локальный fake-сервер Telegram Bot API для нагрузочного тестирования.
+
+Запуск:
+    python -m benchmarks.fake_telegram_api --port 8081 --latency 0.02
+
+Бот направляется на сервер переменной окружения
+TELEGRAM_API_URL=http://127.0.0.1:8081.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from benchmarks.synthetic import generate_updates, make_chat
+
+logger = logging.getLogger(__name__)
+
+BOT_USER = {
+    "id": 1000000,
+    "is_bot": True,
+    "first_name": "FakeBot",
+    "username": "fake_bot",
+}
+
+
+class FakeTelegramAPI:
+    """
+    Имитация Bot API с настраиваемой задержкой и ошибками 429.
+
+    Attributes:
+        latency (float): Базовая задержка ответа в секундах.
+        jitter (float): Случайная добавка к задержке в секундах.
+        rate_limit_probability (float): Вероятность ответа 429.
+        retry_after (int): Значение retry_after в ответах 429.
+        calls (Counter): Количество вызовов по методам.
+        rate_limited (Counter): Количество ответов 429 по методам.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit_probability: float = 0.0,
+        retry_after: int = 1,
+    ) -> None:
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.rate_limit_probability: float = rate_limit_probability
+        self.retry_after: int = retry_after
+
+        self.calls: Counter = Counter()
+        self.rate_limited: Counter = Counter()
+        self.started_at: float = time.monotonic()
+
+        self._updates: List[Dict[str, Any]] = []
+        self._updates_event: asyncio.Event = asyncio.Event()
+        self._message_ids: Dict[int, itertools.count] = defaultdict(
+            lambda: itertools.count(1)
+        )
+        self._file_ids = itertools.count(1)
+
+        self.methods = {
+            "getMe": self.get_me,
+            "getUpdates": self.get_updates,
+            "sendMessage": self.send_message,
+            "sendPhoto": self.send_photo,
+            "sendDocument": self.send_document,
+            "sendMediaGroup": self.send_media_group,
+            "getChatMember": self.get_chat_member,
+            "deleteMessage": self.delete_message,
+        }
+
+    def create_app(self) -> web.Application:
+        """
+        Создаёт aiohttp-приложение сервера.
+
+        Returns:
+            web.Application: Приложение с маршрутами Bot API и управления.
+        """
+        app = web.Application(client_max_size=64 * 1024 ** 2)
+        app.router.add_route("*", "/bot{token}/{method}", self.handle)
+        app.router.add_post("/_control/updates", self.handle_push_updates)
+        app.router.add_get("/_control/stats", self.handle_stats)
+        return app
+
+    def push_updates(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Добавляет апдейты в очередь getUpdates.
+
+        Args:
+            updates (List[Dict[str, Any]]): Апдейты в формате Bot API.
+        """
+        self._updates.extend(updates)
+        self._updates_event.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Счётчики вызовов и ошибок 429.
+        """
+        elapsed = time.monotonic() - self.started_at
+        total = sum(self.calls.values())
+        return {
+            "elapsed_seconds": elapsed,
+            "calls_total": total,
+            "calls_per_second": total / elapsed if elapsed else 0.0,
+            "calls": dict(self.calls),
+            "rate_limited": dict(self.rate_limited),
+            "pending_updates": len(self._updates),
+        }
+
+    async def handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        params = await self._read_params(request)
+        self.calls[method] += 1
+
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay and method != "getUpdates":
+            await asyncio.sleep(delay)
+
+        if (
+            method != "getUpdates"
+            and random.random() < self.rate_limit_probability
+        ):
+            self.rate_limited[method] += 1
+            return web.json_response(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": (
+                        f"Too Many Requests: retry after {self.retry_after}"
+                    ),
+                    "parameters": {"retry_after": self.retry_after},
+                },
+                status=429,
+            )
+
+        handler = self.methods.get(method)
+        result = await handler(params) if handler else True
+        return web.json_response({"ok": True, "result": result})
+
+    async def handle_push_updates(self, request: web.Request) -> web.Response:
+        """
+        Добавляет апдейты: переданный JSON-список или сгенерированные
+        по параметрам count/chats.
+        """
+        if request.can_read_body:
+            updates = await request.json()
+        else:
+            updates = generate_updates(
+                count=int(request.query.get("count", 100)),
+                chats=int(request.query.get("chats", 100)),
+            )
+        self.push_updates(updates)
+        return web.json_response({"ok": True, "queued": len(updates)})
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats())
+
+    @staticmethod
+    async def _read_params(request: web.Request) -> Dict[str, Any]:
+        if request.content_type == "application/json":
+            return await request.json()
+        if request.method == "GET":
+            form: Any = request.query
+        else:
+            form = await request.post()
+        params: Dict[str, Any] = {}
+        for key, value in form.items():
+            if not isinstance(value, str):
+                # Загружаемый файл
+                params[key] = value
+                continue
+            try:
+                params[key] = json.loads(value)
+            except ValueError:
+                params[key] = value
+        return params
+
+    def _message(self, chat_id: Any, **fields: Any) -> Dict[str, Any]:
+        chat_id = int(chat_id)
+        return {
+            "message_id": next(self._message_ids[chat_id]),
+            "date": int(time.time()),
+            "chat": make_chat(chat_id),
+            "from": BOT_USER,
+            **fields,
+        }
+
+    def _photo(self) -> List[Dict[str, Any]]:
+        file_id = f"photo-{next(self._file_ids)}"
+        return [{
+            "file_id": file_id,
+            "file_unique_id": file_id,
+            "width": 1280,
+            "height": 960,
+        }]
+
+    async def get_me(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {**BOT_USER, "can_join_groups": True}
+
+    async def get_updates(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        offset: Optional[int] = params.get("offset")
+        if offset:
+            self._updates = [
+                u for u in self._updates if u["update_id"] >= int(offset)
+            ]
+        if not self._updates:
+            self._updates_event.clear()
+            try:
+                await asyncio.wait_for(
+                    self._updates_event.wait(),
+                    timeout=float(params.get("timeout") or 0),
+                )
+            except asyncio.TimeoutError:
+                return []
+        limit = int(params.get("limit") or 100)
+        return self._updates[:limit]
+
+    async def send_message(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._message(params["chat_id"], text=params.get("text", ""))
+
+    async def send_photo(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._message(params["chat_id"], photo=self._photo())
+
+    async def send_document(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        file_id = f"document-{next(self._file_ids)}"
+        return self._message(
+            params["chat_id"],
+            document={"file_id": file_id, "file_unique_id": file_id},
+        )
+
+    async def send_media_group(
+        self, params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        return [
+            self._message(params["chat_id"], photo=self._photo())
+            for _ in params.get("media", [])
+        ]
+
+    async def get_chat_member(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        user_id = int(params["user_id"])
+        return {
+            "status": "administrator",
+            "user": {"id": user_id, "is_bot": False, "first_name": "Admin"},
+            "can_be_edited": False,
+            "can_manage_chat": True,
+            "can_change_info": True,
+            "can_delete_messages": True,
+            "can_invite_users": True,
+            "can_restrict_members": True,
+            "can_pin_messages": True,
+            "can_promote_members": False,
+            "can_manage_video_chats": True,
+            "can_post_stories": False,
+            "can_edit_stories": False,
+            "can_delete_stories": False,
+            "is_anonymous": False,
+        }
+
+    async def delete_message(self, params: Dict[str, Any]) -> bool:
+        return True
+
+
+async def serve(
+    api: FakeTelegramAPI, host: str = "127.0.0.1", port: int = 8081
+) -> web.AppRunner:
+    """
+    Запускает fake-сервер в текущем event loop.
+
+    Args:
+        api (FakeTelegramAPI): Экземпляр сервера.
+        host (str): Адрес для прослушивания.
+        port (int): Порт.
+
+    Returns:
+        web.AppRunner: Раннер; для остановки вызовите cleanup().
+    """
+    runner = web.AppRunner(api.create_app())
+    await runner.setup()
+    await web.TCPSite(runner, host=host, port=port).start()
+    return runner
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="вероятность ответа 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--updates", type=int, default=0,
+                        help="число апдейтов, сгенерированных при старте")
+    parser.add_argument("--chats", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    random.seed(args.seed)
+
+    async def run() -> None:
+        api = FakeTelegramAPI(
+            latency=args.latency,
+            jitter=args.jitter,
+            rate_limit_probability=args.rate_limit,
+            retry_after=args.retry_after,
+        )
+        if args.updates:
+            api.push_updates(generate_updates(args.updates, chats=args.chats))
+        runner = await serve(api, host=args.host, port=args.port)
+        logger.info(f"Fake Bot API слушает http://{args.host}:{args.port}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            logger.info(f"Статистика: {api.stats()}")
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Бенчмарк пропускной способности и задержки хендлеров.
+
+Синтетические апдейты прогоняются через настоящий Dispatcher со всеми
+роутерами из setup.register_routers. Вызовы Bot API уходят на fake-сервер,
+запущенный в том же процессе; для хендлеров, работающих с БД, нужна
+PostgreSQL из .env с применёнными миграциями.
+
+Пользователи и чаты синтетические, с отрицательными id (у пользователей
+Telegram таких нет), вместо ADMIN_CHAT_ID — синтетический чат
+администраторов: заявки и напоминания прогона не попадают в настоящий
+чат. Пользователи, заявки outbox и напоминания прогона удаляются после
+него.
+
+Запуск:
+    python -m benchmarks.handlers_bench --iterations 500 --concurrency 20
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks import synthetic
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Отрицательные user_id не бывают у пользователей Telegram
+FIRST_USER_ID = -930_000_000
+ADMIN_CHAT_ID = -930_500_000
+
+# Сценарий: генератор апдейта по номеру итерации и проверяемый хендлер
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "start": {
+        "handler": "StartHandler.start",
+        "build": lambda i: synthetic.start_update(FIRST_USER_ID + i),
+    },
+    "web_app_callback": {
+        "handler": "WebAppHandler.web_app_data_handler",
+        "build": lambda i: synthetic.web_app_update(FIRST_USER_ID + i),
+    },
+    "remind": {
+        "handler": "remind_keyboard_handler",
+        "build": lambda i: synthetic.remind_update(ADMIN_CHAT_ID, FIRST_USER_ID + i),
+    },
+    "about": {
+        "handler": "AboutHandler.about",
+        "build": lambda i: synthetic.text_update(FIRST_USER_ID + i, "👨‍🔧 О нас"),
+    },
+    "prices": {
+        "handler": "PricesHandler.prices",
+        "build": lambda i: synthetic.text_update(FIRST_USER_ID + i, "🧾 Стоимость"),
+    },
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Возвращает перцентиль q (0..100) по методу ближайшего ранга.
+    """
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(q * len(ordered) / 100) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: List[float], elapsed: float, handled: int) -> Dict[str, float]:
+    """
+    Сводная статистика по прогону сценария.
+
+    Args:
+        latencies (List[float]): Задержки апдейтов в секундах.
+        elapsed (float): Общее время прогона в секундах.
+        handled (int): Число апдейтов, дошедших до хендлера.
+
+    Returns:
+        Dict[str, float]: Перцентили задержки в мс и апдейтов в секунду.
+    """
+    return {
+        "count": len(latencies),
+        "handled": handled,
+        "updates_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_scenario(
+    dp: Any,
+    bot: Any,
+    build: Callable[[int], Dict[str, Any]],
+    iterations: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """
+    Прогоняет сценарий через dp.feed_update с заданной параллельностью.
+    """
+    from aiogram.dispatcher.event.bases import UNHANDLED
+    from aiogram.types import Update
+
+    updates = [
+        Update.model_validate(build(i), context={"bot": bot})
+        for i in range(iterations)
+    ]
+    latencies: List[float] = []
+    handled = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def feed(update: Update) -> None:
+        nonlocal handled
+        async with semaphore:
+            started = time.perf_counter()
+            result = await dp.feed_update(bot, update)
+            latencies.append(time.perf_counter() - started)
+            if result is not UNHANDLED:
+                handled += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(feed(update) for update in updates))
+    return summarize(latencies, time.perf_counter() - started, handled)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from benchmarks.fake_telegram_api import FakeTelegramAPI, serve
+
+    api = FakeTelegramAPI(latency=args.latency)
+    runner = await serve(api, port=args.port)
+
+    from sqlalchemy import text
+
+    from bot_config import bot, dp
+    from database import AsyncSessionFactory
+    from services import reminders_service
+    from setup import register_routers
+
+    register_routers()
+    last_user_id = FIRST_USER_ID + max(args.iterations, args.warmup) - 1
+    params = {"first": FIRST_USER_ID, "last": last_user_id, "chat_id": ADMIN_CHAT_ID}
+
+    # Прогон использует и удаляет только созданные им строки
+    async with AsyncSessionFactory() as session:
+        occupied = (await session.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM users WHERE user_id "
+                "BETWEEN :first AND :last) "
+                "OR EXISTS (SELECT 1 FROM outbox WHERE chat_id = :chat_id) "
+                "OR EXISTS (SELECT 1 FROM reminders WHERE chat_id = :chat_id)"
+            ),
+            params,
+        )).scalar_one()
+    if occupied:
+        await bot.session.close()
+        await runner.cleanup()
+        raise SystemExit("Синтетические user_id или чат администраторов заняты")
+
+    results: Dict[str, Any] = {}
+    try:
+        # "N минут" откладывает последнее напоминание чата администраторов
+        await reminders_service.save_reminder(
+            chat_id=ADMIN_CHAT_ID, message_id=1, type_="callback", username="bench"
+        )
+        for name in args.scenarios:
+            scenario = SCENARIOS[name]
+            await run_scenario(
+                dp, bot, scenario["build"], args.warmup, args.concurrency
+            )
+            summary = await run_scenario(
+                dp, bot, scenario["build"], args.iterations, args.concurrency
+            )
+            results[name] = {"handler": scenario["handler"], **summary}
+            print(
+                f"{name:18} {summary['updates_per_second']:9.1f} upd/s  "
+                f"p50 {summary['p50_ms']:7.2f} ms  "
+                f"p95 {summary['p95_ms']:7.2f} ms  "
+                f"p99 {summary['p99_ms']:7.2f} ms  "
+                f"handled {summary['handled']}/{summary['count']}"
+            )
+    finally:
+        # Отложенные напоминания не должны переживать бенчмарк
+        current = asyncio.current_task()
+        for task in asyncio.all_tasks():
+            if task is not current:
+                task.cancel()
+        async with AsyncSessionFactory() as session:
+            await session.execute(
+                text("DELETE FROM outbox WHERE chat_id = :chat_id"), params
+            )
+            await session.execute(
+                text("DELETE FROM reminders WHERE chat_id = :chat_id"), params
+            )
+            await session.execute(
+                text("DELETE FROM users WHERE user_id BETWEEN :first AND :last"),
+                params,
+            )
+            await session.commit()
+        await bot.session.close()
+        await runner.cleanup()
+
+    return {
+        "commit": current_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "iterations": args.iterations,
+            "concurrency": args.concurrency,
+            "api_latency": args.latency,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline_path: Path) -> None:
+    """
+    Печатает изменение показателей относительно сохранённого прогона.
+    """
+    baseline = json.loads(baseline_path.read_text())
+    print(f"\nСравнение с {baseline_path.name} ({baseline.get('commit')}):")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if not before:
+            continue
+        for key in ("updates_per_second", "p50_ms", "p99_ms"):
+            delta = (result[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            print(f"  {name:18} {key:20} {before[key]:9.2f} -> {result[key]:9.2f} ({delta:+.1f}%)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="задержка fake Bot API в секундах")
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS),
+                        choices=list(SCENARIOS))
+    parser.add_argument("--output", type=Path, default=None,
+                        help="файл результатов (по умолчанию results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None,
+                        help="файл результатов для сравнения")
+    args = parser.parse_args()
+
+    # Должно быть задано до импорта settings
+    os.environ["TELEGRAM_API_URL"] = f"http://127.0.0.1:{args.port}"
+    os.environ["ADMIN_CHAT_ID"] = str(ADMIN_CHAT_ID)
+
+    result = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / f"handlers-{result['commit'] or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"\nРезультаты сохранены в {output}")
+
+    if args.compare:
+        compare(result, args.compare)
+
+
+if __name__ == "__main__":
+    main()
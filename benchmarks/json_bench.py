@@ -0,0 +1,179 @@
+"""
+Микробенчмарк JSON-кодеков на данных бота.
+
+Для каждого доступного кодека (json, orjson, msgspec) измеряется время
+операций, выполняемых при обработке апдейта: разбор тела вебхука,
+сериализация запроса sendMessage и разбор ответа Bot API. Отдельно
+сравнивается разбор формы WebApp: json.loads со словарём против
+WebAppForm.model_validate_json.
+
+Запуск:
+    python -m benchmarks.json_bench --repeat 5
+"""
+import argparse
+import json
+import os
+import timeit
+from typing import Callable, Dict, List
+
+from benchmarks import synthetic
+
+# Операции одного апдейта WebApp-формы: тело вебхука, запрос и ответ
+# sendMessage в админ-группу
+UPDATE_OPERATIONS = ("decode_update", "encode_request", "decode_response")
+
+
+def sample_payloads() -> Dict[str, object]:
+    """
+    Типичные данные бота для бенчмарка.
+
+    Returns:
+        Dict[str, object]: Апдейт, запрос и ответ sendMessage, форма WebApp.
+    """
+    from keyboards import remind_kb
+
+    update = synthetic.web_app_update(100500)
+    request = {
+        "chat_id": -1001234567890,
+        "text": "🔔 Заказан ОБРАТНЫЙ ЗВОНОК от User100500\n"
+                "на номер телефона +70000000000\nудобное время звонка: 10:00",
+        "reply_markup": remind_kb,
+    }
+    response = {
+        "ok": True,
+        "result": synthetic.make_message(
+            -1001234567890,
+            user_id=123456,
+            text=request["text"],
+            reply_markup=remind_kb,
+        ),
+    }
+    return {
+        "update": update,
+        "request": request,
+        "response": response,
+        "form": update["message"]["web_app_data"]["data"],
+    }
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """
+    Лучшее время одного вызова в микросекундах.
+
+    Args:
+        func (Callable[[], object]): Измеряемая функция.
+        repeat (int): Количество серий.
+
+    Returns:
+        float: Время вызова, мкс.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def bench_codecs(repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Измеряет операции апдейта для всех установленных кодеков.
+
+    Args:
+        repeat (int): Количество серий.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Кодек -> операция -> мкс.
+    """
+    from bot_config.json_codec import CODECS
+
+    payloads = sample_payloads()
+    update_body = json.dumps(payloads["update"]).encode()
+    response_body = json.dumps(payloads["response"]).encode()
+    request = payloads["request"]
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, factory in CODECS.items():
+        try:
+            codec = factory()
+        except ImportError:
+            print(f"{name}: не установлен, пропущен")
+            continue
+        results[name] = {
+            "decode_update": measure(lambda: codec.loads(update_body), repeat),
+            "encode_request": measure(lambda: codec.dumps_bytes(request), repeat),
+            "decode_response": measure(lambda: codec.loads(response_body), repeat),
+        }
+        assert codec.loads(update_body) == payloads["update"]
+    return results
+
+
+def bench_form(repeat: int) -> Dict[str, float]:
+    """
+    Сравнивает разбор формы WebApp.
+
+    Args:
+        repeat (int): Количество серий.
+
+    Returns:
+        Dict[str, float]: Способ разбора -> мкс.
+    """
+    from handlers.private_handlers.web_app_data_handler import WebAppForm
+
+    raw = sample_payloads()["form"]
+
+    def stdlib_dict() -> tuple:
+        data = json.loads(raw)
+        return (
+            data.get("form", "unknown"),
+            data.get("name", "не указано"),
+            data.get("phone", "не указано"),
+            data.get("topic", "не указано"),
+            data.get("time", "не указано"),
+        )
+
+    return {
+        "json.loads + dict": measure(stdlib_dict, repeat),
+        "WebAppForm.model_validate_json": measure(
+            lambda: WebAppForm.model_validate_json(raw), repeat
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Импорт обработчиков требует настроек бота
+    os.environ.setdefault("BOT_TOKEN", "123456:bench")
+    os.environ.setdefault("ADMIN_CHAT_ID", "-1001234567890")
+
+    results = bench_codecs(args.repeat)
+    header = f"{'операция':<18}" + "".join(f"{name:>12}" for name in results)
+    print(header)
+    print("-" * len(header))
+    for operation in UPDATE_OPERATIONS:
+        print(
+            f"{operation:<18}"
+            + "".join(f"{codec[operation]:>10.2f}us" for codec in results.values())
+        )
+    totals: List[float] = [
+        sum(codec[operation] for operation in UPDATE_OPERATIONS)
+        for codec in results.values()
+    ]
+    print(f"{'на апдейт':<18}" + "".join(f"{total:>10.2f}us" for total in totals))
+
+    baseline = results["json"]
+    baseline_total = sum(baseline[operation] for operation in UPDATE_OPERATIONS)
+    for name, total in zip(results, totals):
+        if name != "json":
+            print(
+                f"{name}: экономия {baseline_total - total:.2f} мкс CPU на апдейт "
+                f"({baseline_total / total:.1f}x)"
+            )
+
+    print("\nРазбор формы WebApp:")
+    for name, value in bench_form(args.repeat).items():
+        print(f"  {name:<32}{value:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Проверка планов запросов к таблице reminders.
+
+Таблица заполняется синтетическими напоминаниями в транзакции, которая
+в конце откатывается, после чего настоящие методы ReminderRepository
+выполняются на том же соединении, а их SQL (с теми же параметрами)
+проверяется через EXPLAIN. Если запрос выполняется последовательным
+сканированием reminders или без ожидаемого индекса, скрипт завершается
+с кодом 1 — так регрессия индексов или запросов видна до выката.
+
+Нужна PostgreSQL из .env с применёнными миграциями.
+
+Запуск:
+    python -m benchmarks.query_plans --rows 50000 --chats 500
+"""
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Синтетические чаты не пересекаются с реальными группами
+FIRST_CHAT_ID = -4_000_000_000_000
+
+
+@dataclass
+class PlanCheck:
+    """
+    Проверяемый запрос репозитория.
+
+    Attributes:
+        name (str): Название проверки.
+        index (str): Индекс, который должен использоваться.
+        call (Callable): Вызов метода репозитория (аргумент — репозиторий).
+    """
+
+    name: str
+    index: str
+    call: Callable[[Any], Awaitable[Any]]
+
+
+def plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Обходит узлы плана EXPLAIN (FORMAT JSON).
+
+    Args:
+        plan (Dict[str, Any]): Корневой узел плана.
+
+    Returns:
+        Iterator[Dict[str, Any]]: Все узлы плана.
+    """
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def check_plan(plan: Dict[str, Any], index: str) -> List[str]:
+    """
+    Ищет в плане последовательное сканирование reminders и ожидаемый индекс.
+
+    Args:
+        plan (Dict[str, Any]): Корневой узел плана.
+        index (str): Ожидаемый индекс.
+
+    Returns:
+        List[str]: Найденные проблемы; пустой список — план в порядке.
+    """
+    nodes = list(plan_nodes(plan))
+    problems = [
+        f"{node['Node Type']} on reminders"
+        for node in nodes
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "reminders"
+    ]
+    if not any(node.get("Index Name") == index for node in nodes):
+        problems.append(f"index {index} not used")
+    return problems
+
+
+def checks(chats: int) -> List[PlanCheck]:
+    chat_id = FIRST_CHAT_ID + chats // 2
+    return [
+        PlanCheck(
+            "get_reminder",
+            "uq_reminders_chat_message",
+            lambda repo: repo.get_reminder(chat_id, 7),
+        ),
+        PlanCheck(
+            "get_last_reminder_by_chat",
+            "ix_reminders_chat_created",
+            lambda repo: repo.get_last_reminder_by_chat(chat_id),
+        ),
+        PlanCheck(
+            "get_scheduled",
+            "ix_reminders_due_at",
+            lambda repo: repo.get_scheduled(datetime.utcnow()),
+        ),
+    ]
+
+
+async def seed(session: AsyncSession, rows: int, chats: int) -> None:
+    # Запланирован примерно 1% напоминаний, как в работающем боте
+    await session.execute(
+        text(
+            """
+            INSERT INTO reminders (chat_id, message_id, type, username, created_at, due_at)
+            SELECT CAST(:first_chat AS BIGINT) + g % :chats, g / :chats, 'callback', 'bench',
+                   now() - g * interval '1 second',
+                   CASE WHEN g % 100 = 0 THEN now() + g * interval '1 second' END
+            FROM generate_series(1, :rows) g
+            """
+        ),
+        {"first_chat": FIRST_CHAT_ID, "chats": chats, "rows": rows},
+    )
+    await session.execute(text("ANALYZE reminders"))
+
+
+async def run(args: argparse.Namespace) -> bool:
+    from database.accessor import engine
+    from repository import ReminderRepository
+
+    engine.echo = False
+    statements: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    ok = True
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            session = AsyncSession(bind=connection)
+            await seed(session, args.rows, args.chats)
+            repo = ReminderRepository(db_session=session)
+            for check in checks(args.chats):
+                statements.clear()
+                event.listen(engine.sync_engine, "before_cursor_execute", record)
+                try:
+                    await check.call(repo)
+                finally:
+                    event.remove(engine.sync_engine, "before_cursor_execute", record)
+                statement, parameters = statements[0]
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                plan = _plan(result.scalar())
+                problems = check_plan(plan, check.index)
+                ok = ok and not problems
+                print(
+                    f"{check.name:28} {'OK' if not problems else 'FAIL':5} "
+                    f"{plan['Node Type']} (cost {plan['Total Cost']:.2f})"
+                    + (f": {'; '.join(problems)}" if problems else "")
+                )
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+    return ok
+
+
+def _plan(value: Any) -> Dict[str, Any]:
+    # asyncpg возвращает JSON строкой
+    if isinstance(value, str):
+        value = json.loads(value)
+    return value[0]["Plan"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--chats", type=int, default=500)
+    args = parser.parse_args()
+
+    if not asyncio.run(run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
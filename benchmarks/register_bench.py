@@ -0,0 +1,173 @@
+"""
+Бенчмарк регистрации пользователя при /start.
+
+Измеряется повторный /start уже зарегистрированного пользователя:
+
+- before — прежняя регистрация: INSERT ... ON CONFLICT DO NOTHING
+  RETURNING и, так как строка не вставлена, второй запрос SELECT;
+- upsert — UsersRepository.register_user: один запрос
+  (INSERT ... ON CONFLICT DO UPDATE с чтением неизменённой строки);
+- cached — UsersService.register_user: upsert за кэшем пользователей.
+
+Для каждого способа выводятся запросы к БД на регистрацию, p50/p95/p99
+задержки и регистрации в секунду. Пользователи создаются с
+отрицательными user_id (у пользователей Telegram таких нет); прогон
+использует и после себя удаляет только созданные им строки. Нужна
+PostgreSQL из .env с применёнными миграциями.
+
+Запуск:
+    python -m benchmarks.register_bench --iterations 500 --concurrency 10
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import event, select, text
+from sqlalchemy.dialects.postgresql import insert
+
+from benchmarks.handlers_bench import percentile
+
+# Отрицательные user_id не бывают у пользователей Telegram
+FIRST_USER_ID = -910_000_000
+
+
+async def before(user_id: int) -> None:
+    from database import AsyncSessionFactory
+    from models import Users
+
+    async with AsyncSessionFactory() as session:
+        query = insert(Users).values(
+            user_id=user_id, chat_id=user_id, username="bench",
+            first_name="Bench", last_name=None,
+        ).on_conflict_do_nothing().returning(Users)
+        user = (await session.execute(query)).scalar_one_or_none()
+        if user is None:
+            await session.execute(select(Users).where(Users.user_id == user_id))
+        await session.commit()
+
+
+async def upsert(user_id: int) -> None:
+    from database import AsyncSessionFactory
+    from repository import UsersRepository
+
+    async with AsyncSessionFactory() as session:
+        repo = UsersRepository(db_session=session)
+        await repo.register_user(user_id, user_id, "bench", "Bench", None)
+
+
+async def cached(user_id: int) -> None:
+    from services import users_service
+
+    await users_service.register_user(user_id, user_id, "bench", "Bench", None)
+
+
+SCENARIOS: Dict[str, Callable[[int], Awaitable[None]]] = {
+    "before": before,
+    "upsert": upsert,
+    "cached": cached,
+}
+
+
+async def run_scenario(
+        call: Callable[[int], Awaitable[None]],
+        iterations: int,
+        user_ids: List[int],
+        concurrency: int,
+) -> Dict[str, float]:
+    """
+    Выполняет iterations регистраций не более чем по concurrency
+    одновременно.
+
+    Returns:
+        Dict[str, float]: Перцентили задержки (мс) и регистрации в секунду.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call(user_ids[i % len(user_ids)])
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(iterations)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests_per_second": iterations / elapsed,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    from database import AsyncSessionFactory
+    from database.accessor import engine
+
+    engine.echo = False
+    counts = {"statements": 0}
+
+    def on_execute(*_: Any) -> None:
+        counts["statements"] += 1
+
+    # Прогон использует и удаляет только созданные им строки
+    async with AsyncSessionFactory() as session:
+        user_ids = list((await session.execute(
+            text(
+                "INSERT INTO users (user_id, chat_id, username, first_name, status) "
+                "SELECT g, g, 'bench', 'Bench', 'Guest' FROM generate_series("
+                "CAST(:first AS BIGINT), CAST(:last AS BIGINT)) g "
+                "ON CONFLICT DO NOTHING RETURNING user_id"
+            ),
+            {"first": FIRST_USER_ID, "last": FIRST_USER_ID + args.users - 1},
+        )).scalars())
+        await session.commit()
+    if not user_ids:
+        await engine.dispose()
+        raise SystemExit("Диапазон синтетических user_id занят")
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        for name in args.scenarios:
+            call = SCENARIOS[name]
+            await run_scenario(call, args.warmup, user_ids, args.concurrency)
+            counts.update(statements=0)
+            summary = await run_scenario(
+                call, args.iterations, user_ids, args.concurrency
+            )
+            print(
+                f"{name:7} {counts['statements'] / args.iterations:4.2f} запросов "
+                f"на регистрацию  "
+                f"{summary['requests_per_second']:8.1f} регистраций/с  "
+                f"p50 {summary['p50_ms']:6.2f} ms  "
+                f"p95 {summary['p95_ms']:6.2f} ms  "
+                f"p99 {summary['p99_ms']:6.2f} ms"
+            )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+        async with AsyncSessionFactory() as session:
+            await session.execute(
+                text("DELETE FROM users WHERE user_id = ANY(CAST(:ids AS BIGINT[]))"),
+                {"ids": user_ids},
+            )
+            await session.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS),
+                        choices=list(SCENARIOS))
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
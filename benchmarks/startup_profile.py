@@ -0,0 +1,168 @@
+"""
+Профиль времени старта: время импорта по модулям.
+
+Импорт точки входа выполняется в отдельном интерпретаторе с
+`-X importtime`, так что кэш модулей текущего процесса не влияет на
+результат. Отчёт показывает самые медленные модули (собственное и
+накопленное время) и суммарное время по пакетам верхнего уровня.
+
+Запуск:
+    python -m benchmarks.startup_profile --top 25
+    python -m benchmarks.startup_profile --module setup --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class ImportRecord:
+    """
+    Строка отчёта -X importtime.
+
+    Attributes:
+        module (str): Имя модуля.
+        self_us (int): Собственное время импорта, мкс.
+        cumulative_us (int): Время с учётом вложенных импортов, мкс.
+        depth (int): Глубина вложенности импорта.
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Разбирает stderr интерпретатора, запущенного с -X importtime.
+
+    Args:
+        output (str): Вывод интерпретатора.
+
+    Returns:
+        List[ImportRecord]: Записи по каждому импортированному модулю.
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        module = name[1:].rstrip()
+        depth = (len(module) - len(module.lstrip())) // 2
+        records.append(
+            ImportRecord(
+                module=module.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=depth,
+            )
+        )
+    return records
+
+
+def profile_once(module: str) -> List[ImportRecord]:
+    """
+    Импортирует модуль в новом интерпретаторе и возвращает профиль.
+
+    Args:
+        module (str): Импортируемый модуль (точка входа).
+
+    Returns:
+        List[ImportRecord]: Профиль импорта.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        tail = "\n".join(completed.stderr.splitlines()[-5:])
+        raise RuntimeError(f"Импорт {module} завершился ошибкой:\n{tail}")
+    return parse_importtime(completed.stderr)
+
+
+def wall_time(module: str) -> float:
+    """
+    Время запуска интерпретатора с импортом модуля, в секундах.
+
+    Args:
+        module (str): Импортируемый модуль.
+
+    Returns:
+        float: Длительность процесса.
+    """
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+    )
+    return time.perf_counter() - started
+
+
+def by_package(records: List[ImportRecord]) -> Dict[str, int]:
+    """
+    Суммирует собственное время импорта по пакетам верхнего уровня.
+
+    Args:
+        records (List[ImportRecord]): Профиль импорта.
+
+    Returns:
+        Dict[str, int]: Пакет -> время, мкс (по убыванию).
+    """
+    totals: Dict[str, int] = {}
+    for record in records:
+        package = record.module.split(".", 1)[0]
+        totals[package] = totals.get(package, 0) + record.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="main",
+                        help="точка входа для импорта")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=3,
+                        help="количество замеров полного времени старта")
+    args = parser.parse_args()
+
+    records = profile_once(args.module)
+    total_us = sum(record.self_us for record in records)
+
+    print(f"Импорт {args.module}: {len(records)} модулей, {total_us / 1000:.1f} ms\n")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  модуль")
+    slowest = sorted(records, key=lambda record: record.cumulative_us, reverse=True)
+    for record in slowest[:args.top]:
+        print(
+            f"{record.cumulative_us / 1000:>14.1f} {record.self_us / 1000:>9.1f}"
+            f"  {'  ' * record.depth}{record.module}"
+        )
+
+    print(f"\n{'self ms':>9}  пакет")
+    for package, self_us in list(by_package(records).items())[:args.top]:
+        print(f"{self_us / 1000:>9.1f}  {package}")
+
+    if args.runs:
+        timings = [wall_time(args.module) for _ in range(args.runs)]
+        print(
+            f"\nСтарт интерпретатора с импортом {args.module}: "
+            f"медиана {statistics.median(timings) * 1000:.0f} ms "
+            f"(min {min(timings) * 1000:.0f}, max {max(timings) * 1000:.0f}, "
+            f"runs={args.runs})"
+        )
+
+
+if __name__ == "__main__":
+    main()
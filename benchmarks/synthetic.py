@@ -0,0 +1,176 @@
+import itertools
+import json
+import random
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+# Счётчики общие для всех генераторов, чтобы update_id и message_id
+# не повторялись в рамках одного прогона
+_update_ids: Iterator[int] = itertools.count(1)
+_message_ids: Iterator[int] = itertools.count(1)
+
+REMIND_TEXTS = ["5 минут", "10 минут", "20 минут", "30 минут"]
+
+
+def make_user(user_id: int) -> Dict[str, Any]:
+    """
+    Создаёт пользователя Telegram.
+
+    Args:
+        user_id (int): Идентификатор пользователя.
+
+    Returns:
+        Dict[str, Any]: Объект User в формате Bot API.
+    """
+    return {
+        "id": user_id,
+        "is_bot": False,
+        "first_name": f"User{user_id}",
+        "username": f"user{user_id}",
+    }
+
+
+def make_chat(chat_id: int, chat_type: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Создаёт чат Telegram: по умолчанию отрицательный id — супергруппа,
+    иначе личный чат.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        chat_type (Optional[str]): Тип чата ('private' или 'supergroup').
+
+    Returns:
+        Dict[str, Any]: Объект Chat в формате Bot API.
+    """
+    if chat_type is None:
+        chat_type = "supergroup" if chat_id < 0 else "private"
+    if chat_type != "private":
+        return {"id": chat_id, "type": chat_type, "title": f"Group {chat_id}"}
+    return {"id": chat_id, "type": "private", "first_name": f"User{chat_id}"}
+
+
+def make_message(
+    chat_id: int,
+    user_id: Optional[int] = None,
+    text: Optional[str] = None,
+    chat_type: Optional[str] = None,
+    **extra: Any,
+) -> Dict[str, Any]:
+    """
+    Создаёт входящее сообщение.
+
+    Args:
+        chat_id (int): Идентификатор чата.
+        user_id (Optional[int]): Отправитель; по умолчанию равен chat_id
+            личного чата или модулю id группы.
+        text (Optional[str]): Текст сообщения.
+        chat_type (Optional[str]): Тип чата (см. make_chat).
+        **extra (Any): Дополнительные поля сообщения.
+
+    Returns:
+        Dict[str, Any]: Объект Message в формате Bot API.
+    """
+    chat = make_chat(chat_id, chat_type)
+    if user_id is None:
+        user_id = chat_id if chat["type"] == "private" else abs(chat_id)
+    message = {
+        "message_id": next(_message_ids),
+        "date": int(time.time()),
+        "chat": chat,
+        "from": make_user(user_id),
+        **extra,
+    }
+    if text is not None:
+        message["text"] = text
+    return message
+
+
+def make_update(**payload: Any) -> Dict[str, Any]:
+    """
+    Оборачивает событие в апдейт с уникальным update_id.
+
+    Args:
+        **payload (Any): Событие, например message=...
+
+    Returns:
+        Dict[str, Any]: Объект Update в формате Bot API.
+    """
+    return {"update_id": next(_update_ids), **payload}
+
+
+def start_update(user_id: int) -> Dict[str, Any]:
+    """
+    Команда /start в личном чате.
+    """
+    text = "/start"
+    return make_update(message=make_message(
+        user_id, text=text, chat_type="private",
+        entities=[{"type": "bot_command", "offset": 0, "length": len(text)}],
+    ))
+
+
+def web_app_update(user_id: int, form: str = "callback") -> Dict[str, Any]:
+    """
+    Отправка WebApp-формы (обратный звонок или описание проблемы).
+    """
+    data = {
+        "form": form,
+        "name": f"user{user_id}",
+        "phone": "+70000000000",
+        "topic": "замена котла",
+        "time": "10:00",
+    }
+    return make_update(message=make_message(
+        user_id, chat_type="private",
+        web_app_data={
+            "data": json.dumps(data, ensure_ascii=False),
+            "button_text": "📲 Заказать обратный звонок",
+        },
+    ))
+
+
+def remind_update(chat_id: int, user_id: int) -> Dict[str, Any]:
+    """
+    Ответ администратора "N минут" в групповом чате.
+    """
+    return make_update(message=make_message(
+        chat_id, user_id=user_id, text=random.choice(REMIND_TEXTS)
+    ))
+
+
+def text_update(chat_id: int, text: str) -> Dict[str, Any]:
+    """
+    Произвольное текстовое сообщение в личном чате (например, нажатие
+    reply-кнопки).
+    """
+    return make_update(message=make_message(chat_id, text=text, chat_type="private"))
+
+
+UPDATE_KINDS = {
+    "start": lambda chat_id: start_update(chat_id),
+    "web_app": lambda chat_id: web_app_update(chat_id),
+    "about": lambda chat_id: text_update(chat_id, "👨‍🔧 О нас"),
+    "prices": lambda chat_id: text_update(chat_id, "🧾 Стоимость"),
+    "remind": lambda chat_id: remind_update(-abs(chat_id), abs(chat_id)),
+}
+
+
+def generate_updates(
+    count: int, chats: int = 100, kinds: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Генерирует смесь апдейтов разных типов для набора чатов.
+
+    Args:
+        count (int): Количество апдейтов.
+        chats (int): Количество различных чатов.
+        kinds (Optional[List[str]]): Типы апдейтов из UPDATE_KINDS.
+
+    Returns:
+        List[Dict[str, Any]]: Апдейты в формате Bot API.
+    """
+    kinds = kinds or list(UPDATE_KINDS)
+    return [
+        UPDATE_KINDS[random.choice(kinds)](random.randint(1, chats) + 100000)
+        for _ in range(count)
+    ]
@@ -1,11 +1,15 @@
 """
 Пакет bot_config.
 
-Содержит конфигурацию Telegram-бота, включая создание экземпляров bot и client.
+Содержит конфигурацию Telegram-бота, включая создание экземпляров bot и client
+общего пула HTTP-соединений, ограничителя исходящих сообщений и JSON-кодека.
 """
 
+from bot_config.http_pool import HttpPool, http_pool
+from bot_config.json_codec import JsonCodec, json_codec
+from bot_config.rate_limiter import Priority, outbound_priority, rate_limiter
 from bot_config.telegram_client import TelegramRawClient, telegram_client, CompanyBot
 from bot_config.bot_instance import bot, dp
 
 
-__all__ = ["TelegramRawClient", "CompanyBot", "telegram_client", "bot", "dp"]
\ No newline at end of file
+__all__ = ["TelegramRawClient", "CompanyBot", "HttpPool", "JsonCodec", "telegram_client", "http_pool", "json_codec", "rate_limiter", "Priority", "outbound_priority", "bot", "dp"]
\ No newline at end of file
@@ -1,6 +1,20 @@
 from settings import settings
+from bot_config.http_pool import SharedAiohttpSession, http_pool
+from bot_config.json_codec import json_codec
 from bot_config.telegram_client import CompanyBot, telegram_client
 from aiogram import Dispatcher
+from aiogram.client.telegram import TelegramAPIServer
 
-bot = CompanyBot(token=settings.bot_token, telegram_client=telegram_client)
+bot = CompanyBot(
+    token=settings.bot_token,
+    telegram_client=telegram_client,
+    # Сессия aiogram и telegram_client используют общий пул соединений
+    session=SharedAiohttpSession(
+        pool=http_pool,
+        api=TelegramAPIServer.from_base(settings.TELEGRAM_API_URL),
+        timeout=settings.HTTP_REQUEST_TIMEOUT,
+        json_loads=json_codec.loads,
+        json_dumps=json_codec.dumps,
+    ),
+)
 dp = Dispatcher()
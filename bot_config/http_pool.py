@@ -0,0 +1,191 @@
+import ssl
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Optional
+
+import aiohttp
+import certifi
+from aiogram.client.session.aiohttp import AiohttpSession
+
+from monitoring.metrics import Sample, registry
+from settings import settings
+
+connections_created = registry.counter(
+    "http_pool_connections_created_total",
+    "Новые соединения пула HTTP (TCP + TLS handshake)",
+)
+connections_reused = registry.counter(
+    "http_pool_connections_reused_total",
+    "Запросы, выполненные по уже открытому соединению пула HTTP",
+)
+connection_wait = registry.histogram(
+    "http_pool_wait_seconds",
+    "Ожидание свободного соединения при исчерпании лимита пула",
+)
+
+
+class HttpPool:
+    """
+    Общий пул HTTP-соединений к Telegram Bot API.
+
+    Один aiohttp.ClientSession с настроенным TCPConnector используют и
+    сессия aiogram (SharedAiohttpSession), и TelegramRawClient, поэтому
+    запросы обоих клиентов переиспользуют одни и те же keep-alive
+    соединения с уже выполненным TLS handshake.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        limit_per_host: int,
+        keepalive_timeout: float,
+        dns_cache_ttl: int,
+        connect_timeout: float,
+        request_timeout: float,
+    ) -> None:
+        """
+        Инициализация пула.
+
+        Args:
+            limit (int): Максимальное число соединений.
+            limit_per_host (int): Максимальное число соединений с одним хостом.
+            keepalive_timeout (float): Время жизни простаивающего соединения, сек.
+            dns_cache_ttl (int): Время кэширования DNS, сек.
+            connect_timeout (float): Таймаут установки соединения, сек.
+            request_timeout (float): Таймаут запроса по умолчанию, сек.
+        """
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.dns_cache_ttl: int = dns_cache_ttl
+        self.timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(
+            total=request_timeout,
+            connect=connect_timeout,
+            sock_connect=connect_timeout,
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def closed(self) -> bool:
+        """
+        Returns:
+            bool: True, если сессия не создана или закрыта.
+        """
+        return self._session is None or self._session.closed
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Возвращает общую сессию, создавая её при первом обращении или
+        после закрытия.
+
+        Returns:
+            aiohttp.ClientSession: Сессия пула.
+        """
+        if self.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                ssl=ssl.create_default_context(cafile=certifi.where()),
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                trace_configs=[self._trace_config()],
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Закрывает сессию и все соединения пула.
+        """
+        if not self.closed:
+            await self._session.close()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Возвращает текущую загрузку пула.
+
+        Returns:
+            Dict[str, float]: Лимиты, число занятых и простаивающих
+            соединений и число запросов, ожидающих соединение.
+        """
+        result = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "in_use": 0,
+            "idle": 0,
+            "waiting": 0,
+        }
+        if self.closed:
+            return result
+        connector = self._session.connector
+        # Публичного API для загрузки пула у aiohttp нет
+        result["in_use"] = len(getattr(connector, "_acquired", ()))
+        result["idle"] = sum(
+            len(conns) for conns in getattr(connector, "_conns", {}).values()
+        )
+        result["waiting"] = sum(
+            len(waiters) for waiters in getattr(connector, "_waiters", {}).values()
+        )
+        return result
+
+    def collect(self) -> Iterable[Sample]:
+        """
+        Сэмплы загрузки пула для реестра метрик.
+        """
+        for name, value in self.stats().items():
+            yield f"http_pool_{name}", {}, value
+
+    @staticmethod
+    def _trace_config() -> aiohttp.TraceConfig:
+        async def on_queued_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+            context.queued_at = time.perf_counter()
+
+        async def on_queued_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+            connection_wait.observe(time.perf_counter() - context.queued_at)
+
+        async def on_create_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+            connections_created.inc()
+
+        async def on_reuse(session: Any, context: SimpleNamespace, params: Any) -> None:
+            connections_reused.inc()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_connection_create_end.append(on_create_end)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+
+class SharedAiohttpSession(AiohttpSession):
+    """
+    Сессия aiogram, выполняющая запросы через общий пул HttpPool.
+    """
+
+    def __init__(self, pool: HttpPool, **kwargs: Any) -> None:
+        """
+        Args:
+            pool (HttpPool): Общий пул соединений.
+            **kwargs (Any): Аргументы AiohttpSession (api, timeout и др.).
+        """
+        super().__init__(**kwargs)
+        self.pool: HttpPool = pool
+
+    async def create_session(self) -> aiohttp.ClientSession:
+        return await self.pool.get_session()
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+
+http_pool = HttpPool(
+    limit=settings.HTTP_POOL_LIMIT,
+    limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+    keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl=settings.HTTP_DNS_CACHE_TTL,
+    connect_timeout=settings.HTTP_CONNECT_TIMEOUT,
+    request_timeout=settings.HTTP_REQUEST_TIMEOUT,
+)
@@ -0,0 +1,124 @@
+import json
+from typing import Any, Callable, Tuple, Type, Union
+
+from settings import settings
+
+JsonInput = Union[str, bytes, bytearray]
+
+
+class JsonCodec:
+    """
+    JSON-кодек с единым интерфейсом для stdlib json, orjson и msgspec.
+
+    Attributes:
+        name (str): Имя библиотеки.
+        errors (Tuple[Type[Exception], ...]): Исключения при разборе
+            некорректного JSON.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        encode: Callable[[Any], bytes],
+        decode: Callable[[JsonInput], Any],
+        errors: Tuple[Type[Exception], ...] = (ValueError,),
+    ) -> None:
+        """
+        Args:
+            name (str): Имя библиотеки.
+            encode (Callable[[Any], bytes]): Сериализация в UTF-8 байты.
+            decode (Callable[[JsonInput], Any]): Разбор str или bytes.
+            errors (Tuple[Type[Exception], ...]): Исключения при разборе
+                некорректного JSON.
+        """
+        self.name: str = name
+        self.errors: Tuple[Type[Exception], ...] = errors
+        self._encode = encode
+        self._decode = decode
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """
+        Сериализует объект в UTF-8 байты (тело HTTP-запроса).
+        """
+        return self._encode(obj)
+
+    def dumps(self, obj: Any) -> str:
+        """
+        Сериализует объект в строку (интерфейс json_dumps aiogram).
+        """
+        return self._encode(obj).decode()
+
+    def loads(self, data: JsonInput) -> Any:
+        """
+        Разбирает JSON из строки или байтов.
+        """
+        return self._decode(data)
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec(
+        name="json",
+        encode=lambda obj: json.dumps(obj, ensure_ascii=False).encode(),
+        decode=json.loads,
+    )
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    return JsonCodec(name="orjson", encode=orjson.dumps, decode=orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    return JsonCodec(
+        name="msgspec",
+        encode=encoder.encode,
+        decode=decoder.decode,
+        errors=(msgspec.DecodeError, ValueError),
+    )
+
+
+CODECS = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def load_codec(preferred: str = "auto") -> JsonCodec:
+    """
+    Выбирает JSON-кодек.
+
+    orjson и msgspec — необязательные зависимости: в режиме "auto"
+    используется первая установленная из них, иначе stdlib json.
+
+    Args:
+        preferred (str): "auto", "orjson", "msgspec" или "json".
+
+    Returns:
+        JsonCodec: Кодек.
+
+    Raises:
+        ValueError: Неизвестное имя кодека.
+        ImportError: Явно выбранная библиотека не установлена.
+    """
+    if preferred != "auto":
+        if preferred not in CODECS:
+            raise ValueError(f"Unknown JSON codec: {preferred}")
+        return CODECS[preferred]()
+    for name in ("orjson", "msgspec"):
+        try:
+            return CODECS[name]()
+        except ImportError:
+            continue
+    return _stdlib_codec()
+
+
+json_codec: JsonCodec = load_codec(settings.JSON_CODEC)
@@ -0,0 +1,358 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from monitoring.metrics import Sample, registry
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+ChatId = Union[int, str]
+
+# Методы Bot API, отправляющие сообщения в чат: на них действуют лимиты
+# Telegram (около 30 сообщений/сек всего, 20 сообщений/мин в группу)
+RATE_LIMITED_METHODS = frozenset({
+    "sendMessage",
+    "sendPhoto",
+    "sendVideo",
+    "sendAudio",
+    "sendDocument",
+    "sendVoice",
+    "sendVideoNote",
+    "sendAnimation",
+    "sendSticker",
+    "sendLocation",
+    "sendVenue",
+    "sendContact",
+    "sendPoll",
+    "sendDice",
+    "sendMediaGroup",
+    "copyMessage",
+    "copyMessages",
+    "forwardMessage",
+    "forwardMessages",
+})
+
+limiter_wait = registry.histogram(
+    "rate_limiter_wait_seconds",
+    "Ожидание разрешения на отправку в ограничителе исходящих запросов",
+    ("priority",),
+)
+limiter_retry_after = registry.counter(
+    "rate_limiter_retry_after_total",
+    "Ответы Telegram 429 (retry_after), полученные при отправке",
+    ("client",),
+)
+
+
+class Priority(IntEnum):
+    """
+    Приоритет исходящего сообщения: меньшее значение отправляется раньше.
+    """
+
+    HIGH = 0  # заявки клиентов в админ-группу
+    NORMAL = 1  # ответы пользователям
+    LOW = 2  # выгрузки, рассылки
+
+
+# Приоритет отправок в текущем контексте (см. outbound_priority)
+current_priority: ContextVar[Priority] = ContextVar(
+    "current_priority", default=Priority.NORMAL
+)
+
+
+@contextmanager
+def outbound_priority(priority: Priority) -> Iterator[None]:
+    """
+    Задаёт приоритет отправок внутри блока with.
+
+    Args:
+        priority (Priority): Приоритет.
+    """
+    token = current_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+class TokenBucket:
+    """
+    Token bucket: не более capacity отправок подряд, далее rate в секунду.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Args:
+            rate (float): Скорость пополнения, токенов в секунду.
+            capacity (float): Ёмкость (допустимый всплеск).
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.tokens: float = capacity
+        self.updated_at: float = time.monotonic()
+        self.paused_until: float = 0.0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def delay(self, now: float, cost: float = 1.0) -> float:
+        """
+        Возвращает время до возможности списать cost токенов.
+
+        Args:
+            now (float): Текущее время (monotonic).
+            cost (float): Количество токенов.
+
+        Returns:
+            float: Задержка в секундах; 0 — можно отправлять.
+        """
+        self._refill(now)
+        if now < self.paused_until:
+            return self.paused_until - now
+        cost = min(cost, self.capacity)
+        if self.tokens >= cost:
+            return 0.0
+        return (cost - self.tokens) / self.rate
+
+    def consume(self, cost: float = 1.0) -> None:
+        self.tokens -= min(cost, self.capacity)
+
+    def pause(self, now: float, seconds: float) -> None:
+        """
+        Запрещает отправку на seconds секунд (retry_after от Telegram).
+        """
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+
+    def is_idle(self, now: float) -> bool:
+        """
+        Returns:
+            bool: True, если ведро полное и его можно удалить.
+        """
+        self._refill(now)
+        return self.tokens >= self.capacity and now >= self.paused_until
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    chat_id: Optional[ChatId] = field(compare=False)
+    cost: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False, default_factory=time.monotonic)
+
+
+class OutboundRateLimiter:
+    """
+    Ограничитель исходящих сообщений в Telegram.
+
+    Разрешение на отправку выдаётся, когда есть токены в общем ведре и в
+    ведре чата (у групп и личных чатов разные лимиты). Ожидающие
+    отправки обслуживаются в порядке приоритета, а внутри приоритета — в
+    порядке поступления; отправка в чат, исчерпавший лимит, не задерживает
+    отправки в другие чаты. Ответ 429 приостанавливает отправку в чат на
+    retry_after секунд.
+    """
+
+    def __init__(
+        self,
+        global_rate: float,
+        private_rate: float,
+        private_burst: float,
+        group_per_minute: float,
+        max_buckets: int = 10000,
+    ) -> None:
+        """
+        Инициализация ограничителя.
+
+        Args:
+            global_rate (float): Общий лимит, сообщений в секунду.
+            private_rate (float): Лимит личного чата, сообщений в секунду.
+            private_burst (float): Допустимый всплеск в личном чате.
+            group_per_minute (float): Лимит группы, сообщений в минуту.
+            max_buckets (int): Число ведер чатов, после которого
+                неактивные ведра удаляются.
+        """
+        self.global_bucket: TokenBucket = TokenBucket(global_rate, global_rate)
+        self.private_rate: float = private_rate
+        self.private_burst: float = private_burst
+        self.group_rate: float = group_per_minute / 60
+        self.group_burst: float = group_per_minute
+        self.max_buckets: int = max_buckets
+        self._buckets: Dict[ChatId, TokenBucket] = {}
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def acquire(
+        self,
+        chat_id: Optional[ChatId],
+        priority: Optional[Priority] = None,
+        cost: float = 1.0,
+    ) -> None:
+        """
+        Ждёт разрешения на отправку в чат.
+
+        Args:
+            chat_id (Optional[ChatId]): Чат получателя; None — учитывается
+                только общий лимит.
+            priority (Optional[Priority]): Приоритет; по умолчанию берётся
+                из контекста (outbound_priority).
+            cost (float): Количество сообщений (например, размер альбома).
+        """
+        if priority is None:
+            priority = current_priority.get()
+        self._ensure_running()
+        waiter = _Waiter(
+            priority=priority,
+            seq=next(self._seq),
+            chat_id=chat_id,
+            cost=cost,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._waiters, waiter)
+        self._wakeup.set()
+        await waiter.future
+        limiter_wait.observe(
+            time.monotonic() - waiter.enqueued_at, priority=priority.name.lower()
+        )
+
+    def pause(self, chat_id: Optional[ChatId], retry_after: float) -> None:
+        """
+        Приостанавливает отправку после ответа 429.
+
+        Args:
+            chat_id (Optional[ChatId]): Чат; None — все отправки.
+            retry_after (float): Пауза в секундах из ответа Telegram.
+        """
+        now = time.monotonic()
+        bucket = self.global_bucket if chat_id is None else self._bucket(chat_id)
+        bucket.pause(now, retry_after)
+        logger.warning(f"Telegram 429: пауза {retry_after} с для чата {chat_id}")
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: Число ожидающих отправок по приоритетам и
+            число отслеживаемых чатов.
+        """
+        result = {
+            f"waiting_{priority.name.lower()}": 0 for priority in Priority
+        }
+        for waiter in self._waiters:
+            result[f"waiting_{Priority(waiter.priority).name.lower()}"] += 1
+        result["tracked_chats"] = len(self._buckets)
+        return result
+
+    def collect(self) -> Iterable[Sample]:
+        """
+        Сэмплы состояния ограничителя для реестра метрик.
+        """
+        for name, value in self.stats().items():
+            yield f"rate_limiter_{name}", {}, value
+
+    async def close(self) -> None:
+        """
+        Останавливает выдачу разрешений; ожидающие отправки отменяются.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for waiter in self._waiters:
+            waiter.future.cancel()
+        self._waiters = []
+
+    def _bucket(self, chat_id: ChatId) -> TokenBucket:
+        bucket = self._buckets.get(chat_id)
+        if bucket is None:
+            if len(self._buckets) >= self.max_buckets:
+                self._prune()
+            # Отрицательный id — группа или канал, строка — @username канала
+            if isinstance(chat_id, str) or chat_id < 0:
+                bucket = TokenBucket(self.group_rate, self.group_burst)
+            else:
+                bucket = TokenBucket(self.private_rate, self.private_burst)
+            self._buckets[chat_id] = bucket
+        return bucket
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        for chat_id in [
+            chat_id for chat_id, bucket in self._buckets.items()
+            if bucket.is_idle(now)
+        ]:
+            del self._buckets[chat_id]
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(
+                self._run(), name="outbound-rate-limiter"
+            )
+
+    def _grant(self, now: float) -> Optional[float]:
+        """
+        Выдаёт разрешения всем ожидающим, кому это возможно сейчас.
+
+        Returns:
+            Optional[float]: Время до следующей возможной выдачи или None,
+            если ожидающих нет.
+        """
+        delays: List[float] = []
+        remaining: List[_Waiter] = []
+        waiters = [w for w in sorted(self._waiters) if not w.future.done()]
+        for index, waiter in enumerate(waiters):
+            global_delay = self.global_bucket.delay(now, waiter.cost)
+            if global_delay > 0:
+                # Общий лимит исчерпан: остальные ждут в прежнем порядке
+                remaining.extend(waiters[index:])
+                delays.append(global_delay)
+                break
+            if waiter.chat_id is not None:
+                bucket = self._bucket(waiter.chat_id)
+                chat_delay = bucket.delay(now, waiter.cost)
+                if chat_delay > 0:
+                    remaining.append(waiter)
+                    delays.append(chat_delay)
+                    continue
+                bucket.consume(waiter.cost)
+            self.global_bucket.consume(waiter.cost)
+            waiter.future.set_result(None)
+        heapq.heapify(remaining)
+        self._waiters = remaining
+        return min(delays) if delays else None
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            delay = self._grant(time.monotonic())
+            if delay is None:
+                await self._wakeup.wait()
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+
+rate_limiter = OutboundRateLimiter(
+    # Общий лимит бота делится между процессами-шардами
+    global_rate=settings.RATE_LIMIT_GLOBAL_PER_SECOND / max(settings.SHARDS, 1),
+    private_rate=settings.RATE_LIMIT_PRIVATE_PER_SECOND,
+    private_burst=settings.RATE_LIMIT_PRIVATE_BURST,
+    group_per_minute=settings.RATE_LIMIT_GROUP_PER_MINUTE,
+)
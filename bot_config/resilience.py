@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import random
+import time
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional
+
+import aiohttp
+
+from monitoring.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+telegram_retries = registry.counter(
+    "telegram_retries_total",
+    "Повторы запросов к Telegram API",
+    ("client", "method", "reason"),
+)
+circuit_state = registry.gauge(
+    "telegram_circuit_state",
+    "Состояние circuit breaker Telegram API: 0 — закрыт, 1 — полуоткрыт, 2 — открыт",
+    ("client",),
+)
+circuit_rejections = registry.counter(
+    "telegram_circuit_rejections_total",
+    "Запросы, отклонённые открытым circuit breaker",
+    ("client", "method"),
+)
+
+
+class ErrorKind(str, Enum):
+    """
+    Класс результата запроса к Telegram API.
+    """
+
+    OK = "ok"
+    RETRYABLE = "retryable"  # сетевая ошибка, таймаут, 5xx
+    RATE_LIMITED = "rate_limited"  # 429 с retry_after
+    FATAL = "fatal"  # 4xx: повтор не поможет
+
+
+def classify_response(status: int, response: Mapping[str, Any]) -> ErrorKind:
+    """
+    Классифицирует ответ Telegram API.
+
+    Args:
+        status (int): HTTP-статус.
+        response (Mapping[str, Any]): Тело ответа.
+
+    Returns:
+        ErrorKind: Класс результата.
+    """
+    if response.get("ok"):
+        return ErrorKind.OK
+    code = response.get("error_code") or status
+    if code == 429:
+        return ErrorKind.RATE_LIMITED
+    if code >= 500:
+        return ErrorKind.RETRYABLE
+    return ErrorKind.FATAL
+
+
+def classify_exception(error: BaseException) -> ErrorKind:
+    """
+    Классифицирует исключение, возникшее при запросе.
+
+    Сетевая ошибка и таймаут — отказ транспорта (RETRYABLE) для любого
+    метода: circuit breaker учитывает их всегда. Можно ли при этом
+    повторить запрос, решает is_retry_safe.
+
+    Args:
+        error (BaseException): Исключение.
+
+    Returns:
+        ErrorKind: Класс результата.
+    """
+    if isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError)):
+        return ErrorKind.RETRYABLE
+    return ErrorKind.FATAL
+
+
+def is_retry_safe(error: BaseException, idempotent: bool) -> bool:
+    """
+    Проверяет, можно ли повторить запрос после исключения.
+
+    Ошибка установки соединения безопасна для повтора всегда: запрос не
+    был отправлен. Таймаут или разрыв соединения после отправки
+    повторяются только для идемпотентных методов, иначе сообщение может
+    быть отправлено дважды.
+
+    Args:
+        error (BaseException): Исключение.
+        idempotent (bool): Можно ли безопасно повторить метод.
+
+    Returns:
+        bool: True, если повтор безопасен.
+    """
+    return idempotent or isinstance(error, aiohttp.ClientConnectorError)
+
+
+class Backoff:
+    """
+    Экспоненциальная задержка между повторами со случайным разбросом
+    (full jitter): одновременные повторы многих корутин не приходят к
+    API одной волной.
+    """
+
+    def __init__(self, base: float, maximum: float) -> None:
+        """
+        Args:
+            base (float): Задержка перед первым повтором, сек.
+            maximum (float): Максимальная задержка, сек.
+        """
+        self.base: float = base
+        self.maximum: float = maximum
+
+    def delay(self, attempt: int) -> float:
+        """
+        Args:
+            attempt (int): Номер повтора, начиная с 0.
+
+        Returns:
+            float: Задержка в секундах.
+        """
+        return random.uniform(0, min(self.maximum, self.base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker для Telegram API.
+
+    После failure_threshold ошибок подряд breaker открывается, и запросы
+    отклоняются сразу, не занимая корутины ожиданием таймаутов. Через
+    reset_timeout breaker пропускает один пробный запрос: успех закрывает
+    его, ошибка открывает снова.
+    """
+
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+    def __init__(
+        self, name: str, failure_threshold: int, reset_timeout: float
+    ) -> None:
+        """
+        Args:
+            name (str): Имя клиента для метрик и логов.
+            failure_threshold (int): Число ошибок подряд до открытия.
+            reset_timeout (float): Время до пробного запроса, сек.
+        """
+        self.name: str = name
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self._state: int = self.CLOSED
+        self._probe_in_flight: bool = False
+        circuit_state.set(self.CLOSED, client=name)
+
+    @property
+    def state(self) -> int:
+        if self._state == self.OPEN and (
+            time.monotonic() - self.opened_at >= self.reset_timeout
+        ):
+            self._set_state(self.HALF_OPEN)
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Returns:
+            bool: True, если запрос можно выполнять.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """
+        Освобождает пробный запрос, прерванный до получения результата
+        (например, отменой корутины), чтобы его мог выполнить следующий.
+        """
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probe_in_flight = False
+        if self._state != self.CLOSED:
+            logger.info(f"Circuit breaker {self.name} закрыт")
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_in_flight = False
+        if self._state == self.HALF_OPEN or (
+            self._state == self.CLOSED and self.failures >= self.failure_threshold
+        ):
+            logger.warning(
+                f"Circuit breaker {self.name} открыт на "
+                f"{self.reset_timeout} с после {self.failures} ошибок подряд"
+            )
+            self.opened_at = time.monotonic()
+            self._set_state(self.OPEN)
+
+    def _set_state(self, state: int) -> None:
+        self._state = state
+        circuit_state.set(state, client=self.name)
+
+
+class MethodTimeouts:
+    """
+    Таймауты запросов по методам Bot API.
+
+    Загрузка файлов получает больше времени, getUpdates — время long
+    polling с запасом, остальные методы — короткий таймаут по умолчанию.
+    """
+
+    UPLOAD_METHODS = frozenset({
+        "sendPhoto",
+        "sendVideo",
+        "sendAudio",
+        "sendDocument",
+        "sendVoice",
+        "sendVideoNote",
+        "sendAnimation",
+        "sendMediaGroup",
+    })
+
+    def __init__(
+        self,
+        default: float,
+        upload: float,
+        overrides: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Args:
+            default (float): Таймаут по умолчанию, сек.
+            upload (float): Таймаут методов загрузки файлов, сек.
+            overrides (Optional[Dict[str, float]]): Таймауты отдельных методов.
+        """
+        self.default: float = default
+        self.upload: float = upload
+        self.overrides: Dict[str, float] = overrides or {}
+
+    def for_method(self, method: str, payload: Mapping[str, Any]) -> float:
+        """
+        Args:
+            method (str): Метод Bot API.
+            payload (Mapping[str, Any]): Параметры запроса.
+
+        Returns:
+            float: Таймаут запроса в секундах.
+        """
+        if method in self.overrides:
+            return self.overrides[method]
+        if method == "getUpdates":
+            return (payload.get("timeout") or 0) + self.default
+        if method in self.UPLOAD_METHODS:
+            return self.upload
+        return self.default
@@ -1,10 +1,38 @@
+import asyncio
+import logging
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
 from aiogram import Bot
+from bot_config.http_pool import HttpPool, http_pool
+from bot_config.json_codec import JsonCodec, json_codec
+from bot_config.rate_limiter import (
+    RATE_LIMITED_METHODS,
+    OutboundRateLimiter,
+    limiter_retry_after,
+    rate_limiter,
+)
+from bot_config.resilience import (
+    Backoff,
+    CircuitBreaker,
+    ErrorKind,
+    MethodTimeouts,
+    circuit_rejections,
+    classify_exception,
+    classify_response,
+    is_retry_safe,
+    telegram_retries,
+)
+from monitoring.timings import (
+    observe_telegram_request,
+    telegram_request_errors,
+)
 from settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class TelegramRawClient:
     """
@@ -14,10 +42,28 @@ class TelegramRawClient:
         token (str): Токен бота Telegram.
         base_url (str): Базовый URL API Telegram.
         session (Optional[aiohttp.ClientSession]): HTTP-сессия для запросов.
+        pool (Optional[HttpPool]): Общий пул соединений; если задан,
+            запросы выполняются через него.
+        rate_limiter (Optional[OutboundRateLimiter]): Ограничитель
+            отправки сообщений.
+        breaker (Optional[CircuitBreaker]): Circuit breaker запросов.
+        timeouts (Optional[MethodTimeouts]): Таймауты по методам.
+        backoff (Backoff): Задержки между повторами.
+        max_retries (int): Число повторов при сетевых ошибках и 5xx.
+        codec (JsonCodec): JSON-кодек запросов и ответов.
     """
 
     def __init__(
-        self, token: str, base_url: str = "https://api.telegram.org"
+        self,
+        token: str,
+        base_url: str = "https://api.telegram.org",
+        pool: Optional[HttpPool] = None,
+        rate_limiter: Optional[OutboundRateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        timeouts: Optional[MethodTimeouts] = None,
+        backoff: Optional[Backoff] = None,
+        max_retries: int = 0,
+        codec: Optional[JsonCodec] = None,
     ) -> None:
         """
         Инициализация TelegramRawClient.
@@ -26,10 +72,30 @@ class TelegramRawClient:
             token (str): Токен бота Telegram.
             base_url (str, optional): Базовый URL API. По умолчанию
                 "https://api.telegram.org".
+            pool (Optional[HttpPool]): Общий пул соединений. Если None,
+                клиент создаёт собственную сессию.
+            rate_limiter (Optional[OutboundRateLimiter]): Ограничитель
+                отправки сообщений. Если None, запросы не ограничиваются.
+            breaker (Optional[CircuitBreaker]): Circuit breaker. Если None,
+                запросы выполняются всегда.
+            timeouts (Optional[MethodTimeouts]): Таймауты по методам. Если
+                None, используется таймаут сессии.
+            backoff (Optional[Backoff]): Задержки между повторами. По
+                умолчанию от 0.5 до 10 секунд.
+            max_retries (int): Число повторов при сетевых ошибках и 5xx.
+            codec (Optional[JsonCodec]): JSON-кодек. По умолчанию
+                выбранный в settings.JSON_CODEC.
         """
         self.token: str = token
         self.base_url: str = base_url.rstrip("/")
         self.session: Optional[aiohttp.ClientSession] = None
+        self.pool: Optional[HttpPool] = pool
+        self.rate_limiter: Optional[OutboundRateLimiter] = rate_limiter
+        self.breaker: Optional[CircuitBreaker] = breaker
+        self.timeouts: Optional[MethodTimeouts] = timeouts
+        self.backoff: Backoff = backoff or Backoff(base=0.5, maximum=10.0)
+        self.max_retries: int = max_retries
+        self.codec: JsonCodec = codec or json_codec
 
     async def ensure_session(self) -> aiohttp.ClientSession:
         """
@@ -38,6 +104,8 @@ class TelegramRawClient:
         Returns:
             aiohttp.ClientSession: Активная сессия для запросов.
         """
+        if self.pool is not None:
+            return await self.pool.get_session()
         if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession()
         return self.session
@@ -61,24 +129,138 @@ class TelegramRawClient:
         """
         Выполняет POST-запрос к Telegram API.
 
+        Сетевые ошибки и ответы 5xx повторяются с экспоненциальной
+        задержкой (не более max_retries раз), ответ 429 — после паузы
+        retry_after (не более settings.RATE_LIMIT_MAX_RETRIES раз).
+        Таймаут отправки сообщения не повторяется (сообщение могло уйти),
+        но, как и любая сетевая ошибка, учитывается circuit breaker.
+        Отправки сообщений проходят через ограничитель исходящих запросов.
+        При открытом circuit breaker запрос не выполняется.
+
         Args:
             method (str): Метод API Telegram.
             **payload (Any): JSON-данные для запроса.
 
         Returns:
-            Dict[str, Any]: Ответ от Telegram API. В случае ошибки
-            {"ok": False, "error": str}.
+            Dict[str, Any]: Ответ от Telegram API. В случае ошибки без
+            ответа API {"ok": False, "error": str}; вызывающий код должен
+            проверять поле "ok".
         """
+        limited = (
+            self.rate_limiter is not None and method in RATE_LIMITED_METHODS
+        )
+        chat_id = payload.get("chat_id")
+        media = payload.get("media")
+        cost = len(media) if isinstance(media, list) else 1
+        timeout = (
+            self.timeouts.for_method(method, payload)
+            if self.timeouts is not None else None
+        )
+
+        retries = rate_limit_retries = 0
+        while True:
+            if self.breaker is not None and not self.breaker.allow():
+                circuit_rejections.inc(client="raw", method=method)
+                return {"ok": False, "error": "Telegram API circuit breaker is open"}
+            try:
+                if limited:
+                    await self.rate_limiter.acquire(chat_id, cost=cost)
+                response, kind, retry_safe = await self._request(
+                    method, payload, timeout
+                )
+            except BaseException:
+                # Отмена не говорит о доступности API: пробный запрос
+                # полуоткрытого breaker освобождается без результата
+                if self.breaker is not None:
+                    self.breaker.release()
+                raise
+            if self.breaker is not None:
+                # 4xx и 429 — API доступен, ошибка в самом запросе
+                if kind == ErrorKind.RETRYABLE:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
+
+            if kind == ErrorKind.RATE_LIMITED:
+                retry_after = (response.get("parameters") or {}).get("retry_after")
+                if retry_after is None or rate_limit_retries >= settings.RATE_LIMIT_MAX_RETRIES:
+                    return response
+                rate_limit_retries += 1
+                limiter_retry_after.inc(client="raw")
+                if limited:
+                    self.rate_limiter.pause(chat_id, retry_after)
+                else:
+                    await asyncio.sleep(retry_after)
+            elif (
+                kind == ErrorKind.RETRYABLE
+                and retry_safe
+                and retries < self.max_retries
+            ):
+                delay = self.backoff.delay(retries)
+                retries += 1
+                telegram_retries.inc(client="raw", method=method, reason=kind.value)
+                logger.warning(
+                    f"Telegram API {method}: повтор {retries}/{self.max_retries} "
+                    f"через {delay:.2f} с: {response}"
+                )
+                await asyncio.sleep(delay)
+            else:
+                return response
+
+    async def _request(
+        self, method: str, payload: Dict[str, Any], timeout: Optional[float]
+    ) -> Tuple[Dict[str, Any], ErrorKind, bool]:
         url = await self.prepare_url(method)
         session = await self.ensure_session()
+        request_timeout = (
+            aiohttp.ClientTimeout(
+                total=timeout,
+                connect=session.timeout.connect,
+                sock_connect=session.timeout.sock_connect,
+            )
+            if timeout is not None else None
+        )
+        started = time.perf_counter()
         try:
-            async with session.post(url, json=payload) as resp:
-                return await resp.json()
+            async with session.post(
+                url,
+                data=self.codec.dumps_bytes(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=request_timeout or session.timeout,
+            ) as resp:
+                body = await resp.read()
+                try:
+                    response = self.codec.loads(body)
+                except self.codec.errors:
+                    # Например, HTML-страница ошибки прокси
+                    response = {
+                        "ok": False,
+                        "error_code": resp.status,
+                        "description": body[:200].decode(errors="replace"),
+                    }
+            kind = classify_response(resp.status, response)
+            if kind != ErrorKind.OK:
+                telegram_request_errors.inc(
+                    client="raw", method=method, error=f"http_{resp.status}"
+                )
+            return response, kind, True
         except Exception as e:
-            print(
-                f"Error calling Telegram API: {e}"
+            telegram_request_errors.inc(
+                client="raw", method=method, error=type(e).__name__
+            )
+            logger.error(f"Error calling Telegram API {method}: {e!r}")
+            retry_safe = is_retry_safe(
+                e, idempotent=method not in RATE_LIMITED_METHODS
+            )
+            return (
+                {"ok": False, "error": str(e) or type(e).__name__},
+                classify_exception(e),
+                retry_safe,
+            )
+        finally:
+            observe_telegram_request(
+                "raw", method, time.perf_counter() - started
             )
-            return {"ok": False, "error": str(e)}
 
     def create_err_message(self, err: Exception) -> str:
         """
@@ -94,8 +276,10 @@ class TelegramRawClient:
 
     async def close(self) -> None:
         """
-        Закрывает HTTP-сессию.
+        Закрывает HTTP-сессию (при общем пуле — сам пул).
         """
+        if self.pool is not None:
+            await self.pool.close()
         if self.session and not self.session.closed:
             await self.session.close()
 
@@ -141,12 +325,32 @@ class CompanyBot(Bot):
 
     async def close(self) -> None:
         """
-        Закрывает бота и raw-клиент.
+        Закрывает HTTP-сессии бота и raw-клиента.
+
+        Переопределяет метод Bot API close (выход бота с сервера Telegram),
+        который здесь не нужен.
         """
-        await super().close()
+        await self.session.close()
         await self.raw_client.close()
 
 
 telegram_client: TelegramRawClient = TelegramRawClient(
-    token=settings.bot_token
+    token=settings.bot_token,
+    base_url=settings.TELEGRAM_API_URL,
+    pool=http_pool,
+    rate_limiter=rate_limiter,
+    breaker=CircuitBreaker(
+        name="raw",
+        failure_threshold=settings.TELEGRAM_BREAKER_FAILURES,
+        reset_timeout=settings.TELEGRAM_BREAKER_RESET_TIMEOUT,
+    ),
+    timeouts=MethodTimeouts(
+        default=settings.TELEGRAM_TIMEOUT,
+        upload=settings.TELEGRAM_UPLOAD_TIMEOUT,
+    ),
+    backoff=Backoff(
+        base=settings.TELEGRAM_BACKOFF_BASE,
+        maximum=settings.TELEGRAM_BACKOFF_MAX,
+    ),
+    max_retries=settings.TELEGRAM_MAX_RETRIES,
 )
@@ -6,6 +6,6 @@
 """
 
 
-from database.accessor import AsyncSessionFactory, sync_engine
+from database.accessor import AsyncSessionFactory, dispose_engines, get_sync_engine
 
-__all__ = ["AsyncSessionFactory", "sync_engine"]
\ No newline at end of file
+__all__ = ["AsyncSessionFactory", "dispose_engines", "get_sync_engine"]
\ No newline at end of file
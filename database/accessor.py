@@ -1,10 +1,25 @@
+from functools import lru_cache
+
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
 from settings import settings
 
-# Синхронный движок SQLAlchemy
-sync_engine: create_engine = create_engine(settings.sync_db_url)
+
+@lru_cache(maxsize=None)
+def get_sync_engine() -> Engine:
+    """
+    Возвращает синхронный движок SQLAlchemy (psycopg2), создавая его при
+    первом обращении.
+
+    Движок нужен только для экспорта в Excel, поэтому не создаётся при
+    импорте модуля.
+
+    Returns:
+        Engine: Синхронный движок SQLAlchemy.
+    """
+    return create_engine(settings.sync_db_url)
 
 # Асинхронный движок SQLAlchemy
 engine = create_async_engine(
@@ -21,3 +36,13 @@ AsyncSessionFactory: sessionmaker = sessionmaker(
     expire_on_commit=False,
     autoflush=False,
 )
+
+
+async def dispose_engines() -> None:
+    """
+    Закрывает пулы соединений асинхронного и (если создан) синхронного
+    движков.
+    """
+    await engine.dispose()
+    if get_sync_engine.cache_info().currsize:
+        get_sync_engine().dispose()
@@ -5,6 +5,6 @@
 """
 
 
-from filters.filters import ChatTypeFilter, ChatAdminFilter
+from filters.filters import ChatTypeFilter, ChatAdminFilter, GroupIntent, GroupIntentFilter, classify_group_message
 
-__all__ = ["ChatTypeFilter", "ChatAdminFilter"]
\ No newline at end of file
+__all__ = ["ChatTypeFilter", "ChatAdminFilter", "GroupIntent", "GroupIntentFilter", "classify_group_message"]
\ No newline at end of file
@@ -1,7 +1,15 @@
-from typing import List
+import re
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
 from aiogram import types
 from aiogram.filters import BaseFilter
 
+# "5 минут", "через 10 минут", "1 минута"
+SNOOZE_PATTERN = re.compile(r"(?<!\d)(\d{1,6})\D*минут[ыа]?$", re.IGNORECASE)
+# Больший интервал — не просьба отложить заявку (и переполнил бы datetime)
+SNOOZE_MAX_MINUTES = 60 * 24 * 30
+SNOOZE_ENDINGS = ("минут", "минуты", "минута")
+
 
 class ChatTypeFilter(BaseFilter):
     """
@@ -62,3 +70,80 @@ class ChatAdminFilter(BaseFilter):
         member = await message.chat.get_member(message.from_user.id)
         is_admin: bool = member.status in ("administrator", "creator")
         return is_admin if self.require_admin else True
+
+
+class GroupIntent(str, Enum):
+    """
+    Назначение сообщения в групповом чате.
+    """
+
+    SNOOZE = "snooze"
+    COMMAND = "command"
+    NOISE = "noise"
+
+
+def classify_group_message(
+        text: Optional[str],
+) -> Tuple[GroupIntent, Optional[int]]:
+    """
+    Определяет назначение сообщения группы без обращения к БД.
+
+    Окончание текста проверяется до регулярного выражения, поэтому
+    обычная переписка отсеивается за O(1) независимо от длины сообщения.
+    Интервал больше SNOOZE_MAX_MINUTES считается обычной перепиской.
+
+    Args:
+        text (Optional[str]): Текст сообщения (None — фото, стикер и т.п.).
+
+    Returns:
+        Tuple[GroupIntent, Optional[int]]: Назначение и число минут
+        (только для SNOOZE).
+    """
+    if not text:
+        return GroupIntent.NOISE, None
+    if text[0] == "/":
+        return GroupIntent.COMMAND, None
+    text = text.rstrip()
+    if not text[-8:].lower().endswith(SNOOZE_ENDINGS):
+        return GroupIntent.NOISE, None
+    # Поиск с позиции, а не по срезу: (?<!\d) видит цифры до неё
+    match = SNOOZE_PATTERN.search(text, max(0, len(text) - 64))
+    if match is None or int(match.group(1)) > SNOOZE_MAX_MINUTES:
+        return GroupIntent.NOISE, None
+    return GroupIntent.SNOOZE, int(match.group(1))
+
+
+class GroupIntentFilter(BaseFilter):
+    """
+    Фильтр сообщений группы по назначению. Для SNOOZE передаёт в
+    хендлер аргумент minutes.
+    """
+
+    def __init__(self, intent: GroupIntent) -> None:
+        """
+        Инициализация фильтра.
+
+        Args:
+            intent (GroupIntent): Ожидаемое назначение сообщения.
+        """
+        self.intent: GroupIntent = intent
+
+    async def __call__(
+            self, message: types.Message
+    ) -> Union[bool, Dict[str, Any]]:
+        """
+        Проверка назначения сообщения.
+
+        Args:
+            message (types.Message): Сообщение Telegram.
+
+        Returns:
+            Union[bool, Dict[str, Any]]: False, если назначение другое;
+            для SNOOZE — {"minutes": N}, иначе True.
+        """
+        intent, minutes = classify_group_message(message.text)
+        if intent is not self.intent:
+            return False
+        if intent is GroupIntent.SNOOZE:
+            return {"minutes": minutes}
+        return True
@@ -6,7 +6,7 @@ from aiogram import types
 
 logger = logging.getLogger(__name__)
 
-router = Router()
+router = Router(name=__name__)
 
 
 @router.message(Command("c"), ChatTypeFilter(allowed=["group", "supergroup"]))
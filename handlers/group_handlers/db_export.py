@@ -8,11 +8,11 @@ from services.excel_export import (
     send_client_users_excel,
     send_inactive_client_list,
 )
-from database.accessor import sync_engine
+from database.accessor import get_sync_engine
 
 logger = logging.getLogger(__name__)
 
-router = Router()
+router = Router(name=__name__)
 
 
 @router.message(
@@ -42,7 +42,7 @@ async def db_export_users(message: types.Message) -> None:
         except Exception as e:
             logger.error(f"Ошибка при проверке прав: {e}")
 
-    await send_users_excel(message=message, db_engine=sync_engine)
+    await send_users_excel(message=message, db_engine=get_sync_engine())
 
 
 @router.message(
@@ -72,7 +72,7 @@ async def db_guests_export_users(message: types.Message) -> None:
         except Exception as e:
             logger.error(f"Ошибка при проверке прав: {e}")
 
-    await send_guest_users_excel(message=message, db_engine=sync_engine)
+    await send_guest_users_excel(message=message, db_engine=get_sync_engine())
 
 
 @router.message(
@@ -102,7 +102,7 @@ async def db_clients_export_users(message: types.Message) -> None:
         except Exception as e:
             logger.error(f"Ошибка при проверке прав: {e}")
 
-    await send_client_users_excel(message=message, db_engine=sync_engine)
+    await send_client_users_excel(message=message, db_engine=get_sync_engine())
 
 
 @router.message(
@@ -151,4 +151,4 @@ async def get_inactive_client_list(message: types.Message) -> None:
             )
 
         await message.answer(text)
-        await send_inactive_client_list(message=message, db_engine=sync_engine)
+        await send_inactive_client_list(message=message, db_engine=get_sync_engine())
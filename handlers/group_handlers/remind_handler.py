@@ -1,81 +1,50 @@
-import asyncio
 import logging
-from typing import Optional
 
 from aiogram import Router, types
-from filters import ChatTypeFilter
-from bot_config import bot
-from services import reminders_service
+from filters import ChatTypeFilter, GroupIntent, GroupIntentFilter
+from services import reminders_service, reminder_scheduler
 
 logger = logging.getLogger(__name__)
 
-router = Router()
+router = Router(name=__name__)
 
 
-@router.message(ChatTypeFilter(["group", "supergroup"]))
-async def remind_keyboard_handler(message: types.Message):
+@router.message(
+    ChatTypeFilter(["group", "supergroup"]),
+    GroupIntentFilter(GroupIntent.SNOOZE),
+)
+async def remind_keyboard_handler(message: types.Message, minutes: int):
     """
     Обрабатывает сообщения с указанием времени в минутах и создаёт
     отложенное напоминание.
 
-    Args:
-        message (types.Message): Сообщение Telegram.
-    """
-    if message.text.endswith("минут") or message.text.endswith("минуты"):
-        try:
-            minutes: int = int("".join(filter(str.isdigit, message.text)))
-        except ValueError:
-            return
-
-        delay: int = minutes * 60
-        msg: types.Message = await message.answer("Напоминание установлено")
-
-        record = await (reminders_service.
-                        get_last_reminder_by_chat(message.chat.id))
-        if not record:
-            return
-
-        asyncio.create_task(
-            remind_user_later(
-                chat_id=message.chat.id,
-                message_id=record.message_id,
-                delay=delay,
-                user=message.from_user.username,
-                msg_del=msg,
-                message=message,
-            )
-        )
-
-
-async def remind_user_later(
-    chat_id: int,
-    message_id: int,
-    delay: int,
-    user: Optional[str],
-    msg_del: types.Message,
-    message: types.Message,
-) -> None:
-    """
-    Отправляет напоминание пользователю через указанное время.
+    Остальные сообщения группы отсеиваются фильтром без обращения к БД;
+    последнее напоминание чата берётся из индекса в памяти.
 
     Args:
-        chat_id (int): ID чата Telegram.
-        message_id (int): ID исходного сообщения.
-        delay (int): Задержка в секундах.
-        user (Optional[str]): Имя пользователя Telegram.
-        msg_del (types.Message): Сообщение с подтверждением установки
-            напоминания, которое нужно удалить.
-        message (types.Message): Исходное сообщение, которое нужно удалить.
+        message (types.Message): Сообщение Telegram.
+        minutes (int): Задержка в минутах (из GroupIntentFilter).
     """
-    await asyncio.sleep(delay)
-    await message.delete()
-    await msg_del.delete()
-    await bot.send_message(
-        chat_id=chat_id,
-        text=(
-            f"⏰@{user or message.from_user.first_name}, напоминаю "
-            "об отложенном обращении клиента!"
+    record = await (reminders_service.
+                    get_last_reminder_by_chat(message.chat.id))
+    if not record:
+        return
+
+    delay: int = minutes * 60
+    msg: types.Message = await message.answer("Напоминание установлено")
+
+    # Время отправки сохраняется в БД: напоминание переживёт
+    # перезапуск бота
+    due_at = await reminder_scheduler.schedule(
+        reminder_id=record.id,
+        delay=delay,
+        remind_username=(
+            message.from_user.username or message.from_user.first_name
         ),
-        reply_to_message_id=message_id,
+        request_message_id=message.message_id,
+        notice_message_id=msg.message_id,
+    )
+    logger.info(
+        f"Reminder {record.id} for chat {message.chat.id} "
+        f"scheduled at {due_at.isoformat(timespec='seconds')} UTC"
     )
-    await reminders_service.delete_reminder(message_id)
@@ -13,11 +13,11 @@ from services import (
 from handlers.group_handlers.db_export import get_inactive_client_list
 from filters import ChatTypeFilter
 from keyboards import start_group_kb
-from database.accessor import sync_engine
+from database.accessor import get_sync_engine
 
 logger = logging.getLogger(__name__)
 
-router = Router()
+router = Router(name=__name__)
 
 
 @router.message(
@@ -54,7 +54,7 @@ async def get_all_users(callback: CallbackQuery) -> None:
     Args:
         callback (CallbackQuery): Callback от Telegram.
     """
-    await send_users_excel(callback.message, db_engine=sync_engine)
+    await send_users_excel(callback.message, db_engine=get_sync_engine())
 
 
 @router.callback_query(F.data == "all_clients")
@@ -65,7 +65,7 @@ async def get_all_clients(callback: CallbackQuery) -> None:
     Args:
         callback (CallbackQuery): Callback от Telegram.
     """
-    await send_client_users_excel(callback.message, db_engine=sync_engine)
+    await send_client_users_excel(callback.message, db_engine=get_sync_engine())
 
 
 @router.callback_query(F.data == "all_guests")
@@ -76,7 +76,7 @@ async def get_all_guests(callback: CallbackQuery) -> None:
     Args:
         callback (CallbackQuery): Callback от Telegram.
     """
-    await send_guest_users_excel(callback.message, db_engine=sync_engine)
+    await send_guest_users_excel(callback.message, db_engine=get_sync_engine())
 
 
 @router.callback_query(F.data == "inactive_clients")
@@ -98,5 +98,5 @@ class AboutHandler:
             )
 
 
-router = Router()
+router = Router(name=__name__)
 AboutHandler(router)
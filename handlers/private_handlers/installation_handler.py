@@ -94,5 +94,5 @@ class InstallationHandler:
                 show_alert=False)
 
 
-router = Router()
+router = Router(name=__name__)
 InstallationHandler(router)
@@ -90,5 +90,5 @@ class PricesHandler:
             )
 
 
-router = Router()
+router = Router(name=__name__)
 PricesHandler(router)
@@ -1,11 +1,12 @@
 import logging
-from pathlib import Path
 from aiogram import Router, F
 from aiogram.enums import ParseMode
-from aiogram.types import Message, InputMediaPhoto, FSInputFile
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import Message
 from bot_config import bot
 from handlers.private_handlers.start_handler import StartHandler
 from keyboards import projects_kb
+from services import gallery_index, media_files_service
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +19,78 @@ class ProjectsHandlers:
 
     def __init__(self, router: Router) -> None:
         self.router: Router = router
-        self.BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
+        self.register_galleries()
         self.register_handlers()
 
+    def register_galleries(self) -> None:
+        gallery_index.register(
+            "calc_plaque",
+            caption=(
+                "*Накипь, ржавчина, мусор — всё, что съедает ваш котёл, бойлер "
+                "и трубы изнутри.*\n\n"
+                "Мы вычищаем — до состояния 'как новый'.\n"
+                "🛠️ Чистка котлов, бойлеров, труб — быстро и качественно.\n"
+                "👉 Не ждите аварии! Проверьте своё оборудование уже сегодня.\n"
+                "📩 Напишите — сделаем чистку за 1 день.\n\n"
+            ),
+            reply_markup=projects_kb,
+        )
+        gallery_index.register(
+            "warm_floor_installation",
+            caption=(
+                "🔥 *Теплый пол — комфорт и экономия круглый год*\n\n"
+                "*Холодные полы, сквозняки, высокая влажность — всё это делает "
+                "ваш дом неудобным.*\n\n"
+                "Мы укладываем тёплые полы — ровно, надёжно, безопасно.\n"
+                "🛠️ Монтаж теплых полов под любые покрытия: "
+                "плитка, ламинат, паркет.\n"
+                "⚡ Быстрое подключение к системе отопления и управление через "
+                "терморегулятор.\n"
+                "👉 Забудьте про холод и сырость — сделайте дом комфортным уже "
+                "сегодня.\n"
+                "📩 Свяжитесь с нами — проконсультируем и рассчитаем стоимость "
+                "за 1 день."
+            ),
+            reply_markup=projects_kb,
+        )
+        gallery_index.register(
+            "water_supply_routing",
+            caption=(
+                "🔧 *Профессиональная разводка труб —"
+                " залог надежного отопления*\n\n"
+                "*Хаотичная прокладка и некачественные соединения приводят к "
+                "утечкам, шуму и поломкам.*\n\n"
+                "Мы делаем аккуратную, продуманную разводку — надёжно, "
+                "эстетично, безопасно.\n"
+                "🛠️ Монтаж труб любой сложности, под ключ, "
+                "с гарантией на работу.\n"
+                "⚡ Оптимальная схема для котельного "
+                "оборудования и бойлеров.\n"
+                "👉 Забудьте про проблемы с отоплением "
+                "— всё будет работать идеально.\n"
+                "📩 Свяжитесь с нами — проект и монтаж за 1 день."
+            ),
+            reply_markup=projects_kb,
+        )
+        gallery_index.register(
+            "heater_installation",
+            caption=(
+                "🔥 *Установка котлов и бойлеров — надёжное тепло в доме*\n\n"
+                "*Неправильная установка оборудования "
+                "приводит к поломкам, авариям и лишним расходам.*\n\n"
+                "Мы устанавливаем котлы и бойлеры — "
+                "точно, безопасно, с гарантией.\n"
+                "🛠️ Подключение к системе отопления и водоснабжения, "
+                "настройка и пуск "
+                "под ключ.\n"
+                "⚡ Оптимальная работа и долгий срок службы оборудования.\n"
+                "👉 Забудьте про перебои с горячей водой и отоплением — всё будет "
+                "работать без проблем.\n"
+                "📩 Свяжитесь с нами — монтаж и настройка за 1 день."
+            ),
+            reply_markup=projects_kb,
+        )
+
     def register_handlers(self) -> None:
         self.router.message.register(
             self.projects_callback,
@@ -44,6 +114,8 @@ class ProjectsHandlers:
         self.router.message.register(
             self.main_callback,
             F.text == "В начало")
+        self.router.startup.register(gallery_index.start)
+        self.router.shutdown.register(gallery_index.stop)
 
     async def projects_callback(self, message: Message) -> None:
         try:
@@ -74,106 +146,53 @@ class ProjectsHandlers:
             )
 
     async def pipes_cleaning_callback(self, message: Message) -> None:
-        caption = (
-            "*Накипь, ржавчина, мусор — всё, что съедает ваш котёл, бойлер "
-            "и трубы изнутри.*\n\n"
-            "Мы вычищаем — до состояния 'как новый'.\n"
-            "🛠️ Чистка котлов, бойлеров, труб — быстро и качественно.\n"
-            "👉 Не ждите аварии! Проверьте своё оборудование уже сегодня.\n"
-            "📩 Напишите — сделаем чистку за 1 день.\n\n"
-        )
-        await self._send_media_group(message, "calc_plaque", caption)
+        await self._send_media_group(message, "calc_plaque")
 
     async def warm_floor_callback(self, message: Message) -> None:
-        caption = (
-            "🔥 *Теплый пол — комфорт и экономия круглый год*\n\n"
-            "*Холодные полы, сквозняки, высокая влажность — всё это делает "
-            "ваш дом неудобным.*\n\n"
-            "Мы укладываем тёплые полы — ровно, надёжно, безопасно.\n"
-            "🛠️ Монтаж теплых полов под любые покрытия: "
-            "плитка, ламинат, паркет.\n"
-            "⚡ Быстрое подключение к системе отопления и управление через "
-            "терморегулятор.\n"
-            "👉 Забудьте про холод и сырость — сделайте дом комфортным уже "
-            "сегодня.\n"
-            "📩 Свяжитесь с нами — проконсультируем и рассчитаем стоимость "
-            "за 1 день."
-        )
-        await self._send_media_group(
-            message,
-            "warm_floor_installation",
-            caption)
+        await self._send_media_group(message, "warm_floor_installation")
 
     async def pipes_routing_callback(self, message: Message) -> None:
-        caption = (
-            "🔧 *Профессиональная разводка труб —"
-            " залог надежного отопления*\n\n"
-            "*Хаотичная прокладка и некачественные соединения приводят к "
-            "утечкам, шуму и поломкам.*\n\n"
-            "Мы делаем аккуратную, продуманную разводку — надёжно, "
-            "эстетично, безопасно.\n"
-            "🛠️ Монтаж труб любой сложности, под ключ, "
-            "с гарантией на работу.\n"
-            "⚡ Оптимальная схема для котельного "
-            "оборудования и бойлеров.\n"
-            "👉 Забудьте про проблемы с отоплением "
-            "— всё будет работать идеально.\n"
-            "📩 Свяжитесь с нами — проект и монтаж за 1 день."
-        )
-        await self._send_media_group(message, "water_supply_routing", caption)
+        await self._send_media_group(message, "water_supply_routing")
 
     async def heater_installation_callback(self, message: Message) -> None:
-        caption = (
-            "🔥 *Установка котлов и бойлеров — надёжное тепло в доме*\n\n"
-            "*Неправильная установка оборудования "
-            "приводит к поломкам, авариям и лишним расходам.*\n\n"
-            "Мы устанавливаем котлы и бойлеры — "
-            "точно, безопасно, с гарантией.\n"
-            "🛠️ Подключение к системе отопления и водоснабжения, "
-            "настройка и пуск "
-            "под ключ.\n"
-            "⚡ Оптимальная работа и долгий срок службы оборудования.\n"
-            "👉 Забудьте про перебои с горячей водой и отоплением — всё будет "
-            "работать без проблем.\n"
-            "📩 Свяжитесь с нами — монтаж и настройка за 1 день."
-        )
-        await self._send_media_group(message, "heater_installation", caption)
+        await self._send_media_group(message, "heater_installation")
 
     async def main_callback(self, message: Message) -> None:
         await message.delete()
         await StartHandler.start(message)
 
     async def _send_media_group(
-        self, message: Message, folder_name: str, caption: str
+        self, message: Message, folder_name: str
     ) -> None:
         try:
-            PHOTO_DIR = self.BASE_DIR / "projects_images" / folder_name
-            file_paths = [
-                PHOTO_DIR / f
-                for f in sorted(path.name for path in PHOTO_DIR.iterdir())
-                if f.endswith(".jpg")
-            ]
-            if not file_paths:
-                logger.error(f"No files found in folder: {PHOTO_DIR}")
+            gallery = await gallery_index.get(folder_name)
+            if not gallery.files:
+                logger.error(f"No files found in gallery: {folder_name}")
                 return
 
-            media = []
-            for i, path in enumerate(file_paths):
-                if i == 0:
-                    media.append(
-                        InputMediaPhoto(
-                            media=FSInputFile(path),
-                            caption=caption,
-                            parse_mode=ParseMode.MARKDOWN,
-                            reply_markup=projects_kb,
-                        )
-                    )
-                else:
-                    media.append(InputMediaPhoto(media=FSInputFile(path)))
-            await bot.send_media_group(chat_id=message.chat.id, media=media)
+            resolved = await media_files_service.resolve_keyed(gallery.files)
+            keys = [key for key, _ in resolved]
+            try:
+                sent = await bot.send_media_group(
+                    chat_id=message.chat.id,
+                    media=gallery.build_media([media for _, media in resolved]),
+                )
+            except TelegramBadRequest as e:
+                cached = [key for key, media in resolved if isinstance(media, str)]
+                if not cached:
+                    raise
+                # file_id больше не действителен: загружаем файлы заново
+                logger.warning(f"Cached file_id rejected, re-uploading: {e}")
+                await media_files_service.forget(cached)
+                resolved = await media_files_service.resolve_keyed(gallery.files)
+                sent = await bot.send_media_group(
+                    chat_id=message.chat.id,
+                    media=gallery.build_media([media for _, media in resolved]),
+                )
+            await media_files_service.remember(keys, sent)
         except Exception as e:
             logger.error(f"Error sending media group: {e}", exc_info=True)
 
 
-router = Router()
+router = Router(name=__name__)
 ProjectsHandlers(router)
@@ -91,5 +91,5 @@ class RepairHandler:
             )
 
 
-router = Router()
+router = Router(name=__name__)
 RepairHandler(router)
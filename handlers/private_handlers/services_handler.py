@@ -8,7 +8,7 @@ from keyboards import services_kb
 # Настройка логирования для этого модуля
 logger = logging.getLogger(__name__)
 
-router = Router()
+router = Router(name=__name__)
 
 
 @router.message(F.text == "🔧 Услуги")
@@ -86,5 +86,5 @@ class StartHandler:
                     f"Failed to send error message to user: {inner_e}")
 
 
-router = Router()
+router = Router(name=__name__)
 StartHandler(router)
@@ -1,22 +1,44 @@
-import json
 import logging
-from datetime import datetime, timezone
 
 from aiogram import types, Router, F
 from aiogram.enums import ParseMode
-from bot_config import telegram_client
-from keyboards import remind_kb
-from services import users_service, reminders_service
-from settings import settings
+from pydantic import BaseModel, ConfigDict, ValidationError
+from services import activity_tracker, users_service, outbox_service, outbox_dispatcher
 
 logger = logging.getLogger(__name__)
 
+NOT_SPECIFIED = "не указано"
+
+
+class WebAppForm(BaseModel):
+    """
+    Данные формы WebApp.
+
+    JSON разбирается pydantic-core сразу в модель, без промежуточного
+    словаря. Отсутствующие поля получают значение "не указано".
+
+    Attributes:
+        form (str): Тип формы: "callback" или "problem".
+        name (str): Имя клиента.
+        phone (str): Телефон.
+        topic (str): Тема звонка или описание проблемы.
+        time (str): Удобное время звонка.
+    """
+
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+
+    form: str = "unknown"
+    name: str = NOT_SPECIFIED
+    phone: str = NOT_SPECIFIED
+    topic: str = NOT_SPECIFIED
+    time: str = NOT_SPECIFIED
+
 
 class WebAppHandler:
     """
     Обрабатывает данные WebApp форм и медиафайлы от пользователя.
-    Сохраняет заявки на обратный звонок или описание проблемы
-    и отправляет их администратору.
+    Сохраняет заявки на обратный звонок или описание проблемы в outbox,
+    откуда их доставляет администраторам фоновый диспетчер.
     """
 
     active_requests: dict[int, dict] = {}
@@ -27,8 +49,10 @@ class WebAppHandler:
 
     def register_handlers(self) -> None:
         self.router.message.register(self.web_app_data_handler, F.web_app_data)
+        # Файлы в группах (в том числе в админ-группе) — не заявки
         self.router.message.register(
             self.handle_files,
+            F.chat.type == "private",
             F.photo | F.video | F.document | F.voice | F.video_note
         )
 
@@ -39,15 +63,15 @@ class WebAppHandler:
                 f"{message.from_user.id}")
             logger.debug(f"Raw web app data: {message.web_app_data.data}")
 
-            data = json.loads(message.web_app_data.data)
-            form_type = data.get("form", "unknown")
+            form = WebAppForm.model_validate_json(message.web_app_data.data)
+            form_type = form.form
             logger.info(f"Form type: {form_type}")
-            logger.debug(f"Parsed data: {data}")
+            logger.debug(f"Parsed data: {form}")
 
             if form_type == "callback":
-                await self._handle_callback_form(message, data)
+                await self._handle_callback_form(message, form)
             elif form_type == "problem":
-                await self._handle_problem_form(message, data)
+                await self._handle_problem_form(message, form)
             else:
                 logger.warning(
                     f"Unknown form type from user "
@@ -57,9 +81,9 @@ class WebAppHandler:
                     "Неизвестный тип формы. Пожалуйста, попробуйте снова."
                 )
 
-        except json.JSONDecodeError as e:
+        except ValidationError as e:
             logger.error(
-                f"JSON decode error from user "
+                f"Invalid web app data from user "
                 f"{message.from_user.id}: {e}"
             )
             await message.answer(
@@ -76,13 +100,12 @@ class WebAppHandler:
             )
 
     async def _handle_callback_form(
-            self, message: types.Message, data: dict
+            self, message: types.Message, form: WebAppForm
     ) -> None:
-        admin_id = settings.ADMIN_CHAT_ID
-        name = data.get("name", "не указано")
-        phone = data.get("phone", "не указано")
-        topic = data.get("topic", "не указано")
-        time_val = data.get("time", "не указано")
+        name = form.name
+        phone = form.phone
+        topic = form.topic
+        time_val = form.time
 
         text_msg = (
             f"🔔 Заказан ОБРАТНЫЙ ЗВОНОК от {name.capitalize()}\n"
@@ -94,47 +117,44 @@ class WebAppHandler:
             f"❓ Напомнить позже?"
         )
 
-        response = await telegram_client.post(
-            method="sendMessage",
-            chat_id=admin_id,
-            text=text_msg,
-            reply_markup=remind_kb
-        )
-        msg_id = response['result']['message_id']
-
-        await reminders_service.save_reminder(
-            chat_id=admin_id,
-            message_id=msg_id,
-            type_="callback",
-            username=message.from_user.username
-        )
+        # Заявка и данные пользователя сохраняются одной транзакцией,
+        # отправку администраторам выполняет outbox_dispatcher
+        try:
+            outbox_id = await outbox_service.enqueue_lead(
+                user_id=message.from_user.id,
+                username=message.from_user.username,
+                kind="callback",
+                text=text_msg,
+                phone_number=phone,
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to save callback request of user "
+                f"{message.from_user.id}: {e}",
+                exc_info=True,
+            )
+            await message.answer(
+                "Не удалось передать заявку, попробуйте отправить её позже."
+            )
+            return
+        outbox_dispatcher.notify()
 
         await message.answer(
             f"{message.from_user.first_name}, спасибо!\n"
             "📨 Ваша заявка на обратный звонок передана!\n"
             "С вами свяжутся наши специалисты в удобное время."
         )
-        await users_service.set_phone_number(
-            user_id=message.from_user.id, phone_number=phone
-        )
-        await users_service.update_last_data(
-            user_id=message.from_user.id,
-            updated_date=datetime.now(timezone.utc)
-        )
-        await users_service.set_client_status(
-            user_id=message.from_user.id
-        )
         logger.info(
-            f"Callback confirmation sent to user "
-            f"{message.from_user.id}"
+            f"Callback request {outbox_id} of user "
+            f"{message.from_user.id} queued for admins"
         )
 
     async def _handle_problem_form(
-            self, message: types.Message, data: dict
+            self, message: types.Message, form: WebAppForm
     ) -> None:
-        name = data.get("name", "не указано")
-        phone = data.get("phone", "не указано")
-        problem = data.get("topic", "не указано")
+        name = form.name
+        phone = form.phone
+        problem = form.topic
 
         self.active_requests[message.chat.id] = {
             "name": name,
@@ -157,11 +177,13 @@ class WebAppHandler:
             parse_mode=ParseMode.MARKDOWN,
         )
 
-        await users_service.update_last_data(
-            user_id=message.from_user.id,
-            updated_date=datetime.now(timezone.utc)
-        )
-        await users_service.set_client_status(user_id=message.from_user.id)
+        activity_tracker.touch(message.from_user.id)
+        try:
+            await users_service.set_client_status(user_id=message.from_user.id)
+        except ValueError:
+            logger.warning(
+                f"Problem request of unregistered user {message.from_user.id}"
+            )
         logger.info(
             f"Problem request instructions sent to user "
             f"{message.from_user.id}")
@@ -213,7 +235,6 @@ class WebAppHandler:
             await message.answer("У вас нет активной заявки.")
             return
 
-        admin_id = settings.ADMIN_CHAT_ID
         text_msg = (
             f"🔔 Новая заявка от {req['name'].capitalize()}\n"
             f"Телефон: {req['phone']}\n"
@@ -222,48 +243,35 @@ class WebAppHandler:
             f"❓ Напомнить позже?"
         )
 
+        try:
+            outbox_id = await outbox_service.enqueue_lead(
+                user_id=message.from_user.id,
+                username=message.from_user.username,
+                kind="problem",
+                text=text_msg,
+                files=req["files"],
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to save problem request of user "
+                f"{message.from_user.id}: {e}",
+                exc_info=True,
+            )
+            # Заявка возвращается, чтобы пользователь мог отправить файл ещё раз
+            self.active_requests[chat_id] = req
+            await message.answer(
+                "Не удалось передать заявку, попробуйте отправить файл позже."
+            )
+            return
+        outbox_dispatcher.notify()
         logger.info(
-            f"Sending problem request to admins: "
-            f"{admin_id}, files count: {len(req['files'])}"
-        )
-
-        response = await telegram_client.post(
-            method="sendMessage",
-            chat_id=admin_id,
-            text=text_msg,
-            reply_markup=remind_kb
-        )
-        msg_id = response['result']['message_id']
-        await reminders_service.save_reminder(
-            chat_id=admin_id,
-            message_id=msg_id,
-            type_="problem",
-            username=message.from_user.username
+            f"Problem request {outbox_id} queued for admins, "
+            f"files count: {len(req['files'])}"
         )
-        logger.info(f"Problem request text sent to admin {admin_id}")
-
-        for ftype, fid in req["files"]:
-            method_map = {
-                "photo": "sendPhoto",
-                "video": "sendVideo",
-                "document": "sendDocument",
-                "voice": "sendVoice",
-                "video_note": "sendVideoNote"
-            }
-            try:
-                await telegram_client.post(
-                    method=method_map[ftype],
-                    chat_id=admin_id,
-                    **{ftype: fid})
-                logger.info(f"File sent to admin {admin_id}: type={ftype}")
-            except Exception as file_e:
-                logger.error(
-                    f"Failed to send file to admin"
-                    f" {admin_id}: {file_e}")
 
         await message.answer("✅ Ваша заявка передана администратору.")
         logger.info(f"Request finalized for user {message.from_user.id}")
 
 
-router = Router()
+router = Router(name=__name__)
 WebAppHandler(router)
@@ -2,8 +2,13 @@ import asyncio
 import logging
 
 from bot_config import bot, dp
+from settings import settings
 from setup import register_routers
 from setup import register_commands
+from setup import register_middlewares
+from setup import register_lifecycle
+from setup import run_webhook
+from workers import ShardedFront
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", force=True)
 logger = logging.getLogger(__name__)
@@ -11,7 +16,25 @@ logger = logging.getLogger(__name__)
 async def main():
     register_routers()
     await register_commands()
-    await dp.start_polling(bot)
+    if settings.SHARDS > 1:
+        # Апдейты обрабатываются в процессах-воркерах, здесь только приём
+        front = ShardedFront(
+            shards=settings.SHARDS, queue_size=settings.UPDATE_QUEUE_SIZE
+        )
+        await front.run()
+        return
+    register_middlewares()
+    register_lifecycle()
+    if settings.BOT_MODE == "webhook":
+        await run_webhook()
+    else:
+        # getUpdates не работает, пока установлен вебхук
+        await bot.delete_webhook()
+        # Апдейты обрабатывает планировщик; ожидание submit() в цикле
+        # polling даёт обратное давление при переполнении очереди.
+        # По SIGTERM/SIGINT aiogram останавливает polling и вызывает
+        # хуки остановки (setup.lifecycle)
+        await dp.start_polling(bot, handle_as_tasks=False)
 
 if __name__ == "__main__":
     asyncio.run(main())
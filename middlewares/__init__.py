@@ -0,0 +1,24 @@
+"""
+Пакет middlewares.
+
+Содержит middleware для Dispatcher: передачу апдейтов в планировщик
+обработки и сбор метрик хендлеров и запросов к Telegram API, а также
+middleware сессии aiogram, ограничивающий частоту отправки сообщений.
+"""
+
+
+from middlewares.scheduling import UpdateSchedulerMiddleware
+from middlewares.rate_limit import OutboundRateLimitMiddleware
+from middlewares.metrics import (
+    UpdateMetricsMiddleware,
+    HandlerMetricsMiddleware,
+    TelegramRequestMetricsMiddleware,
+)
+
+__all__ = [
+    "UpdateSchedulerMiddleware",
+    "OutboundRateLimitMiddleware",
+    "UpdateMetricsMiddleware",
+    "HandlerMetricsMiddleware",
+    "TelegramRequestMetricsMiddleware",
+]
\ No newline at end of file
@@ -0,0 +1,122 @@
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import TelegramObject, Update
+
+from monitoring import UpdateTimings, current_timings, registry
+from monitoring.timings import (
+    observe_telegram_request,
+    telegram_request_errors,
+)
+
+update_duration = registry.histogram(
+    "update_duration_seconds",
+    "Полное время обработки апдейта",
+)
+update_telegram_duration = registry.histogram(
+    "update_telegram_seconds",
+    "Время запросов к Telegram API за апдейт",
+)
+update_db_duration = registry.histogram(
+    "update_db_seconds",
+    "Время SQL-запросов за апдейт",
+)
+handler_duration = registry.histogram(
+    "handler_duration_seconds",
+    "Время выполнения хендлера",
+    ("router", "handler"),
+)
+handler_errors = registry.counter(
+    "handler_errors_total",
+    "Необработанные исключения в хендлерах",
+    ("router", "handler", "error"),
+)
+
+
+class UpdateMetricsMiddleware(BaseMiddleware):
+    """
+    Внешний middleware: измеряет полное время обработки апдейта и время,
+    потраченное на Telegram API и БД.
+
+    Подключается после UpdateSchedulerMiddleware, чтобы измерять
+    обработку в воркере, а не постановку в очередь.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
+        event: Update,
+        data: Dict[str, Any],
+    ) -> Any:
+        timings = UpdateTimings()
+        token = current_timings.set(timings)
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        finally:
+            update_duration.observe(time.perf_counter() - started)
+            update_telegram_duration.observe(timings.telegram)
+            update_db_duration.observe(timings.db)
+            current_timings.reset(token)
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    """
+    Внутренний middleware роутера: время выполнения и ошибки хендлера
+    с метками роутера и хендлера.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        router = data.get("event_router")
+        handler_object = data.get("handler")
+        callback = getattr(handler_object, "callback", None)
+        labels = {
+            "router": getattr(router, "name", "unknown"),
+            "handler": getattr(callback, "__qualname__", repr(callback)),
+        }
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        except Exception as e:
+            handler_errors.inc(error=type(e).__name__, **labels)
+            raise
+        finally:
+            handler_duration.observe(time.perf_counter() - started, **labels)
+
+
+class TelegramRequestMetricsMiddleware(BaseRequestMiddleware):
+    """
+    Middleware сессии aiogram: длительность и ошибки запросов Bot API.
+    """
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        name = method.__api_method__
+        started = time.perf_counter()
+        try:
+            return await make_request(bot, method)
+        except Exception as e:
+            telegram_request_errors.inc(
+                client="aiogram", method=name, error=type(e).__name__
+            )
+            raise
+        finally:
+            observe_telegram_request(
+                "aiogram", name, time.perf_counter() - started
+            )
@@ -0,0 +1,59 @@
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from bot_config.rate_limiter import (
+    RATE_LIMITED_METHODS,
+    OutboundRateLimiter,
+    limiter_retry_after,
+)
+
+
+class OutboundRateLimitMiddleware(BaseRequestMiddleware):
+    """
+    Middleware сессии aiogram: пропускает отправку сообщений через
+    ограничитель исходящих запросов и повторяет её после ответа 429.
+
+    Подключается первым, чтобы остальные middleware сессии не учитывали
+    время ожидания в ограничителе.
+    """
+
+    def __init__(self, limiter: OutboundRateLimiter, max_retries: int) -> None:
+        """
+        Инициализация middleware.
+
+        Args:
+            limiter (OutboundRateLimiter): Ограничитель исходящих запросов.
+            max_retries (int): Максимальное число повторов после 429.
+        """
+        self.limiter: OutboundRateLimiter = limiter
+        self.max_retries: int = max_retries
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if method.__api_method__ not in RATE_LIMITED_METHODS:
+            return await make_request(bot, method)
+
+        chat_id = getattr(method, "chat_id", None)
+        media = getattr(method, "media", None)
+        cost = len(media) if isinstance(media, list) else 1
+        attempt = 0
+        while True:
+            await self.limiter.acquire(chat_id, cost=cost)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                limiter_retry_after.inc(client="aiogram")
+                self.limiter.pause(chat_id, e.retry_after)
@@ -0,0 +1,56 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from aiogram import BaseMiddleware
+from aiogram.types import Update
+
+from workers import UpdateScheduler
+
+
+class UpdateSchedulerMiddleware(BaseMiddleware):
+    """
+    Внешний middleware, передающий апдейты в UpdateScheduler.
+
+    Должен подключаться после встроенных middleware aiogram, так как
+    использует event_context, заполненный UserContextMiddleware.
+    Все middleware, подключённые после него, выполняются уже в воркерах.
+    """
+
+    def __init__(self, scheduler: UpdateScheduler) -> None:
+        """
+        Инициализация middleware.
+
+        Args:
+            scheduler (UpdateScheduler): Планировщик апдейтов.
+        """
+        self.scheduler: UpdateScheduler = scheduler
+
+    @staticmethod
+    def resolve_key(event: Update, data: Dict[str, Any]) -> Hashable:
+        """
+        Определяет ключ упорядочивания апдейта.
+
+        Args:
+            event (Update): Апдейт Telegram.
+            data (Dict[str, Any]): Контекстные данные aiogram.
+
+        Returns:
+            Hashable: chat_id, либо user_id, либо update_id для апдейтов
+            без чата и пользователя.
+        """
+        context = data.get("event_context")
+        if context is not None:
+            if context.chat_id is not None:
+                return context.chat_id
+            if context.user_id is not None:
+                return ("user", context.user_id)
+        return ("update", event.update_id)
+
+    async def __call__(
+        self,
+        handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
+        event: Update,
+        data: Dict[str, Any],
+    ) -> Any:
+        await self.scheduler.submit(
+            self.resolve_key(event, data), handler, event, data
+        )
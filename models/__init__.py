@@ -2,11 +2,15 @@
 Пакет models.
 
 Содержит SQLAlchemy модели для базы данных:
-пользователи (Users) и напоминания (Reminder).
+пользователи (Users), напоминания (Reminder), кэш file_id
+загруженных в Telegram файлов (MediaFile) и исходящие уведомления
+о заявках (OutboxMessage).
 """
 
 
 from .users import Users
 from .reminders import Reminder
+from .media_files import MediaFile
+from .outbox import OutboxMessage
 
-__all__ = ["Users", "Reminder"]
\ No newline at end of file
+__all__ = ["Users", "Reminder", "MediaFile", "OutboxMessage"]
\ No newline at end of file
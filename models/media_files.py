@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database.database import Base
+
+
+class MediaFile(Base):
+    """
+    Модель базы данных для кэша file_id файлов, загруженных в Telegram.
+
+    Запись привязана к пути и хэшу содержимого: после изменения файла
+    хэш меняется, и файл загружается заново.
+
+    Атрибуты:
+        id (int): Уникальный идентификатор записи.
+        path (str): Путь к файлу относительно каталога проекта.
+        content_hash (str): SHA-256 содержимого файла.
+        file_id (str): file_id, выданный Telegram при загрузке.
+        file_unique_id (str | None): Постоянный идентификатор файла в Telegram.
+        created_at (datetime): Дата и время загрузки.
+    """
+
+    __tablename__ = "media_files"
+    __table_args__ = (
+        UniqueConstraint("path", "content_hash", name="uq_media_files_path_hash"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, nullable=False)
+    path: Mapped[str] = mapped_column(String(255), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    file_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_unique_id: Mapped[str] = mapped_column(String(64), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from database.database import Base
+
+
+class OutboxMessage(Base):
+    """
+    Модель базы данных для исходящих уведомлений администраторам о
+    заявках (transactional outbox).
+
+    Заявка записывается в той же транзакции, что и данные пользователя,
+    а доставляется в админ-группу фоновым диспетчером.
+
+    Атрибуты:
+        id (int): Уникальный идентификатор записи.
+        kind (str): Тип заявки ('callback' или 'problem').
+        chat_id (int): Чат, куда доставляется уведомление.
+        user_id (int | None): Пользователь, оставивший заявку.
+        username (str | None): Имя пользователя Telegram.
+        payload (dict): Текст уведомления и файлы заявки.
+        status (str): 'pending', 'sent' или 'failed'.
+        attempts (int): Число попыток доставки.
+        next_attempt_at (datetime): Время следующей попытки.
+        message_id (int | None): Отправленное сообщение с текстом заявки.
+        files_sent (int): Число уже доставленных файлов.
+        last_error (str | None): Ошибка последней попытки.
+        created_at (datetime): Дата и время создания заявки.
+        sent_at (datetime | None): Дата и время доставки.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        Index(
+            "ix_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, nullable=False)
+    kind: Mapped[str] = mapped_column(String(10), nullable=False)
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    user_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    username: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(10), nullable=False, server_default="pending"
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+    message_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    files_sent: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, BigInteger, DateTime
+from sqlalchemy import Column, Index, Integer, String, BigInteger, DateTime, text
 from datetime import datetime
+from typing import Optional
 from sqlalchemy.orm import Mapped, mapped_column
 from database.database import Base
 
@@ -15,13 +16,49 @@ class Reminder(Base):
         type (str): Тип напоминания ('callback' или 'problem').
         username (str): Имя пользователя Telegram, связанного с напоминанием.
         created_at (datetime): Дата и время создания записи.
+        due_at (datetime | None): Время отправки напоминания (UTC);
+            None — напоминание не запланировано.
+        remind_username (str | None): Администратор, которому адресовано
+            напоминание.
+        request_message_id (int | None): Сообщение администратора с
+            интервалом, удаляемое при отправке.
+        notice_message_id (int | None): Сообщение "Напоминание
+            установлено", удаляемое при отправке.
     """
 
     __tablename__ = "reminders"
+    __table_args__ = (
+        Index(
+            "uq_reminders_chat_message", "chat_id", "message_id", unique=True
+        ),
+        Index(
+            "ix_reminders_due_at",
+            "due_at",
+            postgresql_where=text("due_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, nullable=False)
     chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     message_id: Mapped[int] = mapped_column(Integer, nullable=False)
     type: Mapped[str] = mapped_column(String(10), nullable=False)
     username: Mapped[str] = mapped_column(String(100))
-    created_at: Mapped[datetime] = Column(DateTime, default=datetime.now())
\ No newline at end of file
+    created_at: Mapped[datetime] = Column(DateTime, default=datetime.now)
+    due_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    remind_username: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )
+    request_message_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger, nullable=True
+    )
+    notice_message_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger, nullable=True
+    )
+
+
+# Последнее напоминание чата (ORDER BY created_at DESC LIMIT 1)
+Index(
+    "ix_reminders_chat_created",
+    Reminder.chat_id,
+    Reminder.created_at.desc(),
+)
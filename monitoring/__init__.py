@@ -0,0 +1,22 @@
+"""
+Пакет monitoring.
+
+Содержит метрики приложения (счётчики, гистограммы, gauge) в формате
+Prometheus, учёт времени запросов к Telegram API и БД в рамках апдейта
+и HTTP-эндпоинт для их сбора.
+"""
+
+
+from monitoring.metrics import MetricsRegistry, registry
+from monitoring.timings import UpdateTimings, current_timings, track_db_time
+from monitoring.server import MetricsServer, start_metrics_server
+
+__all__ = [
+    "MetricsRegistry",
+    "registry",
+    "UpdateTimings",
+    "current_timings",
+    "track_db_time",
+    "MetricsServer",
+    "start_metrics_server",
+]
\ No newline at end of file
@@ -0,0 +1,272 @@
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+# Сэмпл коллектора: имя метрики, метки, значение
+Sample = Tuple[str, Dict[str, str], float]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metric:
+    """
+    Базовый класс метрики с метками.
+
+    Attributes:
+        name (str): Имя метрики.
+        documentation (str): Описание для строки HELP.
+        label_names (Tuple[str, ...]): Имена меток.
+    """
+
+    type_name: str = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        """
+        Returns:
+            List[str]: Строки метрики в текстовом формате Prometheus.
+        """
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._render_samples(),
+        ]
+
+    def _render_samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """
+    Монотонно возрастающий счётчик.
+    """
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _render_samples(self) -> Iterable[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, key)} {value}"
+
+
+class Gauge(Metric):
+    """
+    Значение, которое может как расти, так и уменьшаться.
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _render_samples(self) -> Iterable[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, key)} {value}"
+
+
+class Histogram(Metric):
+    """
+    Гистограмма с фиксированными границами корзин.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # Для каждого набора меток: счётчики корзин, сумма, количество
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def count(self, **labels: str) -> float:
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0.0
+
+    def _render_samples(self) -> Iterable[str]:
+        names = self.label_names + ("le",)
+        for key, state in sorted(self._values.items()):
+            cumulative = 0.0
+            for bound, amount in zip(self.buckets, state):
+                cumulative += amount
+                yield (
+                    f"{self.name}_bucket"
+                    f"{_format_labels(names, key + (repr(bound),))} {cumulative}"
+                )
+            yield (
+                f"{self.name}_bucket"
+                f"{_format_labels(names, key + ('+Inf',))} {state[-1]}"
+            )
+            labels = _format_labels(self.label_names, key)
+            yield f"{self.name}_sum{labels} {state[-2]}"
+            yield f"{self.name}_count{labels} {state[-1]}"
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик процесса.
+
+    Метрики создаются через counter()/gauge()/histogram(): повторный вызов
+    с тем же именем возвращает существующую метрику. Коллекторы —
+    функции, вычисляющие значения в момент сбора (например, глубину
+    очереди планировщика).
+    """
+
+    def __init__(self, prefix: str = "") -> None:
+        """
+        Инициализация реестра.
+
+        Args:
+            prefix (str): Префикс имён всех метрик.
+        """
+        self.prefix: str = prefix
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Tuple[str, str, Callable[[], Iterable[Sample]]]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args, **kwargs) -> Metric:
+        full_name = f"{self.prefix}{name}"
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = self._metrics[full_name] = cls(full_name, *args, **kwargs)
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Counter:
+        return self._get_or_create(Counter, name, documentation, label_names)
+
+    def gauge(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, label_names, buckets=buckets
+        )
+
+    def register_collector(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[Sample]],
+    ) -> None:
+        """
+        Регистрирует коллектор gauge-метрик, вычисляемых при сборе.
+
+        Args:
+            name (str): Имя семейства метрик (для строки HELP).
+            documentation (str): Описание семейства.
+            collect (Callable): Функция, возвращающая сэмплы
+                (имя, метки, значение); имена дополняются префиксом.
+        """
+        self._collectors.append((f"{self.prefix}{name}", documentation, collect))
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(f"{self.prefix}{name}")
+
+    def render(self) -> str:
+        """
+        Returns:
+            str: Все метрики в текстовом формате Prometheus.
+        """
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        for family, documentation, collect in self._collectors:
+            grouped: Dict[str, List[str]] = {}
+            for sample_name, labels, value in collect():
+                full_name = f"{self.prefix}{sample_name}"
+                grouped.setdefault(full_name, []).append(
+                    f"{full_name}"
+                    f"{_format_labels(list(labels), list(labels.values()))} {value}"
+                )
+            for full_name, samples in grouped.items():
+                lines.append(f"# HELP {full_name} {documentation}")
+                lines.append(f"# TYPE {full_name} gauge")
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(prefix="heater_bot_")
@@ -0,0 +1,75 @@
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from monitoring.metrics import MetricsRegistry, registry
+
+logger = logging.getLogger(__name__)
+
+
+def create_metrics_app(metrics: MetricsRegistry = registry) -> web.Application:
+    """
+    Создаёт aiohttp-приложение с эндпоинтом /metrics.
+
+    Args:
+        metrics (MetricsRegistry): Реестр метрик.
+
+    Returns:
+        web.Application: Приложение.
+    """
+
+    async def handle_metrics(request: web.Request) -> web.Response:
+        return web.Response(
+            text=metrics.render(),
+            content_type="text/plain",
+            charset="utf-8",
+            headers={"X-Content-Type-Options": "nosniff"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle_metrics)
+    return app
+
+
+class MetricsServer:
+    """
+    HTTP-сервер метрик с запуском и остановкой по хукам Dispatcher.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        """
+        Args:
+            host (str): Адрес для прослушивания.
+            port (int): Порт.
+        """
+        self.host: str = host
+        self.port: int = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        if self._runner is None:
+            self._runner = await start_metrics_server(self.host, self.port)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def start_metrics_server(host: str, port: int) -> web.AppRunner:
+    """
+    Запускает HTTP-сервер метрик в текущем event loop.
+
+    Args:
+        host (str): Адрес для прослушивания.
+        port (int): Порт.
+
+    Returns:
+        web.AppRunner: Раннер; для остановки вызовите cleanup().
+    """
+    runner = web.AppRunner(create_metrics_app())
+    await runner.setup()
+    await web.TCPSite(runner, host=host, port=port).start()
+    logger.info(f"Метрики доступны на http://{host}:{port}/metrics")
+    return runner
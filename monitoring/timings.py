@@ -0,0 +1,105 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from monitoring.metrics import registry
+
+db_query_duration = registry.histogram(
+    "db_query_duration_seconds",
+    "Длительность SQL-запросов",
+)
+telegram_request_duration = registry.histogram(
+    "telegram_request_duration_seconds",
+    "Длительность запросов к Telegram API",
+    ("client", "method"),
+)
+telegram_request_errors = registry.counter(
+    "telegram_request_errors_total",
+    "Ошибки запросов к Telegram API",
+    ("client", "method", "error"),
+)
+
+
+@dataclass
+class UpdateTimings:
+    """
+    Время, потраченное на внешние вызовы в рамках одного апдейта.
+
+    Attributes:
+        telegram (float): Суммарное время запросов к Telegram API, сек.
+        db (float): Суммарное время SQL-запросов, сек.
+    """
+
+    telegram: float = 0.0
+    db: float = 0.0
+
+
+# Заполняется UpdateMetricsMiddleware на время обработки апдейта
+current_timings: ContextVar[Optional[UpdateTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def observe_telegram_request(client: str, method: str, duration: float) -> None:
+    """
+    Учитывает запрос к Telegram API в гистограмме и во времени текущего
+    апдейта.
+
+    Args:
+        client (str): Клиент: "aiogram" или "raw".
+        method (str): Метод Bot API.
+        duration (float): Длительность запроса в секундах.
+    """
+    telegram_request_duration.observe(duration, client=client, method=method)
+    timings = current_timings.get()
+    if timings is not None:
+        timings.telegram += duration
+
+
+def _before_cursor_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+        executemany: bool,
+) -> None:
+    conn.info.setdefault("query_started_at", []).append(
+        (time.perf_counter(), context)
+    )
+
+
+def _after_cursor_execute(conn: Any, *args: Any) -> None:
+    started, _ = conn.info["query_started_at"].pop()
+    duration = time.perf_counter() - started
+    db_query_duration.observe(duration)
+    timings = current_timings.get()
+    if timings is not None:
+        timings.db += duration
+
+
+def _handle_error(context: Any) -> None:
+    # after_cursor_execute для упавшего запроса не вызывается. Ошибки до
+    # before_cursor_execute (например, при подключении) в стек ничего не
+    # добавляли, поэтому запись снимается, только если она этого запроса
+    if context.connection is None or context.execution_context is None:
+        return
+    started = context.connection.info.get("query_started_at")
+    if started and started[-1][1] is context.execution_context:
+        started.pop()
+
+
+def track_db_time(engine: Engine) -> None:
+    """
+    Подключает учёт времени SQL-запросов к движку.
+
+    Для асинхронного движка передаётся engine.sync_engine: контекст
+    апдейта доступен в событиях, так как SQLAlchemy переносит contextvars
+    в greenlet драйвера.
+
+    Args:
+        engine (Engine): Синхронный движок SQLAlchemy.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,282 @@
+"""
+Оптимизация изображений галерей проектов перед сборкой.
+
+Исходные JPEG с камеры уменьшаются до размера, который Telegram всё
+равно использует для фото (1280 px по длинной стороне), перекодируются
+в progressive JPEG и очищаются от EXIF и прочих метаданных. Файлы
+обрабатываются параллельно в пуле процессов.
+
+Результат пишется в projects_images/optimized/ с той же структурой
+папок, а manifest.json хранит SHA-256 исходников и параметры обработки:
+при повторном запуске обрабатываются только изменённые изображения.
+Бот отправляет оптимизированный вариант, если он есть.
+
+Запуск:
+    python -m projects_images.optimize --workers 4
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SOURCE_DIR: Path = Path(__file__).resolve().parent
+OPTIMIZED_DIR: Path = SOURCE_DIR / "optimized"
+MANIFEST_PATH: Path = OPTIMIZED_DIR / "manifest.json"
+EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# Telegram хранит фото не больше 1280 px по длинной стороне (без HD)
+MAX_SIDE = 1280
+QUALITY = 85
+ORIENTATION_TAG = 0x0112
+
+
+def file_hash(path: Path) -> str:
+    """
+    SHA-256 содержимого файла.
+
+    Args:
+        path (Path): Путь к файлу.
+
+    Returns:
+        str: Хэш в hex.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def optimized_path(source: Path) -> Path:
+    """
+    Путь оптимизированного варианта изображения.
+
+    Args:
+        source (Path): Исходное изображение в projects_images.
+
+    Returns:
+        Path: Путь в projects_images/optimized (всегда .jpg).
+    """
+    relative = source.resolve().relative_to(SOURCE_DIR)
+    return (OPTIMIZED_DIR / relative).with_suffix(".jpg")
+
+
+def optimized_variant(source: Path) -> Path:
+    """
+    Возвращает оптимизированный вариант, если он собран, иначе исходник.
+
+    Args:
+        source (Path): Исходное изображение.
+
+    Returns:
+        Path: Файл для отправки.
+    """
+    target = optimized_path(source)
+    return target if target.exists() else source
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """
+    Читает манифест оптимизированных изображений.
+
+    Args:
+        path (Path): Путь к manifest.json.
+
+    Returns:
+        Dict[str, Any]: Манифест; пустой, если файла нет или он повреждён.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def optimize_image(
+        source: Path, target: Path, max_side: int, quality: int
+) -> Dict[str, Any]:
+    """
+    Уменьшает и перекодирует одно изображение (выполняется в пуле процессов).
+
+    Args:
+        source (Path): Исходное изображение.
+        target (Path): Путь результата.
+        max_side (int): Максимальный размер по длинной стороне, px.
+        quality (int): Качество JPEG.
+
+    Returns:
+        Dict[str, Any]: Запись манифеста для изображения.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as image:
+        has_metadata = any(
+            key in image.info for key in ("exif", "xmp", "comment", "photoshop")
+        )
+        keep_tables = (
+            image.format == "JPEG"
+            and image.mode == "RGB"
+            and max(image.size) <= max_side
+            and image.getexif().get(ORIENTATION_TAG, 1) == 1
+        )
+        if keep_tables:
+            # Без изменения размера сохраняем таблицы квантования
+            # исходника: повторное сжатие не ухудшает качество
+            prepared, quality = image, "keep"
+        else:
+            # Поворот по EXIF применяется до удаления метаданных
+            prepared = ImageOps.exif_transpose(image).convert("RGB")
+            prepared.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        # Метаданные (EXIF, ICC, XMP) не передаются — они не сохраняются
+        prepared.save(
+            buffer,
+            format="JPEG",
+            quality=quality,
+            optimize=True,
+            progressive=True,
+        )
+        width, height = prepared.size
+    data = buffer.getvalue()
+    if keep_tables and not has_metadata and source.stat().st_size <= len(data):
+        # Исходник уже оптимален (например, фото, выгруженное из Telegram)
+        data = source.read_bytes()
+    _write_atomic(target, data)
+    return {
+        "source_hash": file_hash(source),
+        "source_bytes": source.stat().st_size,
+        "output": target.relative_to(OPTIMIZED_DIR).as_posix(),
+        "output_hash": hashlib.sha256(data).hexdigest(),
+        "output_bytes": len(data),
+        "width": width,
+        "height": height,
+    }
+
+
+def find_sources(source_dir: Path = SOURCE_DIR) -> List[Path]:
+    """
+    Исходные изображения всех галерей.
+
+    Args:
+        source_dir (Path): Каталог projects_images.
+
+    Returns:
+        List[Path]: Отсортированные пути изображений.
+    """
+    return sorted(
+        path for path in source_dir.rglob("*")
+        if path.suffix.lower() in EXTENSIONS
+        and OPTIMIZED_DIR not in path.parents
+    )
+
+
+def build(
+        workers: Optional[int] = None,
+        max_side: int = MAX_SIDE,
+        quality: int = QUALITY,
+        force: bool = False,
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Оптимизирует изменённые изображения и обновляет манифест.
+
+    Args:
+        workers (Optional[int]): Размер пула процессов; None — число CPU.
+        max_side (int): Максимальный размер по длинной стороне, px.
+        quality (int): Качество JPEG.
+        force (bool): Обработать все изображения заново.
+
+    Returns:
+        Tuple[Dict[str, Any], int]: Новый манифест и число обработанных
+        изображений.
+    """
+    params = {"max_side": max_side, "quality": quality}
+    manifest = load_manifest()
+    previous: Dict[str, Any] = (
+        manifest.get("images", {})
+        if manifest.get("params") == params and not force
+        else {}
+    )
+
+    images: Dict[str, Any] = {}
+    jobs: Dict[str, Tuple[Path, Path]] = {}
+    for source in find_sources():
+        key = source.relative_to(SOURCE_DIR).as_posix()
+        target = optimized_path(source)
+        entry = previous.get(key)
+        if (
+            entry is not None
+            and target.exists()
+            and entry["source_hash"] == file_hash(source)
+        ):
+            images[key] = entry
+        else:
+            jobs[key] = (source, target)
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                key: pool.submit(optimize_image, source, target, max_side, quality)
+                for key, (source, target) in jobs.items()
+            }
+            for key, future in futures.items():
+                images[key] = future.result()
+
+    # Варианты удалённых исходников больше не нужны
+    outputs = {entry["output"] for entry in images.values()}
+    for stale in OPTIMIZED_DIR.rglob("*.jpg"):
+        if stale.relative_to(OPTIMIZED_DIR).as_posix() not in outputs:
+            stale.unlink()
+    for folder in sorted(OPTIMIZED_DIR.rglob("*"), reverse=True):
+        if folder.is_dir() and not any(folder.iterdir()):
+            folder.rmdir()
+
+    manifest = {"params": params, "images": dict(sorted(images.items()))}
+    _write_atomic(
+        MANIFEST_PATH,
+        json.dumps(manifest, ensure_ascii=False, indent=2).encode(),
+    )
+    return manifest, len(jobs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-side", type=int, default=MAX_SIDE)
+    parser.add_argument("--quality", type=int, default=QUALITY)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    manifest, processed = build(
+        workers=args.workers,
+        max_side=args.max_side,
+        quality=args.quality,
+        force=args.force,
+    )
+    images = manifest["images"]
+    source_bytes = sum(entry["source_bytes"] for entry in images.values())
+    output_bytes = sum(entry["output_bytes"] for entry in images.values())
+    print(
+        f"Изображений: {len(images)}, обработано: {processed}, "
+        f"за {time.perf_counter() - started:.2f} с"
+    )
+    print(
+        f"Размер: {source_bytes / 1024:.0f} КБ -> {output_bytes / 1024:.0f} КБ "
+        f"({output_bytes / max(source_bytes, 1):.0%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,13 @@
 Пакет repository.
 
 Реализует репозитории для работы с базой данных.
-Содержит UsersRepository и ReminderRepository для CRUD операций.
+Содержит UsersRepository, ReminderRepository, MediaFilesRepository и OutboxRepository для CRUD операций.
 """
 
 
 from repository.users import UsersRepository
 from repository.reminders import ReminderRepository
+from repository.media_files import MediaFilesRepository
+from repository.outbox import OutboxRepository
 
-__all__ = ["UsersRepository", "ReminderRepository"]
\ No newline at end of file
+__all__ = ["UsersRepository", "ReminderRepository", "MediaFilesRepository", "OutboxRepository"]
\ No newline at end of file
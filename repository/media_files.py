@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import MediaFile
+
+# Ключ файла в кэше: путь и хэш содержимого
+MediaKey = Tuple[str, str]
+
+
+@dataclass
+class MediaFilesRepository:
+    """
+    Репозиторий для работы с кэшем file_id (MediaFile) в базе данных.
+
+    Атрибуты:
+        db_session (AsyncSession): Асинхронная сессия SQLAlchemy для выполнения операций.
+    """
+
+    db_session: AsyncSession
+
+    async def get_file_ids(self, keys: Iterable[MediaKey]) -> Dict[MediaKey, str]:
+        """
+        Получает file_id для набора файлов одним запросом.
+
+        Args:
+            keys (Iterable[MediaKey]): Пары (путь, хэш содержимого).
+
+        Returns:
+            Dict[MediaKey, str]: file_id найденных файлов.
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        query = select(
+            MediaFile.path, MediaFile.content_hash, MediaFile.file_id
+        ).where(tuple_(MediaFile.path, MediaFile.content_hash).in_(keys))
+        rows = (await self.db_session.execute(query)).all()
+        return {(row.path, row.content_hash): row.file_id for row in rows}
+
+    async def save_file_ids(
+            self, records: List[Tuple[str, str, str, str]]
+    ) -> None:
+        """
+        Сохраняет file_id загруженных файлов; существующие записи
+        обновляются.
+
+        Args:
+            records (List[Tuple[str, str, str, str]]): Кортежи
+                (путь, хэш, file_id, file_unique_id).
+        """
+        if not records:
+            return
+        query = insert(MediaFile).values([
+            {
+                "path": path,
+                "content_hash": content_hash,
+                "file_id": file_id,
+                "file_unique_id": file_unique_id,
+            }
+            for path, content_hash, file_id, file_unique_id in records
+        ])
+        query = query.on_conflict_do_update(
+            constraint="uq_media_files_path_hash",
+            set_={
+                "file_id": query.excluded.file_id,
+                "file_unique_id": query.excluded.file_unique_id,
+            },
+        )
+        await self.db_session.execute(query)
+        await self.db_session.commit()
+
+    async def delete_file_ids(self, keys: Iterable[MediaKey]) -> None:
+        """
+        Удаляет записи кэша (например, если Telegram не принял file_id).
+
+        Args:
+            keys (Iterable[MediaKey]): Пары (путь, хэш содержимого).
+        """
+        keys = list(keys)
+        if not keys:
+            return
+        query = delete(MediaFile).where(
+            tuple_(MediaFile.path, MediaFile.content_hash).in_(keys)
+        )
+        await self.db_session.execute(query)
+        await self.db_session.commit()
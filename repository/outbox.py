@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert, select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import OutboxMessage
+from repository.users import UsersRepository
+
+
+@dataclass
+class OutboxRepository:
+    """
+    Репозиторий для работы с исходящими уведомлениями (OutboxMessage).
+
+    Атрибуты:
+        db_session (AsyncSession): Асинхронная сессия SQLAlchemy для выполнения операций.
+    """
+
+    db_session: AsyncSession
+
+    async def add_lead(
+            self,
+            user_id: int,
+            username: Optional[str],
+            kind: str,
+            chat_id: int,
+            payload: Dict[str, Any],
+            updated_date: datetime,
+            status: str,
+            phone_number: Optional[str] = None,
+    ) -> int:
+        """
+        Сохраняет заявку и обновляет данные пользователя в одной
+        транзакции: либо записано всё, либо ничего.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            username (Optional[str]): Имя пользователя Telegram.
+            kind (str): Тип заявки.
+            chat_id (int): Чат администраторов.
+            payload (Dict[str, Any]): Текст уведомления и файлы.
+            updated_date (datetime): Дата последнего взаимодействия.
+            status (str): Новый статус пользователя.
+            phone_number (Optional[str]): Номер телефона, если указан.
+
+        Returns:
+            int: Идентификатор записи outbox.
+        """
+        await UsersRepository(db_session=self.db_session).mark_client_request(
+            user_id, updated_date, status, phone_number
+        )
+        query = insert(OutboxMessage).values(
+            kind=kind,
+            chat_id=chat_id,
+            user_id=user_id,
+            username=username,
+            payload=payload,
+        ).returning(OutboxMessage.id)
+        outbox_id: int = (await self.db_session.execute(query)).scalar_one()
+        await self.db_session.commit()
+        return outbox_id
+
+    async def claim_batch(
+            self, limit: int, lease: float
+    ) -> List[OutboxMessage]:
+        """
+        Забирает готовые к доставке записи.
+
+        Записи блокируются через FOR UPDATE SKIP LOCKED, поэтому
+        диспетчеры нескольких процессов не получают одну запись. Время
+        следующей попытки сдвигается на lease: если процесс завершится
+        во время доставки, запись будет доставлена повторно.
+
+        Args:
+            limit (int): Максимальное число записей.
+            lease (float): Время на доставку, сек.
+
+        Returns:
+            List[OutboxMessage]: Записи в порядке создания.
+        """
+        ready = (
+            select(OutboxMessage.id)
+            .where(
+                OutboxMessage.status == "pending",
+                OutboxMessage.next_attempt_at <= func.now(),
+            )
+            .order_by(OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        query = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ready))
+            .values(
+                attempts=OutboxMessage.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=lease),
+            )
+            .returning(OutboxMessage)
+        )
+        rows = (
+            await self.db_session.execute(
+                select(OutboxMessage).from_statement(query)
+            )
+        ).scalars().all()
+        await self.db_session.commit()
+        return sorted(rows, key=lambda row: row.id)
+
+    async def save_progress(
+            self, outbox_id: int, message_id: int, files_sent: int
+    ) -> None:
+        """
+        Сохраняет частичную доставку, чтобы повтор не дублировал
+        уже отправленное.
+
+        Args:
+            outbox_id (int): Идентификатор записи.
+            message_id (int): Сообщение с текстом заявки.
+            files_sent (int): Число доставленных файлов.
+        """
+        query = update(OutboxMessage).where(
+            OutboxMessage.id == outbox_id
+        ).values(message_id=message_id, files_sent=files_sent)
+        await self.db_session.execute(query)
+        await self.db_session.commit()
+
+    async def mark_sent(self, outbox_id: int) -> None:
+        """
+        Отмечает запись доставленной.
+
+        Args:
+            outbox_id (int): Идентификатор записи.
+        """
+        query = update(OutboxMessage).where(
+            OutboxMessage.id == outbox_id
+        ).values(status="sent", sent_at=func.now(), last_error=None)
+        await self.db_session.execute(query)
+        await self.db_session.commit()
+
+    async def mark_retry(
+            self, outbox_id: int, error: str, delay: Optional[float]
+    ) -> None:
+        """
+        Планирует повтор доставки или, если delay не задан, переводит
+        запись в статус 'failed'.
+
+        Args:
+            outbox_id (int): Идентификатор записи.
+            error (str): Описание ошибки.
+            delay (Optional[float]): Задержка до повтора, сек.
+        """
+        values: Dict[str, Any] = {"last_error": error}
+        if delay is None:
+            values["status"] = "failed"
+        else:
+            values["next_attempt_at"] = func.now() + timedelta(seconds=delay)
+        query = update(OutboxMessage).where(
+            OutboxMessage.id == outbox_id
+        ).values(**values)
+        await self.db_session.execute(query)
+        await self.db_session.commit()
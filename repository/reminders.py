@@ -1,7 +1,9 @@
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import insert, select, and_
+from sqlalchemy import any_, delete, func, select, update, and_
+from sqlalchemy.dialects.postgresql import insert
 from models import Reminder
 
 
@@ -16,17 +18,23 @@ class ReminderRepository:
 
     db_session: AsyncSession
 
-    async def get_reminder(self, message_id: int) -> Optional[Reminder]:
+    async def get_reminder(
+            self, chat_id: int, message_id: int
+    ) -> Optional[Reminder]:
         """
-        Получает напоминание по идентификатору сообщения.
+        Получает напоминание по сообщению Telegram (message_id уникален
+        только в пределах чата).
 
         Args:
+            chat_id (int): Идентификатор чата.
             message_id (int): Идентификатор сообщения Telegram.
 
         Returns:
             Optional[Reminder]: Объект Reminder или None, если не найден.
         """
-        query = select(Reminder).where(Reminder.message_id == message_id)
+        query = select(Reminder).where(
+            Reminder.chat_id == chat_id, Reminder.message_id == message_id
+        )
         return (await self.db_session.execute(query)).scalar_one_or_none()
 
     async def save_reminder(
@@ -35,6 +43,10 @@ class ReminderRepository:
         """
         Сохраняет новое напоминание в базе данных, если оно ещё не существует.
 
+        Выполняется одним запросом INSERT ... ON CONFLICT по уникальному
+        индексу (chat_id, message_id), поэтому безопасно при
+        конкурентной вставке.
+
         Args:
             chat_id (int): Идентификатор чата.
             message_id (int): Идентификатор сообщения.
@@ -44,35 +56,60 @@ class ReminderRepository:
         Returns:
             Reminder: Созданное или существующее напоминание.
         """
-        reminder = await self.get_reminder(message_id)
-        if reminder:
-            return reminder
-
-        query = insert(Reminder).values(
-            chat_id=chat_id,
-            message_id=message_id,
-            type=type_,
-            username=username,
-        ).returning(Reminder.id)
-
-        reminder_id_result: int = (
-            await self.db_session.execute(query)
-        ).scalar()
-        query_select = (select(Reminder)
-                        .where(Reminder.id == reminder_id_result))
-        user = ((await self.db_session.execute(query_select))
-                .scalar_one_or_none())
+        reminders = await self.save_reminders(
+            [(chat_id, message_id, type_, username)]
+        )
+        return reminders[0]
+
+    async def save_reminders(
+            self, records: Sequence[Tuple[int, int, str, str]]
+    ) -> List[Reminder]:
+        """
+        Сохраняет несколько напоминаний одним запросом; уже существующие
+        не изменяются.
+
+        Args:
+            records (Sequence[Tuple[int, int, str, str]]): Кортежи
+                (chat_id, message_id, тип, имя пользователя).
+
+        Returns:
+            List[Reminder]: Созданные или существующие напоминания в
+            порядке records (повторы (chat_id, message_id) — одна запись).
+        """
+        # ON CONFLICT DO UPDATE не может изменить строку дважды за запрос
+        unique: Dict[Tuple[int, int], Tuple[int, int, str, str]] = {}
+        for record in records:
+            unique.setdefault((record[0], record[1]), record)
+        if not unique:
+            return []
+        query = insert(Reminder).values([
+            {
+                "chat_id": chat_id,
+                "message_id": message_id,
+                "type": type_,
+                "username": username,
+            }
+            for chat_id, message_id, type_, username in unique.values()
+        ])
+        # Пустое обновление нужно, чтобы RETURNING вернул и существующие строки
+        query = query.on_conflict_do_update(
+            index_elements=["chat_id", "message_id"],
+            set_={"chat_id": query.excluded.chat_id},
+        ).returning(Reminder)
+        rows = (await self.db_session.execute(query)).scalars().all()
         await self.db_session.commit()
-        return user
+        by_key = {(row.chat_id, row.message_id): row for row in rows}
+        return [by_key[key] for key in unique]
 
-    async def delete_reminder(self, message_id: int):
+    async def delete_reminder(self, chat_id: int, message_id: int):
         """
         Удаляет напоминание по идентификатору сообщения.
 
         Args:
+            chat_id (int): Идентификатор чата.
             message_id (int): Идентификатор сообщения.
         """
-        reminder = await self.get_reminder(message_id)
+        reminder = await self.get_reminder(chat_id, message_id)
         if reminder:
             await self.db_session.delete(reminder)
             await self.db_session.commit()
@@ -93,6 +130,130 @@ class ReminderRepository:
             select(Reminder)
             .where(Reminder.chat_id == chat_id)
             .order_by(Reminder.created_at.desc())
+            .limit(1)
         )
         result = (await self.db_session.execute(query)).scalars().first()
         return result
+
+    async def schedule_reminder(
+            self,
+            reminder_id: int,
+            due_at: datetime,
+            remind_username: Optional[str],
+            request_message_id: Optional[int] = None,
+            notice_message_id: Optional[int] = None,
+    ) -> None:
+        """
+        Назначает время отправки напоминания.
+
+        Args:
+            reminder_id (int): Идентификатор напоминания.
+            due_at (datetime): Время отправки (UTC).
+            remind_username (Optional[str]): Кому адресовано напоминание.
+            request_message_id (Optional[int]): Сообщение с интервалом.
+            notice_message_id (Optional[int]): Сообщение-подтверждение.
+        """
+        query = update(Reminder).where(Reminder.id == reminder_id).values(
+            due_at=due_at,
+            remind_username=remind_username,
+            request_message_id=request_message_id,
+            notice_message_id=notice_message_id,
+        )
+        await self.db_session.execute(query)
+        await self.db_session.commit()
+
+    async def get_scheduled(
+            self, until: datetime
+    ) -> List[Tuple[int, datetime]]:
+        """
+        Получает запланированные напоминания со временем отправки не
+        позднее until (только идентификаторы и время).
+
+        Args:
+            until (datetime): Граница по времени (UTC).
+
+        Returns:
+            List[Tuple[int, datetime]]: Пары (id, due_at).
+        """
+        query = select(Reminder.id, Reminder.due_at).where(
+            Reminder.due_at.is_not(None), Reminder.due_at <= until
+        )
+        return [tuple(row) for row in await self.db_session.execute(query)]
+
+    async def claim_due(
+            self, reminder_ids: Sequence[int], now: datetime, lease_until: datetime
+    ) -> List[Reminder]:
+        """
+        Забирает наступившие напоминания для отправки: время отправки
+        сдвигается на lease_until, поэтому другой процесс их не получит,
+        а при сбое до удаления они будут отправлены повторно.
+
+        Args:
+            reminder_ids (Sequence[int]): Идентификаторы напоминаний.
+            now (datetime): Текущее время (UTC).
+            lease_until (datetime): Время повтора при сбое (UTC).
+
+        Returns:
+            List[Reminder]: Забранные напоминания.
+        """
+        query = (
+            update(Reminder)
+            .where(Reminder.id.in_(reminder_ids), Reminder.due_at <= now)
+            .values(due_at=lease_until)
+            .returning(Reminder)
+        )
+        rows = (
+            await self.db_session.execute(
+                select(Reminder).from_statement(query)
+            )
+        ).scalars().all()
+        await self.db_session.commit()
+        return list(rows)
+
+    async def delete_reminders(self, reminder_ids: Sequence[int]) -> None:
+        """
+        Удаляет отправленные напоминания.
+
+        Args:
+            reminder_ids (Sequence[int]): Идентификаторы напоминаний.
+        """
+        if not reminder_ids:
+            return
+        query = delete(Reminder).where(Reminder.id.in_(reminder_ids))
+        await self.db_session.execute(query)
+        await self.db_session.commit()
+
+    async def delete_expired(self, created_before: datetime, limit: int) -> int:
+        """
+        Удаляет пачку незапланированных напоминаний, созданных раньше
+        created_before.
+
+        Удаляется не больше limit строк за транзакцию, поэтому блокировки
+        держатся недолго; строки, заблокированные другой транзакцией,
+        пропускаются.
+
+        Args:
+            created_before (datetime): Граница по времени создания.
+            limit (int): Размер пачки.
+
+        Returns:
+            int: Число удалённых строк.
+        """
+        expired = (
+            select(Reminder.id)
+            .where(Reminder.due_at.is_(None), Reminder.created_at < created_before)
+            .order_by(Reminder.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        # id = ANY(ARRAY(...)): подзапрос выполняется один раз (InitPlan);
+        # с IN планировщик может выбрать semi join и перезапускать его
+        # для каждой строки
+        result = await self.db_session.execute(
+            delete(Reminder)
+            .where(Reminder.id == any_(func.array(expired)))
+            .execution_options(synchronize_session=False)
+        )
+        await self.db_session.commit()
+        return result.rowcount
@@ -1,13 +1,69 @@
 from dataclasses import dataclass
-from typing import Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import BigInteger, Date, column, or_, select, text, update, values
 
 from models import Users
 
+# Регистрация пачки пользователей одним запросом. В INSERT попадают только
+# новые пользователи и те, у кого изменились логин, имя или фамилия:
+# ON CONFLICT DO UPDATE блокирует конфликтующую строку даже при ложном
+# WHERE, и повторный /start стал бы пишущей транзакцией. Неизменённые
+# строки возвращаются из existing. Пачка передаётся массивами, поэтому
+# текст запроса не зависит от её размера: он компилируется один раз, а
+# asyncpg переиспользует подготовленный запрос (конструкция insert
+# диалекта postgresql в SQLAlchemy не кэшируется).
+REGISTER_USERS = select(Users).from_statement(
+    text(
+        """
+        WITH incoming AS (
+            SELECT *
+            FROM unnest(
+                CAST(:user_ids AS BIGINT[]), CAST(:chat_ids AS BIGINT[]),
+                CAST(:usernames AS VARCHAR[]), CAST(:first_names AS VARCHAR[]),
+                CAST(:last_names AS VARCHAR[])
+            ) AS incoming (user_id, chat_id, username, first_name, last_name)
+        ),
+        existing AS (
+            SELECT user_id, chat_id, username, first_name, last_name,
+                   phone_number, last_updated_date, status
+            FROM users
+            WHERE user_id = ANY(CAST(:user_ids AS BIGINT[]))
+        ),
+        upserted AS (
+            INSERT INTO users (user_id, chat_id, username, first_name, last_name, status)
+            SELECT user_id, chat_id, username, first_name, last_name,
+                   CAST(:status AS VARCHAR)
+            FROM incoming
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM existing
+                WHERE existing.user_id = incoming.user_id
+                  AND (existing.username, existing.first_name, existing.last_name)
+                      IS NOT DISTINCT FROM
+                      (incoming.username, incoming.first_name, incoming.last_name)
+            )
+            ON CONFLICT (user_id) DO UPDATE
+            SET username = excluded.username,
+                first_name = excluded.first_name,
+                last_name = excluded.last_name
+            WHERE (users.username, users.first_name, users.last_name)
+                  IS DISTINCT FROM
+                  (excluded.username, excluded.first_name, excluded.last_name)
+            RETURNING user_id, chat_id, username, first_name, last_name,
+                      phone_number, last_updated_date, status
+        )
+        SELECT * FROM upserted
+        UNION ALL
+        SELECT *
+        FROM existing
+        WHERE user_id NOT IN (SELECT user_id FROM upserted)
+        """
+    ).columns(*Users.__table__.c)
+).execution_options(populate_existing=True)
+
 
 @dataclass
 class UsersRepository:
@@ -24,7 +80,8 @@ class UsersRepository:
         self, user_id: int, chat_id: int, username: str, first_name: str, last_name: str
     ) -> Optional[Users]:
         """
-        Регистрирует нового пользователя. Если пользователь уже существует, возвращает существующую запись.
+        Регистрирует нового пользователя. Если пользователь уже существует, возвращает существующую запись,
+        обновив логин, имя и фамилию, если они изменились.
 
         Args:
             user_id (int): Уникальный идентификатор пользователя.
@@ -36,24 +93,61 @@ class UsersRepository:
         Returns:
             Optional[Users]: Объект пользователя.
         """
-        query = insert(Users).values(
-            user_id=user_id,
-            chat_id=chat_id,
-            username=username,
-            first_name=first_name,
-            last_name=last_name
-        ).on_conflict_do_nothing().returning(Users)
+        users = await self.register_users(
+            [(user_id, chat_id, username, first_name, last_name)]
+        )
+        return users[0] if users else None
 
-        result = await self.db_session.execute(query)
-        user = result.scalar_one_or_none()
+    async def register_users(
+        self, records: Sequence[Tuple[int, int, str, str, str]]
+    ) -> List[Users]:
+        """
+        Регистрирует нескольких пользователей одним запросом.
 
-        if user is None:
-            query_select = select(Users).where(Users.user_id == user_id)
-            user = ((await self.db_session.execute(query_select))
-                    .scalar_one_or_none())
+        Новые пользователи вставляются, у существующих обновляются
+        изменившиеся логин, имя и фамилия (см. REGISTER_USERS); строка
+        всегда возвращается без второго обращения к БД, а повторная
+        регистрация без изменений ничего не записывает.
 
+        Args:
+            records (Sequence[Tuple[int, int, str, str, str]]): Кортежи
+                (user_id, chat_id, логин, имя, фамилия); при повторе
+                user_id используется последний.
+
+        Returns:
+            List[Users]: Пользователи в порядке первого появления user_id.
+        """
+        rows: Dict[int, Tuple[int, int, str, str, str]] = {}
+        for record in records:
+            rows[record[0]] = tuple(record)
+        if not rows:
+            return []
+        result = await self.db_session.execute(
+            REGISTER_USERS,
+            {
+                "user_ids": list(rows),
+                "chat_ids": [row[1] for row in rows.values()],
+                "usernames": [row[2] for row in rows.values()],
+                "first_names": [row[3] for row in rows.values()],
+                "last_names": [row[4] for row in rows.values()],
+                "status": Users.__table__.c.status.default.arg,
+            },
+        )
+        users = {user.user_id: user for user in result.scalars()}
+        missing = [user_id for user_id in rows if user_id not in users]
+        if missing:
+            # Строку вставила параллельная транзакция после начала запроса:
+            # ON CONFLICT её увидел, а снимок UNION ALL — ещё нет
+            users.update(
+                (user.user_id, user)
+                for user in (
+                    await self.db_session.execute(
+                        select(Users).where(Users.user_id.in_(missing))
+                    )
+                ).scalars()
+            )
         await self.db_session.commit()
-        return user
+        return [users[user_id] for user_id in rows if user_id in users]
 
     async def get_user(self, user_id: int) -> Optional[Users]:
         """
@@ -76,18 +170,48 @@ class UsersRepository:
             user_id (int): Идентификатор пользователя.
             updated_date (datetime): Новая дата последнего взаимодействия.
 
+        Returns:
+            Users: Обновлённый пользователь.
+
         Raises:
             ValueError: Если пользователь не найден.
         """
-        user = await self.get_user(user_id)
-        if not user:
-            raise ValueError(f"User with id {user_id} not found")
+        return await self._update_user(user_id, last_updated_date=updated_date)
+
+    async def touch_many(self, touches: Sequence[Tuple[int, date]]) -> int:
+        """
+        Обновляет даты последнего взаимодействия нескольких пользователей
+        одним запросом UPDATE ... FROM (VALUES ...). Более поздняя дата,
+        уже записанная в БД, не перезаписывается.
+
+        Args:
+            touches (Sequence[Tuple[int, date]]): Пары (user_id, дата).
 
-        query = update(Users).where(Users.user_id == user_id).values(
-            last_updated_date=updated_date
+        Returns:
+            int: Число обновлённых строк.
+        """
+        if not touches:
+            return 0
+        touched = values(
+            column("user_id", BigInteger),
+            column("touched", Date),
+            name="touched",
+        ).data(list(touches))
+        query = (
+            update(Users)
+            .where(
+                Users.user_id == touched.c.user_id,
+                or_(
+                    Users.last_updated_date.is_(None),
+                    Users.last_updated_date < touched.c.touched,
+                ),
+            )
+            .values(last_updated_date=touched.c.touched)
+            .execution_options(synchronize_session=False)
         )
-        await self.db_session.execute(query)
+        result = await self.db_session.execute(query)
         await self.db_session.commit()
+        return result.rowcount
 
     async def set_phone_number(self, user_id: int, phone_number: str):
         """
@@ -97,18 +221,13 @@ class UsersRepository:
             user_id (int): Идентификатор пользователя.
             phone_number (str): Номер телефона.
 
+        Returns:
+            Users: Обновлённый пользователь.
+
         Raises:
             ValueError: Если пользователь не найден.
         """
-        user = await self.get_user(user_id)
-        if not user:
-            raise ValueError(f"User with id {user_id} not found")
-
-        query = update(Users).where(Users.user_id == user_id).values(
-            phone_number=phone_number
-        )
-        await self.db_session.execute(query)
-        await self.db_session.commit()
+        return await self._update_user(user_id, phone_number=phone_number)
 
     async def set_client_status(self, user_id: int, status: str):
         """
@@ -118,18 +237,87 @@ class UsersRepository:
             user_id (int): Идентификатор пользователя.
             status (str): Новый статус.
 
+        Returns:
+            Users: Обновлённый пользователь.
+
         Raises:
             ValueError: Если пользователь не найден.
         """
-        user = await self.get_user(user_id)
-        if not user:
-            raise ValueError(f"User with id {user_id} not found")
+        return await self._update_user(user_id, status=status)
+
+    async def record_client_request(
+            self,
+            user_id: int,
+            updated_date: datetime,
+            status: str,
+            phone_number: Optional[str] = None,
+    ) -> Optional[Users]:
+        """
+        Отмечает заявку пользователя одним запросом UPDATE ... RETURNING:
+        дата последнего взаимодействия, статус и (если указан) телефон.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            updated_date (datetime): Дата последнего взаимодействия.
+            status (str): Новый статус.
+            phone_number (Optional[str]): Номер телефона.
+
+        Returns:
+            Optional[Users]: Обновлённый пользователь или None, если он
+            не найден.
+        """
+        user = await self.mark_client_request(
+            user_id, updated_date, status, phone_number
+        )
+        await self.db_session.commit()
+        return user
+
+    async def mark_client_request(
+            self,
+            user_id: int,
+            updated_date: datetime,
+            status: str,
+            phone_number: Optional[str] = None,
+    ) -> Optional[Users]:
+        """
+        То же, что record_client_request, но без фиксации транзакции:
+        для записи заявки вместе с другими изменениями (например,
+        OutboxRepository.add_lead).
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            updated_date (datetime): Дата последнего взаимодействия.
+            status (str): Новый статус.
+            phone_number (Optional[str]): Номер телефона.
+
+        Returns:
+            Optional[Users]: Обновлённый пользователь или None, если он
+            не найден.
+        """
+        values = {"last_updated_date": updated_date, "status": status}
+        if phone_number is not None:
+            values["phone_number"] = phone_number
+        query = (
+            update(Users)
+            .where(Users.user_id == user_id)
+            .values(**values)
+            .returning(Users)
+        )
+        return (await self.db_session.execute(query)).scalar_one_or_none()
 
-        query = update(Users).where(Users.user_id == user_id).values(
-            status=status
+    async def _update_user(self, user_id: int, **values) -> Users:
+        query = (
+            update(Users)
+            .where(Users.user_id == user_id)
+            .values(**values)
+            .returning(Users)
         )
-        await self.db_session.execute(query)
+        user = (await self.db_session.execute(query)).scalar_one_or_none()
+        if user is None:
+            await self.db_session.rollback()
+            raise ValueError(f"User with id {user_id} not found")
         await self.db_session.commit()
+        return user
 
     async def get_inactive_clients(self):
         """
@@ -2,13 +2,20 @@
 Пакет services.
 
 Содержит бизнес-логику приложения.
-Реализует сервисы пользователей (UsersService), напоминаний (ReminderService) и экспорт данных в Excel.
+Реализует сервисы пользователей (UsersService), их кэш в памяти (UserCache, UserCacheNotifier) и отложенную запись их активности (ActivityTracker), напоминаний (ReminderService), их планировщик (ReminderScheduler) и очистку (ReminderCleanup), кэш file_id загруженных файлов (MediaFilesService), индекс галерей проектов (GalleryIndex), доставку заявок администраторам через outbox (OutboxService, OutboxDispatcher) и экспорт данных в Excel.
 """
 
 
+from services.user_cache import user_cache, user_cache_notifier
 from services.users import users_service, UsersService
+from services.activity import activity_tracker
 from services.excel_export import send_users_excel, send_guest_users_excel, send_client_users_excel, send_inactive_client_list
 from services.reminders import reminders_service
+from services.reminder_scheduler import reminder_scheduler
+from services.maintenance import reminder_cleanup
+from services.media_files import media_files_service
+from services.gallery import gallery_index
+from services.outbox import outbox_service, outbox_dispatcher
 
-__all__ = ["users_service", "send_users_excel", "reminders_service", "send_client_users_excel", "send_guest_users_excel", "send_inactive_client_list", "UsersService"]
+__all__ = ["users_service", "send_users_excel", "reminders_service", "send_client_users_excel", "send_guest_users_excel", "send_inactive_client_list", "UsersService", "activity_tracker", "media_files_service", "gallery_index", "outbox_service", "outbox_dispatcher", "reminder_scheduler", "reminder_cleanup", "user_cache", "user_cache_notifier"]
 
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from services.users import UsersService, users_service
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityTracker:
+    """
+    Отложенная запись дат последней активности пользователей.
+
+    touch() только отмечает пользователя в памяти: повторные отметки
+    одного пользователя объединяются, а фоновая задача раз в
+    flush_interval секунд записывает их в БД одним запросом на пачку.
+    Колонка last_updated_date хранит дату, поэтому пользователь, чья дата
+    уже записана сегодня, не попадает даже в пачку. При остановке бота
+    накопленные отметки записываются.
+    """
+
+    def __init__(
+        self,
+        service: UsersService,
+        flush_interval: float,
+        batch_size: int,
+    ) -> None:
+        """
+        Args:
+            service (UsersService): Сервис пользователей.
+            flush_interval (float): Период записи в БД, сек.
+            batch_size (int): Максимум пользователей в одном запросе.
+        """
+        self.service: UsersService = service
+        self.flush_interval: float = flush_interval
+        self.batch_size: int = batch_size
+        self._pending: Dict[int, date] = {}
+        self._flushed: Dict[int, date] = {}
+        self._flushed_day: Optional[date] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def touch(self, user_id: int, day: Optional[date] = None) -> None:
+        """
+        Отмечает активность пользователя (без обращения к БД).
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            day (Optional[date]): Дата активности; по умолчанию сегодня (UTC).
+        """
+        day = day or datetime.now(timezone.utc).date()
+        if self._flushed.get(user_id) == day:
+            return
+        current = self._pending.get(user_id)
+        if current is None or current < day:
+            self._pending[user_id] = day
+
+    async def flush(self) -> int:
+        """
+        Записывает накопленные отметки. При ошибке отметки возвращаются
+        в очередь и будут записаны при следующей попытке.
+
+        Returns:
+            int: Число записанных отметок.
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        touches: List[Tuple[int, date]] = list(pending.items())
+        written = 0
+        try:
+            for start in range(0, len(touches), self.batch_size):
+                batch = touches[start:start + self.batch_size]
+                await self.service.touch_many(batch)
+                self._mark_flushed(batch)
+                written += len(batch)
+        except BaseException:
+            for user_id, day in touches[written:]:
+                self.touch(user_id, day)
+            raise
+        return written
+
+    def _mark_flushed(self, batch: List[Tuple[int, date]]) -> None:
+        today = datetime.now(timezone.utc).date()
+        if self._flushed_day != today:
+            # Вчерашние отметки больше не экономят запросы
+            self._flushed.clear()
+            self._flushed_day = today
+        for user_id, day in batch:
+            if day == today:
+                self._flushed[user_id] = day
+
+    async def start(self) -> None:
+        """
+        Запускает периодическую запись.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="activity-tracker")
+
+    async def stop(self) -> None:
+        """
+        Останавливает периодическую запись и записывает накопленное.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            written = await self.flush()
+            if written:
+                logger.info(f"Activity of {written} users flushed on shutdown")
+        except Exception as e:
+            logger.error(
+                f"Activity of {len(self._pending)} users lost on shutdown: {e}"
+            )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Activity flush failed: {e}", exc_info=True)
+
+
+activity_tracker = ActivityTracker(
+    service=users_service,
+    flush_interval=settings.ACTIVITY_FLUSH_INTERVAL,
+    batch_size=settings.ACTIVITY_FLUSH_BATCH_SIZE,
+)
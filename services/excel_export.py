@@ -1,8 +1,14 @@
-import pandas as pd
 from io import BytesIO
 from aiogram import types
 from aiogram.types import BufferedInputFile
 
+from bot_config import Priority, outbound_priority
+
+# pandas (вместе с numpy и openpyxl) импортируется внутри функций:
+# экспорт вызывается редко, а импорт занимает заметную часть старта бота.
+# Выгрузки отправляются с низким приоритетом и уступают очередь ответам
+# пользователям и заявкам.
+
 
 async def send_users_excel(message: types.Message, db_engine):
     """
@@ -12,15 +18,18 @@ async def send_users_excel(message: types.Message, db_engine):
         message (types.Message): Сообщение Telegram для ответа.
         db_engine: SQLAlchemy engine для чтения из базы.
     """
+    import pandas as pd
+
     df = pd.read_sql("SELECT * FROM users", db_engine)
     output = BytesIO()
     df.to_excel(output, index=False, engine='openpyxl')
     output.seek(0)
 
-    await message.answer("Таблица всех пользователей из базы данных:")
-    await message.answer_document(
-        BufferedInputFile(output.getvalue(), filename="all_users.xlsx")
-    )
+    with outbound_priority(Priority.LOW):
+        await message.answer("Таблица всех пользователей из базы данных:")
+        await message.answer_document(
+            BufferedInputFile(output.getvalue(), filename="all_users.xlsx")
+        )
 
 
 async def send_guest_users_excel(message: types.Message, db_engine):
@@ -31,15 +40,18 @@ async def send_guest_users_excel(message: types.Message, db_engine):
         message (types.Message): Сообщение Telegram.
         db_engine: SQLAlchemy engine для чтения из базы.
     """
+    import pandas as pd
+
     df = pd.read_sql("SELECT * FROM users WHERE status = 'Guest'", db_engine)
     output = BytesIO()
     df.to_excel(output, index=False, engine='openpyxl')
     output.seek(0)
 
-    await message.answer("Таблица клиентов с статусом Guest:")
-    await message.answer_document(
-        BufferedInputFile(output.getvalue(), filename="guests.xlsx")
-    )
+    with outbound_priority(Priority.LOW):
+        await message.answer("Таблица клиентов с статусом Guest:")
+        await message.answer_document(
+            BufferedInputFile(output.getvalue(), filename="guests.xlsx")
+        )
 
 
 async def send_client_users_excel(message: types.Message, db_engine):
@@ -50,15 +62,18 @@ async def send_client_users_excel(message: types.Message, db_engine):
         message (types.Message): Сообщение Telegram.
         db_engine: SQLAlchemy engine для чтения из базы.
     """
+    import pandas as pd
+
     df = pd.read_sql("SELECT * FROM users WHERE status = 'Client'", db_engine)
     output = BytesIO()
     df.to_excel(output, index=False, engine='openpyxl')
     output.seek(0)
 
-    await message.answer("Таблица клиентов с статусом Client:")
-    await message.answer_document(
-        BufferedInputFile(output.getvalue(), filename="clients.xlsx")
-    )
+    with outbound_priority(Priority.LOW):
+        await message.answer("Таблица клиентов с статусом Client:")
+        await message.answer_document(
+            BufferedInputFile(output.getvalue(), filename="clients.xlsx")
+        )
 
 
 async def send_inactive_client_list(message: types.Message, db_engine):
@@ -69,6 +84,8 @@ async def send_inactive_client_list(message: types.Message, db_engine):
         message (types.Message): Сообщение Telegram.
         db_engine: SQLAlchemy engine для чтения из базы.
     """
+    import pandas as pd
+
     df = pd.read_sql(
         "SELECT * FROM users WHERE status = 'Client' AND last_updated_date < NOW() - interval '7 days'",
         db_engine
@@ -77,6 +94,7 @@ async def send_inactive_client_list(message: types.Message, db_engine):
     df.to_excel(output, index=False, engine='openpyxl')
     output.seek(0)
 
-    await message.answer_document(
-        BufferedInputFile(output.getvalue(), filename="inactive.xlsx")
-    )
+    with outbound_priority(Priority.LOW):
+        await message.answer_document(
+            BufferedInputFile(output.getvalue(), filename="inactive.xlsx")
+        )
@@ -0,0 +1,202 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from aiogram.enums import ParseMode
+from aiogram.types import FSInputFile, InputMediaPhoto, ReplyKeyboardMarkup
+
+from projects_images.optimize import SOURCE_DIR, optimized_variant
+from repository.media_files import MediaKey
+from services.media_files import media_files_service
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Состояние файлов галереи на диске: (путь, mtime_ns, размер)
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+@dataclass
+class Gallery:
+    """
+    Галерея проектов: упорядоченный список фотографий с подписью и
+    клавиатурой.
+
+    Атрибуты:
+        folder (str): Папка с изображениями в projects_images.
+        caption (str): Подпись к первой фотографии (Markdown).
+        reply_markup (Optional[ReplyKeyboardMarkup]): Клавиатура.
+        files (List[Tuple[MediaKey, Path]]): Ключи кэша file_id и пути
+            отправляемых файлов (оптимизированных, если они собраны).
+        signature (Signature): Состояние файлов при последней загрузке.
+    """
+
+    folder: str
+    caption: str
+    reply_markup: Optional[ReplyKeyboardMarkup] = None
+    files: List[Tuple[MediaKey, Path]] = field(default_factory=list)
+    signature: Signature = ()
+    _media: Optional[Tuple[Tuple[str, ...], List[InputMediaPhoto]]] = None
+
+    def build_media(
+            self, files: Sequence[Union[str, FSInputFile]]
+    ) -> List[InputMediaPhoto]:
+        """
+        Собирает альбом для send_media_group. Альбом из одних file_id
+        кэшируется и переиспользуется, пока file_id не изменятся.
+
+        Args:
+            files (Sequence[Union[str, FSInputFile]]): Значения поля media.
+
+        Returns:
+            List[InputMediaPhoto]: Альбом.
+        """
+        file_ids = tuple(files) if all(isinstance(f, str) for f in files) else None
+        if file_ids is not None and self._media and self._media[0] == file_ids:
+            return self._media[1]
+        media = []
+        for i, file in enumerate(files):
+            if i == 0:
+                media.append(
+                    InputMediaPhoto(
+                        media=file,
+                        caption=self.caption,
+                        parse_mode=ParseMode.MARKDOWN,
+                        reply_markup=self.reply_markup,
+                    )
+                )
+            else:
+                media.append(InputMediaPhoto(media=file))
+        if file_ids is not None:
+            self._media = (file_ids, media)
+        return media
+
+
+def _scan(folder: Path) -> Tuple[Signature, List[Path]]:
+    """
+    Список изображений папки и их состояние на диске (выполняется в потоке).
+    """
+    paths = []
+    signature = []
+    for source in sorted(folder.glob("*.jpg")):
+        path = optimized_variant(source)
+        stat = path.stat()
+        paths.append(path)
+        signature.append((path.as_posix(), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature), paths
+
+
+class GalleryIndex:
+    """
+    Индекс галерей проектов, построенный при старте бота.
+
+    Обработчик получает готовый список файлов и ключей кэша file_id из
+    памяти, без чтения каталогов. Фоновая задача раз в reload_interval
+    секунд сверяет mtime и размер файлов и перестраивает только
+    изменившиеся галереи.
+    """
+
+    def __init__(self, base_dir: Path, reload_interval: float) -> None:
+        """
+        Args:
+            base_dir (Path): Каталог с папками галерей.
+            reload_interval (float): Период проверки изменений, сек;
+                0 — без перезагрузки.
+        """
+        self.base_dir: Path = base_dir
+        self.reload_interval: float = reload_interval
+        self._galleries: Dict[str, Gallery] = {}
+        self._loaded: bool = False
+        self._task: Optional[asyncio.Task] = None
+
+    def register(
+            self,
+            folder: str,
+            caption: str,
+            reply_markup: Optional[ReplyKeyboardMarkup] = None,
+    ) -> None:
+        """
+        Добавляет галерею в индекс.
+
+        Args:
+            folder (str): Папка с изображениями.
+            caption (str): Подпись к первой фотографии.
+            reply_markup (Optional[ReplyKeyboardMarkup]): Клавиатура.
+        """
+        self._galleries[folder] = Gallery(folder, caption, reply_markup)
+        self._loaded = False
+
+    async def get(self, folder: str) -> Gallery:
+        """
+        Возвращает галерею. Если индекс ещё не построен (бот запущен без
+        startup), он строится при первом обращении.
+
+        Args:
+            folder (str): Папка галереи.
+
+        Returns:
+            Gallery: Галерея.
+        """
+        if not self._loaded:
+            await self.reload()
+        return self._galleries[folder]
+
+    async def reload(self) -> int:
+        """
+        Перестраивает галереи, файлы которых изменились.
+
+        Returns:
+            int: Число перестроенных галерей.
+        """
+        changed = 0
+        for gallery in self._galleries.values():
+            signature, paths = await asyncio.to_thread(
+                _scan, self.base_dir / gallery.folder
+            )
+            if signature == gallery.signature:
+                continue
+            gallery.files = [
+                (await media_files_service.key(path), path) for path in paths
+            ]
+            gallery.signature = signature
+            gallery._media = None
+            changed += 1
+            if self._loaded:
+                logger.info(
+                    f"Gallery {gallery.folder} reloaded: {len(paths)} images"
+                )
+        self._loaded = True
+        return changed
+
+    async def start(self) -> None:
+        """
+        Строит индекс и запускает проверку изменений.
+        """
+        await self.reload()
+        if self.reload_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._watch(), name="gallery-index")
+
+    async def stop(self) -> None:
+        """
+        Останавливает проверку изменений.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.error(f"Gallery reload failed: {e}", exc_info=True)
+
+
+gallery_index = GalleryIndex(
+    base_dir=SOURCE_DIR,
+    reload_interval=settings.GALLERY_RELOAD_INTERVAL,
+)
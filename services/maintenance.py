@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from monitoring.metrics import registry
+from services.reminders import ReminderService, reminders_service
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+reclaimed_rows = registry.counter(
+    "maintenance_rows_reclaimed_total",
+    "Строки, удалённые задачами обслуживания БД",
+    ("table",),
+)
+
+
+class ReminderCleanup:
+    """
+    Периодическая очистка устаревших напоминаний.
+
+    Напоминание удаляется при отправке; если его так и не отложили,
+    строка остаётся в таблице. Задача раз в interval секунд удаляет
+    незапланированные напоминания старше retention пачками по batch_size
+    строк — каждая пачка в отдельной короткой транзакции, с паузой между
+    пачками, чтобы не мешать обработке апдейтов.
+    """
+
+    def __init__(
+        self,
+        service: ReminderService,
+        retention: timedelta,
+        interval: float,
+        batch_size: int,
+        pause: float,
+    ) -> None:
+        """
+        Args:
+            service (ReminderService): Сервис напоминаний.
+            retention (timedelta): Сколько хранить незапланированные
+                напоминания.
+            interval (float): Период запуска очистки, сек; 0 — выключено.
+            batch_size (int): Строк в одной транзакции.
+            pause (float): Пауза между пачками, сек.
+        """
+        self.service: ReminderService = service
+        self.retention: timedelta = retention
+        self.interval: float = interval
+        self.batch_size: int = batch_size
+        self.pause: float = pause
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> int:
+        """
+        Удаляет все устаревшие напоминания пачками.
+
+        Returns:
+            int: Число удалённых строк.
+        """
+        # created_at хранится в локальном времени (datetime.now)
+        created_before = datetime.now() - self.retention
+        started = time.perf_counter()
+        total = 0
+        while True:
+            deleted = await self.service.delete_expired(
+                created_before, self.batch_size
+            )
+            total += deleted
+            reclaimed_rows.inc(deleted, table="reminders")
+            if deleted < self.batch_size:
+                break
+            await asyncio.sleep(self.pause)
+        if total:
+            logger.info(
+                f"Reminder cleanup: {total} rows reclaimed in "
+                f"{time.perf_counter() - started:.2f} s"
+            )
+        return total
+
+    async def start(self) -> None:
+        """
+        Запускает периодическую очистку.
+        """
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="reminder-cleanup")
+
+    async def stop(self) -> None:
+        """
+        Останавливает очистку; прерванная пачка откатывается.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Reminder cleanup failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+
+reminder_cleanup = ReminderCleanup(
+    service=reminders_service,
+    retention=timedelta(days=settings.REMINDER_RETENTION_DAYS),
+    interval=settings.REMINDER_CLEANUP_INTERVAL,
+    batch_size=settings.REMINDER_CLEANUP_BATCH_SIZE,
+    pause=settings.REMINDER_CLEANUP_PAUSE,
+)
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+from aiogram.types import FSInputFile, Message
+
+from database import AsyncSessionFactory
+from projects_images.optimize import file_hash
+from repository import MediaFilesRepository
+from repository.media_files import MediaKey
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR: Path = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class MediaFilesService:
+    """
+    Кэш file_id файлов, уже загруженных в Telegram.
+
+    Telegram возвращает file_id после первой загрузки файла; повторная
+    отправка по file_id не передаёт сам файл. Записи хранятся в Postgres
+    (таблица media_files) и в памяти процесса. Ключ — путь относительно
+    каталога проекта и SHA-256 содержимого, поэтому изменённый файл
+    загружается заново. Хэш пересчитывается только при изменении mtime
+    или размера файла.
+    """
+
+    _file_ids: Dict[MediaKey, str] = field(default_factory=dict)
+    _hashes: Dict[Path, Tuple[int, int, str]] = field(default_factory=dict)
+
+    async def resolve(
+            self, paths: Sequence[Path]
+    ) -> List[Tuple[MediaKey, Union[str, FSInputFile]]]:
+        """
+        Подбирает для каждого файла file_id из кэша или FSInputFile для
+        загрузки.
+
+        Args:
+            paths (Sequence[Path]): Пути к файлам.
+
+        Returns:
+            List[Tuple[MediaKey, Union[str, FSInputFile]]]: Ключ кэша и
+            значение поля media для каждого файла.
+        """
+        return await self.resolve_keyed(
+            [(await self.key(path), path) for path in paths]
+        )
+
+    async def resolve_keyed(
+            self, files: Sequence[Tuple[MediaKey, Path]]
+    ) -> List[Tuple[MediaKey, Union[str, FSInputFile]]]:
+        """
+        То же, что resolve, для файлов с уже вычисленным ключом: если все
+        file_id есть в памяти, обращений к диску и базе нет.
+
+        Args:
+            files (Sequence[Tuple[MediaKey, Path]]): Ключи и пути файлов.
+
+        Returns:
+            List[Tuple[MediaKey, Union[str, FSInputFile]]]: Ключ кэша и
+            значение поля media для каждого файла.
+        """
+        missing = [key for key, _ in files if key not in self._file_ids]
+        if missing:
+            try:
+                async with AsyncSessionFactory() as session:
+                    repo = MediaFilesRepository(db_session=session)
+                    self._file_ids.update(await repo.get_file_ids(missing))
+            except Exception as e:
+                # Без базы файлы просто загружаются заново
+                logger.warning(f"Media cache lookup failed: {e}")
+        return [
+            (key, self._file_ids.get(key) or FSInputFile(path))
+            for key, path in files
+        ]
+
+    async def remember(
+            self, keys: Sequence[MediaKey], messages: Sequence[Message]
+    ) -> None:
+        """
+        Сохраняет file_id фотографий из отправленных сообщений.
+
+        Args:
+            keys (Sequence[MediaKey]): Ключи в порядке отправки.
+            messages (Sequence[Message]): Сообщения, вернувшиеся от Telegram.
+        """
+        records = []
+        for key, sent in zip(keys, messages):
+            if not sent.photo:
+                continue
+            photo = sent.photo[-1]
+            if self._file_ids.get(key) == photo.file_id:
+                continue
+            self._file_ids[key] = photo.file_id
+            records.append((*key, photo.file_id, photo.file_unique_id))
+        if not records:
+            return
+        try:
+            async with AsyncSessionFactory() as session:
+                repo = MediaFilesRepository(db_session=session)
+                await repo.save_file_ids(records)
+        except Exception as e:
+            logger.warning(f"Media cache save failed: {e}")
+
+    async def forget(self, keys: Sequence[MediaKey]) -> None:
+        """
+        Удаляет file_id, которые Telegram перестал принимать.
+
+        Args:
+            keys (Sequence[MediaKey]): Ключи кэша.
+        """
+        for key in keys:
+            self._file_ids.pop(key, None)
+        try:
+            async with AsyncSessionFactory() as session:
+                repo = MediaFilesRepository(db_session=session)
+                await repo.delete_file_ids(keys)
+        except Exception as e:
+            logger.warning(f"Media cache delete failed: {e}")
+
+    async def key(self, path: Path) -> MediaKey:
+        """
+        Ключ кэша файла: путь относительно каталога проекта и SHA-256
+        содержимого.
+
+        Args:
+            path (Path): Путь к файлу.
+
+        Returns:
+            MediaKey: Ключ кэша.
+        """
+        stat = path.stat()
+        cached = self._hashes.get(path)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            content_hash = await asyncio.to_thread(file_hash, path)
+            cached = (stat.st_mtime_ns, stat.st_size, content_hash)
+            self._hashes[path] = cached
+        return path.resolve().relative_to(BASE_DIR).as_posix(), cached[2]
+
+media_files_service = MediaFilesService()
@@ -0,0 +1,330 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from bot_config import Priority, outbound_priority, telegram_client
+from bot_config.resilience import Backoff
+from bot_config.telegram_client import TelegramRawClient
+from database import AsyncSessionFactory
+from keyboards import remind_kb
+from models import OutboxMessage
+from repository import OutboxRepository
+from services.reminders import reminders_service
+from services.user_cache import user_cache
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+FILE_METHODS = {
+    "photo": "sendPhoto",
+    "video": "sendVideo",
+    "document": "sendDocument",
+    "voice": "sendVoice",
+    "video_note": "sendVideoNote",
+}
+
+
+class OutboxDeliveryError(Exception):
+    """
+    Ошибка доставки уведомления; доставка будет повторена.
+    """
+
+
+@dataclass
+class OutboxService:
+    """
+    Сервис для работы с исходящими уведомлениями о заявках. Обеспечивает
+    доступ к OutboxRepository через асинхронные сессии базы данных.
+    """
+
+    async def enqueue_lead(
+            self,
+            user_id: int,
+            username: Optional[str],
+            kind: str,
+            text: str,
+            files: Optional[List[Tuple[str, str]]] = None,
+            phone_number: Optional[str] = None,
+    ) -> int:
+        """
+        Сохраняет заявку для доставки администраторам вместе с
+        обновлением данных пользователя (дата активности, статус
+        "Client", телефон).
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            username (Optional[str]): Имя пользователя Telegram.
+            kind (str): Тип заявки ('callback' или 'problem').
+            text (str): Текст уведомления.
+            files (Optional[List[Tuple[str, str]]]): Файлы заявки
+                (тип, file_id).
+            phone_number (Optional[str]): Номер телефона.
+
+        Returns:
+            int: Идентификатор записи outbox.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = OutboxRepository(db_session=session)
+            message_id = await repo.add_lead(
+                user_id=user_id,
+                username=username,
+                kind=kind,
+                chat_id=settings.ADMIN_CHAT_ID,
+                payload={"text": text, "files": files or []},
+                updated_date=datetime.now(timezone.utc),
+                status="Client",
+                phone_number=phone_number,
+            )
+        # add_lead обновляет пользователя в той же транзакции
+        user_cache.invalidate([user_id])
+        return message_id
+
+    async def claim_batch(self, limit: int, lease: float) -> List[OutboxMessage]:
+        """
+        Забирает записи, готовые к доставке.
+
+        Args:
+            limit (int): Максимальное число записей.
+            lease (float): Время на доставку, сек.
+
+        Returns:
+            List[OutboxMessage]: Записи в порядке создания.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = OutboxRepository(db_session=session)
+            return await repo.claim_batch(limit, lease)
+
+    async def save_progress(
+            self, outbox_id: int, message_id: int, files_sent: int
+    ) -> None:
+        """
+        Сохраняет частичную доставку.
+
+        Args:
+            outbox_id (int): Идентификатор записи.
+            message_id (int): Сообщение с текстом заявки.
+            files_sent (int): Число доставленных файлов.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = OutboxRepository(db_session=session)
+            await repo.save_progress(outbox_id, message_id, files_sent)
+
+    async def mark_sent(self, outbox_id: int) -> None:
+        """
+        Отмечает запись доставленной.
+
+        Args:
+            outbox_id (int): Идентификатор записи.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = OutboxRepository(db_session=session)
+            await repo.mark_sent(outbox_id)
+
+    async def mark_retry(
+            self, outbox_id: int, error: str, delay: Optional[float]
+    ) -> None:
+        """
+        Планирует повтор доставки; без delay запись переводится в 'failed'.
+
+        Args:
+            outbox_id (int): Идентификатор записи.
+            error (str): Описание ошибки.
+            delay (Optional[float]): Задержка до повтора, сек.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = OutboxRepository(db_session=session)
+            await repo.mark_retry(outbox_id, error, delay)
+
+
+def _is_fatal(response: Dict[str, Any]) -> bool:
+    """
+    Ответ 4xx (кроме 429): повтор не поможет.
+    """
+    code = response.get("error_code") or 0
+    return 400 <= code < 500 and code != 429
+
+
+class OutboxDispatcher:
+    """
+    Фоновая доставка уведомлений о заявках в админ-группу.
+
+    Диспетчер забирает пачки записей outbox и доставляет их по порядку
+    с приоритетом HIGH. Семантика — at-least-once: запись отмечается
+    доставленной только после отправки, а при сбое процесса доставляется
+    повторно по истечении lease. Прогресс (текст отправлен, сколько
+    файлов доставлено) сохраняется, поэтому повтор не дублирует
+    отправленное. Ошибки повторяются с экспоненциальной задержкой, после
+    max_attempts попыток запись переводится в 'failed'.
+    """
+
+    def __init__(
+        self,
+        service: OutboxService,
+        client: TelegramRawClient,
+        batch_size: int,
+        poll_interval: float,
+        lease: float,
+        max_attempts: int,
+        backoff: Backoff,
+    ) -> None:
+        """
+        Args:
+            service (OutboxService): Сервис outbox.
+            client (TelegramRawClient): Клиент Telegram API.
+            batch_size (int): Размер пачки.
+            poll_interval (float): Период опроса таблицы, сек.
+            lease (float): Время на доставку одной пачки, сек.
+            max_attempts (int): Число попыток доставки записи.
+            backoff (Backoff): Задержка между попытками.
+        """
+        self.service: OutboxService = service
+        self.client: TelegramRawClient = client
+        self.batch_size: int = batch_size
+        self.poll_interval: float = poll_interval
+        self.lease: float = lease
+        self.max_attempts: int = max_attempts
+        self.backoff: Backoff = backoff
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: bool = False
+
+    def notify(self) -> None:
+        """
+        Будит диспетчер после записи новой заявки.
+        """
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """
+        Запускает фоновую доставку.
+        """
+        if self._task is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="outbox-dispatcher")
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Останавливает доставку, дождавшись текущей пачки. Недоставленные
+        записи остаются в таблице и будут доставлены после перезапуска.
+
+        Args:
+            timeout (Optional[float]): Максимальное время ожидания, сек.
+        """
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def run_once(self) -> int:
+        """
+        Забирает и доставляет одну пачку.
+
+        Returns:
+            int: Число забранных записей.
+        """
+        batch = await self.service.claim_batch(self.batch_size, self.lease)
+        for row in batch:
+            try:
+                await self._deliver(row)
+                await self.service.mark_sent(row.id)
+            except Exception as e:
+                await self._fail(row, e)
+        return len(batch)
+
+    async def _deliver(self, row: OutboxMessage) -> None:
+        message_id = row.message_id
+        files_sent = row.files_sent
+        # Заявки клиентов отправляются раньше остальных сообщений
+        with outbound_priority(Priority.HIGH):
+            if message_id is None:
+                response = await self.client.post(
+                    method="sendMessage",
+                    chat_id=row.chat_id,
+                    text=row.payload["text"],
+                    reply_markup=remind_kb,
+                )
+                if not response.get("ok"):
+                    raise OutboxDeliveryError(f"sendMessage: {response}")
+                message_id = response["result"]["message_id"]
+                await self.service.save_progress(row.id, message_id, files_sent)
+            # Сохранение идемпотентно и повторяется при каждой попытке:
+            # если оно не удалось после отправки, повтор доставки
+            # сообщение не отправит, а напоминание сохранит
+            await reminders_service.save_reminder(
+                chat_id=row.chat_id,
+                message_id=message_id,
+                type_=row.kind,
+                username=row.username,
+            )
+            for file_type, file_id in row.payload["files"][files_sent:]:
+                response = await self.client.post(
+                    method=FILE_METHODS[file_type],
+                    chat_id=row.chat_id,
+                    **{file_type: file_id},
+                )
+                if not response.get("ok"):
+                    if not _is_fatal(response):
+                        raise OutboxDeliveryError(f"{file_type}: {response}")
+                    logger.error(
+                        f"File of lead {row.id} rejected by Telegram, "
+                        f"skipped: {response}"
+                    )
+                files_sent += 1
+                await self.service.save_progress(row.id, message_id, files_sent)
+        logger.info(f"Lead {row.id} ({row.kind}) delivered to {row.chat_id}")
+
+    async def _fail(self, row: OutboxMessage, error: Exception) -> None:
+        if row.attempts >= self.max_attempts:
+            logger.error(
+                f"Lead {row.id} not delivered after {row.attempts} attempts: "
+                f"{error}"
+            )
+            delay = None
+        else:
+            delay = self.backoff.delay(row.attempts - 1)
+            logger.warning(
+                f"Lead {row.id} delivery failed (attempt {row.attempts}), "
+                f"retry in {delay:.1f} s: {error}"
+            )
+        try:
+            await self.service.mark_retry(row.id, str(error), delay)
+        except Exception as e:
+            # Запись будет повторена по истечении lease
+            logger.error(f"Failed to reschedule lead {row.id}: {e}")
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Outbox dispatch failed: {e}", exc_info=True)
+                claimed = 0
+            if claimed >= self.batch_size or self._stopping:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+outbox_service = OutboxService()
+outbox_dispatcher = OutboxDispatcher(
+    service=outbox_service,
+    client=telegram_client,
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_INTERVAL,
+    lease=settings.OUTBOX_LEASE_TIMEOUT,
+    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+    backoff=Backoff(settings.OUTBOX_RETRY_BASE, settings.OUTBOX_RETRY_MAX),
+)
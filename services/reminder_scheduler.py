@@ -0,0 +1,217 @@
+import asyncio
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest
+
+from models import Reminder
+from services.reminders import ReminderService, reminders_service
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def utcnow() -> datetime:
+    """
+    Текущее время UTC без часового пояса (формат колонки due_at).
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class ReminderScheduler:
+    """
+    Планировщик отложенных напоминаний администраторам.
+
+    Время отправки хранится в reminders.due_at, поэтому перезапуск бота
+    не теряет напоминания. Один цикл держит min-heap ближайших
+    напоминаний (только id и время) — в пределах horizon секунд; более
+    дальние подгружаются из БД при очередном обновлении, так что память
+    не растёт с числом напоминаний. Наступившие напоминания забираются из
+    БД пачкой с lease: если процесс завершится до отправки, напоминание
+    будет отправлено повторно.
+    """
+
+    def __init__(
+        self,
+        service: ReminderService,
+        horizon: float,
+        batch_size: int,
+        lease: float,
+    ) -> None:
+        """
+        Args:
+            service (ReminderService): Сервис напоминаний.
+            horizon (float): Насколько вперёд напоминания держатся в
+                памяти, сек; обновление из БД — раз в horizon / 2.
+            batch_size (int): Максимум напоминаний в пачке.
+            lease (float): Время до повторной отправки при сбое, сек.
+        """
+        self.service: ReminderService = service
+        self.horizon: float = horizon
+        self.batch_size: int = batch_size
+        self.lease: float = lease
+        self._heap: List[Tuple[datetime, int]] = []
+        self._scheduled: Dict[int, datetime] = {}
+        self._loaded_until: datetime = datetime.min
+        self._bot: Optional[Bot] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: bool = False
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    async def schedule(
+            self,
+            reminder_id: int,
+            delay: float,
+            remind_username: Optional[str],
+            request_message_id: Optional[int] = None,
+            notice_message_id: Optional[int] = None,
+    ) -> datetime:
+        """
+        Сохраняет время отправки напоминания и добавляет его в очередь.
+
+        Args:
+            reminder_id (int): Идентификатор напоминания.
+            delay (float): Задержка до отправки, сек.
+            remind_username (Optional[str]): Кому адресовано напоминание.
+            request_message_id (Optional[int]): Сообщение с интервалом.
+            notice_message_id (Optional[int]): Сообщение-подтверждение.
+
+        Returns:
+            datetime: Время отправки (UTC).
+        """
+        due_at = utcnow() + timedelta(seconds=delay)
+        await self.service.schedule_reminder(
+            reminder_id, due_at, remind_username,
+            request_message_id, notice_message_id,
+        )
+        if due_at <= self._loaded_until:
+            self._push(reminder_id, due_at)
+        return due_at
+
+    async def start(self, bot: Bot) -> None:
+        """
+        Загружает ближайшие напоминания из БД и запускает цикл отправки.
+
+        Args:
+            bot (Bot): Экземпляр бота (передаётся Dispatcher при startup).
+        """
+        if self._task is None:
+            self._bot = bot
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            await self._refresh()
+            self._task = asyncio.create_task(self._run(), name="reminder-scheduler")
+            logger.info(f"Reminder scheduler started: {len(self)} upcoming")
+
+    async def stop(self) -> None:
+        """
+        Останавливает цикл. Запланированные напоминания остаются в БД.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _push(self, reminder_id: int, due_at: datetime) -> None:
+        if self._scheduled.get(reminder_id) == due_at:
+            return
+        # Прежняя запись в куче с другим временем игнорируется при извлечении
+        self._scheduled[reminder_id] = due_at
+        heapq.heappush(self._heap, (due_at, reminder_id))
+        if self._wakeup is not None and self._heap[0][1] == reminder_id:
+            self._wakeup.set()
+
+    async def _refresh(self) -> None:
+        until = utcnow() + timedelta(seconds=self.horizon)
+        for reminder_id, due_at in await self.service.get_scheduled(until):
+            self._push(reminder_id, due_at)
+        self._loaded_until = until
+
+    def _pop_due(self, now: datetime) -> List[int]:
+        due: List[int] = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            due_at, reminder_id = heapq.heappop(self._heap)
+            if self._scheduled.get(reminder_id) == due_at:
+                del self._scheduled[reminder_id]
+                due.append(reminder_id)
+        return due
+
+    async def _fire(self, reminder_ids: List[int]) -> None:
+        now = utcnow()
+        lease_until = now + timedelta(seconds=self.lease)
+        reminders = await self.service.claim_due(reminder_ids, now, lease_until)
+        done: List[int] = []
+        for reminder in reminders:
+            try:
+                await self._send(reminder)
+                done.append(reminder.id)
+            except TelegramBadRequest as e:
+                # Сообщение заявки удалено: повтор не поможет
+                logger.error(f"Reminder {reminder.id} dropped: {e}")
+                done.append(reminder.id)
+            except Exception as e:
+                logger.error(
+                    f"Reminder {reminder.id} failed, retry in {self.lease} s: {e}"
+                )
+                # claim_due уже перенёс due_at на lease_until
+                self._push(reminder.id, lease_until)
+        await self.service.delete_reminders(done)
+
+    async def _send(self, reminder: Reminder) -> None:
+        for message_id in (reminder.request_message_id, reminder.notice_message_id):
+            if message_id is None:
+                continue
+            try:
+                await self._bot.delete_message(reminder.chat_id, message_id)
+            except TelegramBadRequest:
+                # Сообщение уже удалено (например, при повторной отправке)
+                pass
+        await self._bot.send_message(
+            chat_id=reminder.chat_id,
+            text=(
+                f"⏰@{reminder.remind_username}, напоминаю "
+                "об отложенном обращении клиента!"
+            ),
+            reply_to_message_id=reminder.message_id,
+        )
+
+    async def _run(self) -> None:
+        refresh_interval = timedelta(seconds=self.horizon / 2)
+        next_refresh = utcnow() + refresh_interval
+        while not self._stopping:
+            self._wakeup.clear()
+            now = utcnow()
+            try:
+                if now >= next_refresh:
+                    next_refresh = now + refresh_interval
+                    await self._refresh()
+                due = self._pop_due(now)
+                if due:
+                    await self._fire(due)
+                    continue
+            except Exception as e:
+                logger.error(f"Reminder scheduler failed: {e}", exc_info=True)
+            wake_at = next_refresh
+            if self._heap:
+                wake_at = min(wake_at, self._heap[0][0])
+            timeout = max((wake_at - utcnow()).total_seconds(), 0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+reminder_scheduler = ReminderScheduler(
+    service=reminders_service,
+    horizon=settings.REMINDER_HORIZON,
+    batch_size=settings.REMINDER_BATCH_SIZE,
+    lease=settings.REMINDER_LEASE_TIMEOUT,
+)
@@ -1,8 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 import logging
 
 from database import AsyncSessionFactory
+from models import Reminder
 from repository import ReminderRepository
+from settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +16,18 @@ class ReminderService:
     """
     Сервис для работы с напоминаниями. Обеспечивает доступ к
     ReminderRepository через асинхронные сессии базы данных.
+
+    Если track_last включён, сервис держит в памяти последнее
+    напоминание каждого чата и обновляет его при сохранении и удалении
+    напоминаний, так что get_last_reminder_by_chat обращается к БД только
+    для чата, которого ещё нет в индексе. Индекс верен, только если все
+    записи в reminders проходят через этот процесс (один процесс бота).
     """
 
+    track_last: bool = True
+    _last_by_chat: Dict[int, Optional[Reminder]] = field(default_factory=dict)
+    _version: int = 0
+
     async def get_last_reminder_by_chat(self, chat_id: int):
         """
         Получает последнее напоминание для заданного чата.
@@ -24,9 +38,16 @@ class ReminderService:
         Returns:
             Reminder | None: Последнее напоминание или None.
         """
+        if self.track_last and chat_id in self._last_by_chat:
+            return self._last_by_chat[chat_id]
+        version = self._version
         async with AsyncSessionFactory() as session:
             repo = ReminderRepository(db_session=session)
-            return await repo.get_last_reminder_by_chat(chat_id)
+            reminder = await repo.get_last_reminder_by_chat(chat_id)
+        # Результат устарел, если за время запроса напоминания менялись
+        if self.track_last and version == self._version:
+            self._last_by_chat[chat_id] = reminder
+        return reminder
 
     async def save_reminder(
             self, chat_id: int, message_id: int, type_: str, username: str
@@ -45,21 +66,159 @@ class ReminderService:
         """
         async with AsyncSessionFactory() as session:
             repo = ReminderRepository(db_session=session)
-            return await repo.save_reminder(
+            reminder = await repo.save_reminder(
                 chat_id, message_id, type_, username
             )
+        self._remember([reminder])
+        return reminder
+
+    async def save_reminders(
+            self, records: Sequence[Tuple[int, int, str, str]]
+    ):
+        """
+        Сохраняет несколько напоминаний одним запросом.
+
+        Args:
+            records (Sequence[Tuple[int, int, str, str]]): Кортежи
+                (chat_id, message_id, тип, имя пользователя).
+
+        Returns:
+            list[Reminder]: Сохранённые или найденные напоминания.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = ReminderRepository(db_session=session)
+            reminders = await repo.save_reminders(records)
+        self._remember(reminders)
+        return reminders
+
+    async def delete_reminder(self, chat_id: int, message_id: int):
+        """
+        Удаляет напоминание по сообщению Telegram.
+
+        Args:
+            chat_id (int): Идентификатор чата.
+            message_id (int): message_id напоминания.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = ReminderRepository(db_session=session)
+            await repo.delete_reminder(chat_id, message_id)
+        self._forget(
+            lambda reminder: (reminder.chat_id, reminder.message_id)
+            == (chat_id, message_id)
+        )
+
+    async def schedule_reminder(
+            self,
+            reminder_id: int,
+            due_at: datetime,
+            remind_username: Optional[str],
+            request_message_id: Optional[int] = None,
+            notice_message_id: Optional[int] = None,
+    ) -> None:
+        """
+        Назначает время отправки напоминания.
+
+        Args:
+            reminder_id (int): Идентификатор напоминания.
+            due_at (datetime): Время отправки (UTC).
+            remind_username (Optional[str]): Кому адресовано напоминание.
+            request_message_id (Optional[int]): Сообщение с интервалом.
+            notice_message_id (Optional[int]): Сообщение-подтверждение.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = ReminderRepository(db_session=session)
+            await repo.schedule_reminder(
+                reminder_id, due_at, remind_username,
+                request_message_id, notice_message_id,
+            )
+
+    async def get_scheduled(self, until: datetime) -> List[Tuple[int, datetime]]:
+        """
+        Получает запланированные напоминания до момента until.
+
+        Args:
+            until (datetime): Граница по времени (UTC).
 
+        Returns:
+            List[Tuple[int, datetime]]: Пары (id, due_at).
+        """
+        async with AsyncSessionFactory() as session:
+            repo = ReminderRepository(db_session=session)
+            return await repo.get_scheduled(until)
 
-    async def delete_reminder(self, reminder_id: int):
+    async def claim_due(
+            self, reminder_ids: Sequence[int], now: datetime, lease_until: datetime
+    ):
         """
-        Удаляет напоминание по идентификатору.
+        Забирает наступившие напоминания для отправки.
 
         Args:
-            reminder_id (int): message_id напоминания.
+            reminder_ids (Sequence[int]): Идентификаторы напоминаний.
+            now (datetime): Текущее время (UTC).
+            lease_until (datetime): Время повтора при сбое (UTC).
+
+        Returns:
+            list[Reminder]: Забранные напоминания.
         """
         async with AsyncSessionFactory() as session:
             repo = ReminderRepository(db_session=session)
-            return await repo.delete_reminder(reminder_id)
+            return await repo.claim_due(reminder_ids, now, lease_until)
+
+    async def delete_reminders(self, reminder_ids: Sequence[int]) -> None:
+        """
+        Удаляет отправленные напоминания.
+
+        Args:
+            reminder_ids (Sequence[int]): Идентификаторы напоминаний.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = ReminderRepository(db_session=session)
+            await repo.delete_reminders(reminder_ids)
+        deleted = set(reminder_ids)
+        self._forget(lambda reminder: reminder.id in deleted)
+
+    async def delete_expired(self, created_before: datetime, limit: int) -> int:
+        """
+        Удаляет пачку устаревших незапланированных напоминаний.
+
+        Args:
+            created_before (datetime): Граница по времени создания.
+            limit (int): Размер пачки.
+
+        Returns:
+            int: Число удалённых строк.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = ReminderRepository(db_session=session)
+            deleted = await repo.delete_expired(created_before, limit)
+        if deleted:
+            self._forget(
+                lambda reminder: reminder.due_at is None
+                and reminder.created_at < created_before
+            )
+        return deleted
+
+    def _remember(self, reminders: Iterable[Reminder]) -> None:
+        self._version += 1
+        for reminder in reminders:
+            if reminder.chat_id not in self._last_by_chat:
+                # Чат не загружен: в БД могут быть более новые напоминания
+                continue
+            current = self._last_by_chat[reminder.chat_id]
+            if current is None or (reminder.created_at, reminder.id) >= (
+                current.created_at, current.id
+            ):
+                self._last_by_chat[reminder.chat_id] = reminder
+
+    def _forget(self, deleted: Callable[[Reminder], bool]) -> None:
+        # Предыдущее напоминание чата неизвестно: будет загружено из БД
+        self._version += 1
+        for chat_id, reminder in list(self._last_by_chat.items()):
+            if reminder is not None and deleted(reminder):
+                del self._last_by_chat[chat_id]
 
 
-reminders_service = ReminderService()
+# С несколькими процессами напоминания сохраняет и удаляет любой из них
+reminders_service = ReminderService(
+    track_last=settings.REMINDER_LAST_INDEX and settings.SHARDS <= 1
+)
@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple
+
+import asyncpg
+
+from models import Users
+from monitoring.metrics import Sample, registry
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+cache_requests = registry.counter(
+    "user_cache_requests_total",
+    "Обращения к кэшу пользователей",
+    ("result",),
+)
+
+# Предел полезной нагрузки NOTIFY — 8000 байт
+NOTIFY_CHUNK = 500
+
+
+class UserCache:
+    """
+    Кэш строк users в памяти процесса: не более max_size записей,
+    вытесняются давно не использованные (LRU); запись живёт не дольше
+    ttl секунд.
+
+    Сервис пользователей кладёт в кэш строки, возвращённые запросами
+    (в том числе UPDATE ... RETURNING), и сбрасывает записи пользователей,
+    изменённых без возврата строки. Сброс передаётся в on_invalidate —
+    через него UserCacheNotifier рассылает его другим процессам.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """
+        Args:
+            max_size (int): Максимум записей; 0 — кэш выключен.
+            ttl (float): Время жизни записи, сек.
+        """
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self.on_invalidate: Optional[Callable[[List[int]], None]] = None
+        self._entries: "OrderedDict[int, Tuple[float, Users]]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._version: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    @property
+    def version(self) -> int:
+        """
+        Номер версии кэша; меняется при каждом сбросе записей. Строку,
+        прочитанную из БД, кладут в кэш, только если версия за время
+        запроса не изменилась.
+        """
+        return self._version
+
+    def get(self, user_id: int) -> Optional[Users]:
+        """
+        Возвращает пользователя из кэша.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            Optional[Users]: Пользователь или None, если записи нет или
+            она устарела.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(user_id)
+            self._hits += 1
+            cache_requests.inc(result="hit")
+            return entry[1]
+        if entry is not None:
+            del self._entries[user_id]
+        self._misses += 1
+        cache_requests.inc(result="miss")
+        return None
+
+    def put(self, user: Optional[Users], version: Optional[int] = None) -> None:
+        """
+        Кладёт пользователя в кэш.
+
+        Args:
+            user (Optional[Users]): Пользователь; None игнорируется.
+            version (Optional[int]): Версия кэша до чтения строки из БД;
+                если с тех пор записи сбрасывались, строка может быть
+                устаревшей и не кэшируется.
+        """
+        if not self.enabled or user is None:
+            return
+        if version is not None and version != self._version:
+            return
+        self._entries[user.user_id] = (time.monotonic() + self.ttl, user)
+        self._entries.move_to_end(user.user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[int], publish: bool = True) -> None:
+        """
+        Сбрасывает записи пользователей.
+
+        Args:
+            user_ids (Iterable[int]): Идентификаторы пользователей.
+            publish (bool): Передать сброс в on_invalidate (другим
+                процессам).
+        """
+        user_ids = list(user_ids)
+        self._version += 1
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+        if publish and user_ids and self.on_invalidate is not None:
+            self.on_invalidate(user_ids)
+
+    def clear(self) -> None:
+        """
+        Сбрасывает все записи.
+        """
+        self._version += 1
+        self._entries.clear()
+
+    def collect(self) -> Iterable[Sample]:
+        """
+        Сэмплы состояния кэша для реестра метрик.
+        """
+        total = self._hits + self._misses
+        yield "user_cache_size", {}, len(self._entries)
+        yield "user_cache_hit_ratio", {}, self._hits / total if total else 0.0
+
+
+class UserCacheNotifier:
+    """
+    Общий сброс кэша пользователей для нескольких процессов через
+    Postgres LISTEN/NOTIFY.
+
+    Держит отдельное соединение asyncpg: слушает канал channel и
+    сбрасывает записи пользователей, изменённых другими процессами, а
+    собственные сбросы кэша копит и отправляет пачками через pg_notify.
+    После потери соединения уведомления могли быть пропущены, поэтому
+    при переподключении кэш очищается целиком.
+    """
+
+    def __init__(self, cache: UserCache, channel: str, enabled: bool) -> None:
+        """
+        Args:
+            cache (UserCache): Кэш пользователей.
+            channel (str): Канал LISTEN/NOTIFY.
+            enabled (bool): Включён ли общий сброс.
+        """
+        self.cache: UserCache = cache
+        self.channel: str = channel
+        self.enabled: bool = enabled
+        self._pending: Set[int] = set()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def publish(self, user_ids: List[int]) -> None:
+        """
+        Ставит сброс в очередь на отправку (без обращения к БД).
+
+        Args:
+            user_ids (List[int]): Идентификаторы пользователей.
+        """
+        self._pending.update(user_ids)
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """
+        Подключается к каналу и запускает отправку сбросов.
+        """
+        if not self.enabled or not self.cache.enabled or self._task is not None:
+            return
+        self.cache.on_invalidate = self.publish
+        self._task = asyncio.create_task(self._run(), name="user-cache-notifier")
+
+    async def stop(self) -> None:
+        """
+        Останавливает отправку и закрывает соединение.
+        """
+        self.cache.on_invalidate = None
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self._connection is None or self._connection.is_closed():
+                    await self._connect()
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                await self._send()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"User cache notifier failed: {e}")
+                await self._close()
+                await asyncio.sleep(1.0)
+
+    async def _connect(self) -> None:
+        self._connection = await asyncpg.connect(
+            user=settings.DB_USER,
+            password=settings.DB_PASS,
+            host=settings.DB_HOST,
+            port=settings.DB_PORT,
+            database=settings.DB_NAME,
+        )
+        await self._connection.add_listener(self.channel, self._on_notify)
+        # Пока соединения не было, чужие изменения не приходили
+        self.cache.clear()
+
+    async def _send(self) -> None:
+        pending, self._pending = list(self._pending), set()
+        try:
+            while pending:
+                await self._connection.execute(
+                    "SELECT pg_notify($1, $2)",
+                    self.channel, ",".join(map(str, pending[:NOTIFY_CHUNK])),
+                )
+                del pending[:NOTIFY_CHUNK]
+        finally:
+            self._pending.update(pending)
+
+    def _on_notify(
+            self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        if pid == connection.get_server_pid():
+            return
+        try:
+            user_ids = [int(value) for value in payload.split(",") if value]
+        except ValueError:
+            logger.warning(f"Malformed user cache notification: {payload!r}")
+            return
+        self.cache.invalidate(user_ids, publish=False)
+
+    async def _close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            try:
+                await connection.close(timeout=5)
+            except Exception as e:
+                logger.warning(f"User cache notifier connection close failed: {e}")
+
+
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL,
+)
+user_cache_notifier = UserCacheNotifier(
+    user_cache,
+    channel=settings.USER_CACHE_CHANNEL,
+    enabled=settings.USER_CACHE_NOTIFY,
+)
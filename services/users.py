@@ -1,7 +1,9 @@
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Optional, Sequence, Tuple
 from database import AsyncSessionFactory
 from repository import UsersRepository
+from services.user_cache import UserCache, user_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,13 +16,21 @@ class UsersService:
     """
     Сервис для работы с пользователями. Обеспечивает доступ к
     UsersRepository через асинхронные сессии базы данных.
+
+    Пользователи кэшируются в памяти (cache): повторный /start и
+    get_user не обращаются к БД. Методы, изменяющие пользователя, кладут
+    в кэш строку, возвращённую UPDATE ... RETURNING, или сбрасывают
+    запись, если строка не возвращается.
     """
 
+    cache: UserCache = field(default=user_cache)
+
     async def register_user(
             self, user_id: int, chat_id: int, username: str,
             first_name: str, last_name: str):
         """
-        Регистрирует пользователя в базе данных.
+        Регистрирует пользователя в базе данных. Логин, имя и фамилия
+        существующего пользователя обновляются, если изменились.
 
         Args:
             user_id (int): Идентификатор пользователя Telegram.
@@ -32,16 +42,65 @@ class UsersService:
         Returns:
             Users | None: Созданный или существующий пользователь.
         """
+        record = (user_id, chat_id, username, first_name, last_name)
+        cached = self.cache.get(user_id)
+        if cached is not None and _profile(cached) == record:
+            return cached
+        version = self.cache.version
         try:
             async with AsyncSessionFactory() as session:
                 repo = UsersRepository(db_session=session)
-                user = await repo.register_user(
-                    user_id, chat_id, username, first_name, last_name
-                )
-                return user
+                user = await repo.register_user(*record)
         except Exception as e:
             logger.error(f"Ошибка регистрации пользователя: {e}")
             return None
+        if cached is not None:
+            # Профиль в кэше отличался: строка в БД обновлена
+            self._changed(user)
+        else:
+            self.cache.put(user, version)
+        return user
+
+    async def register_users(
+            self, records: Sequence[Tuple[int, int, str, str, str]]
+    ):
+        """
+        Регистрирует нескольких пользователей одним запросом.
+
+        Args:
+            records (Sequence[Tuple[int, int, str, str, str]]): Кортежи
+                (user_id, chat_id, логин, имя, фамилия).
+
+        Returns:
+            list[Users]: Созданные или существующие пользователи.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = UsersRepository(db_session=session)
+            users = await repo.register_users(records)
+        self.cache.invalidate(user.user_id for user in users)
+        for user in users:
+            self.cache.put(user)
+        return users
+
+    async def get_user(self, user_id: int):
+        """
+        Получает пользователя (из кэша, если он там есть).
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+
+        Returns:
+            Users | None: Пользователь или None, если он не найден.
+        """
+        user = self.cache.get(user_id)
+        if user is not None:
+            return user
+        version = self.cache.version
+        async with AsyncSessionFactory() as session:
+            repo = UsersRepository(db_session=session)
+            user = await repo.get_user(user_id)
+        self.cache.put(user, version)
+        return user
 
     async def update_last_data(self, user_id: int, updated_date: datetime):
         """
@@ -50,10 +109,31 @@ class UsersService:
         Args:
             user_id (int): Идентификатор пользователя.
             updated_date (datetime): Дата и время последней активности.
+
+        Returns:
+            Users: Обновлённый пользователь.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = UsersRepository(db_session=session)
+            user = await repo.update_last_data(user_id, updated_date)
+        self._changed(user)
+        return user
+
+    async def touch_many(self, touches: Sequence[Tuple[int, date]]) -> int:
+        """
+        Обновляет даты последней активности пачкой.
+
+        Args:
+            touches (Sequence[Tuple[int, date]]): Пары (user_id, дата).
+
+        Returns:
+            int: Число обновлённых пользователей.
         """
         async with AsyncSessionFactory() as session:
             repo = UsersRepository(db_session=session)
-            return await repo.update_last_data(user_id, updated_date)
+            updated = await repo.touch_many(touches)
+        self.cache.invalidate(user_id for user_id, _ in touches)
+        return updated
 
     async def set_phone_number(self, user_id: int, phone_number: str):
         """
@@ -62,10 +142,15 @@ class UsersService:
         Args:
             user_id (int): Идентификатор пользователя.
             phone_number (str): Телефонный номер.
+
+        Returns:
+            Users: Обновлённый пользователь.
         """
         async with AsyncSessionFactory() as session:
             repo = UsersRepository(db_session=session)
-            return await repo.set_phone_number(user_id, phone_number)
+            user = await repo.set_phone_number(user_id, phone_number)
+        self._changed(user)
+        return user
 
     async def set_client_status(self, user_id: int):
         """
@@ -73,10 +158,40 @@ class UsersService:
 
         Args:
             user_id (int): Идентификатор пользователя.
+
+        Returns:
+            Users: Обновлённый пользователь.
+        """
+        async with AsyncSessionFactory() as session:
+            repo = UsersRepository(db_session=session)
+            user = await repo.set_client_status(user_id, status="Client")
+        self._changed(user)
+        return user
+
+    async def record_client_request(
+            self, user_id: int, phone_number: Optional[str] = None
+    ):
+        """
+        Отмечает заявку пользователя: статус "Client", дата активности и
+        телефон записываются одним запросом в одной транзакции.
+
+        Args:
+            user_id (int): Идентификатор пользователя.
+            phone_number (Optional[str]): Телефонный номер, если указан.
+
+        Returns:
+            Users | None: Обновлённый пользователь или None, если он не найден.
         """
         async with AsyncSessionFactory() as session:
             repo = UsersRepository(db_session=session)
-            return await repo.set_client_status(user_id, status="Client")
+            user = await repo.record_client_request(
+                user_id,
+                updated_date=datetime.now(timezone.utc),
+                status="Client",
+                phone_number=phone_number,
+            )
+        self._changed(user)
+        return user
 
     async def get_inactive_clients(self):
         """
@@ -89,5 +204,16 @@ class UsersService:
             repo = UsersRepository(db_session=session)
             return await repo.get_inactive_clients()
 
+    def _changed(self, user) -> None:
+        # Сброс уходит другим процессам, свежая строка остаётся в кэше
+        if user is not None:
+            self.cache.invalidate([user.user_id])
+            self.cache.put(user)
+
+
+def _profile(user) -> Tuple[int, int, str, str, str]:
+    return (user.user_id, user.chat_id, user.username,
+            user.first_name, user.last_name)
+
 
 users_service = UsersService()
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Optional
 
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
@@ -13,6 +14,9 @@ class Settings(BaseSettings):
     base_dir: Path = os.path.dirname(os.path.dirname(__file__))
 
     ADMIN_CHAT_ID: int
+    # Адрес Bot API; для нагрузочного тестирования можно указать
+    # локальный fake-сервер (benchmarks/fake_telegram_api.py)
+    TELEGRAM_API_URL: str = "https://api.telegram.org"
 
     DB_NAME: str
     DB_USER: str
@@ -27,6 +31,109 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 
+    # Режим получения апдейтов: "polling" или "webhook"
+    BOT_MODE: str = "polling"
+    WEBHOOK_BASE_URL: Optional[str] = None
+    WEBHOOK_PATH: str = "/webhook"
+    WEBHOOK_SECRET: Optional[str] = None
+    # При нескольких инстансах за балансировщиком вебхук достаточно
+    # установить с одного из них
+    WEBHOOK_SET_ON_STARTUP: bool = True
+    WEB_SERVER_HOST: str = "0.0.0.0"
+    WEB_SERVER_PORT: int = 8000
+
+    # Планировщик апдейтов: порядок внутри чата, параллельность между чатами
+    UPDATE_WORKERS: int = 16
+    UPDATE_QUEUE_SIZE: int = 1000
+    # Число процессов-воркеров; при SHARDS > 1 апдейты распределяются
+    # между процессами по chat_id
+    SHARDS: int = 1
+    # Время на обработку очереди и фоновых задач при остановке, сек.
+    # Должно быть меньше таймаута остановки контейнера (docker: 10 сек)
+    SHUTDOWN_TIMEOUT: float = 8.0
+
+    # Общий пул HTTP-соединений с Telegram Bot API (aiogram и raw-клиент)
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 100
+    # Простаивающие соединения держатся открытыми, чтобы пачки
+    # уведомлений не тратили время на новый TLS handshake
+    HTTP_KEEPALIVE_TIMEOUT: float = 60.0
+    HTTP_DNS_CACHE_TTL: int = 300
+    HTTP_CONNECT_TIMEOUT: float = 10.0
+    HTTP_REQUEST_TIMEOUT: float = 60.0
+
+    # Лимиты исходящих сообщений (ограничения Telegram на рассылку)
+    RATE_LIMIT_GLOBAL_PER_SECOND: float = 30.0
+    RATE_LIMIT_PRIVATE_PER_SECOND: float = 1.0
+    RATE_LIMIT_PRIVATE_BURST: float = 5.0
+    RATE_LIMIT_GROUP_PER_MINUTE: float = 20.0
+    # Повторы отправки после ответа 429 с паузой retry_after
+    RATE_LIMIT_MAX_RETRIES: int = 3
+
+    # Устойчивость TelegramRawClient: таймауты, повторы, circuit breaker
+    TELEGRAM_TIMEOUT: float = 15.0
+    TELEGRAM_UPLOAD_TIMEOUT: float = 120.0
+    TELEGRAM_MAX_RETRIES: int = 3
+    TELEGRAM_BACKOFF_BASE: float = 0.5
+    TELEGRAM_BACKOFF_MAX: float = 10.0
+    # Число ошибок подряд до открытия breaker и время до пробного запроса
+    TELEGRAM_BREAKER_FAILURES: int = 5
+    TELEGRAM_BREAKER_RESET_TIMEOUT: float = 30.0
+
+    # JSON-библиотека для запросов к Bot API и данных WebApp:
+    # auto (orjson или msgspec, если установлены), orjson, msgspec, json
+    JSON_CODEC: str = "auto"
+
+    # Доставка заявок администраторам через outbox: размер пачки, период
+    # опроса таблицы (сек), время на доставку пачки до повтора другим
+    # процессом (сек), число попыток и задержки между ними (сек)
+    OUTBOX_BATCH_SIZE: int = 10
+    OUTBOX_POLL_INTERVAL: float = 2.0
+    OUTBOX_LEASE_TIMEOUT: float = 300.0
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETRY_BASE: float = 5.0
+    OUTBOX_RETRY_MAX: float = 600.0
+
+    # Планировщик напоминаний: насколько вперёд напоминания держатся в
+    # памяти (сек), размер пачки отправки и время до повтора при сбое (сек)
+    REMINDER_HORIZON: float = 3600.0
+    REMINDER_BATCH_SIZE: int = 50
+    REMINDER_LEASE_TIMEOUT: float = 60.0
+    # Последнее напоминание каждого чата в памяти (без запроса к БД на
+    # каждое "N минут"). Выключается автоматически при SHARDS > 1;
+    # выключите при нескольких инстансах бота с общей БД
+    REMINDER_LAST_INDEX: bool = True
+
+    # Очистка незапланированных напоминаний: срок хранения (дни), период
+    # запуска (сек, 0 — выключено), строк в транзакции и пауза между
+    # пачками (сек)
+    REMINDER_RETENTION_DAYS: int = 7
+    REMINDER_CLEANUP_INTERVAL: float = 3600.0
+    REMINDER_CLEANUP_BATCH_SIZE: int = 1000
+    REMINDER_CLEANUP_PAUSE: float = 0.1
+
+    # Отложенная запись дат активности пользователей: период записи
+    # (сек) и число пользователей в одном запросе
+    ACTIVITY_FLUSH_INTERVAL: float = 5.0
+    ACTIVITY_FLUSH_BATCH_SIZE: int = 1000
+
+    # Кэш пользователей в памяти: максимум записей (0 — выключен) и время
+    # жизни записи, сек
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL: float = 300.0
+    # Общий сброс кэша через LISTEN/NOTIFY; включите при нескольких
+    # инстансах бота с общей БД
+    USER_CACHE_NOTIFY: bool = False
+    USER_CACHE_CHANNEL: str = "users_changed"
+
+    # Период проверки изменений файлов галерей проектов, сек (0 — выключено)
+    GALLERY_RELOAD_INTERVAL: float = 5.0
+
+    # Эндпоинт метрик Prometheus (/metrics)
+    METRICS_ENABLED: bool = True
+    METRICS_HOST: str = "127.0.0.1"
+    METRICS_PORT: int = 9100
+
     @property
     def async_db_url(self) -> str:
         return (f"{self.DB_DRIVER}://{self.DB_USER}:{self.DB_PASS}"
@@ -36,8 +143,12 @@ class Settings(BaseSettings):
     def sync_db_url(self) -> str:
         return f"{self.DB_SYNC_DRIVER}://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def webhook_url(self) -> str:
+        return f"{(self.WEBHOOK_BASE_URL or '').rstrip('/')}{self.WEBHOOK_PATH}"
+
     def send_msg_url(self, text: str) -> str:
-        return (f"https://api.telegram.org/bot{self.bot_token}/"
+        return (f"{self.TELEGRAM_API_URL}/bot{self.bot_token}/"
                 f"sendMessage?chat_id={self.admin_chat_id}&text={text}")
 
 
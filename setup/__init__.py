@@ -2,11 +2,16 @@
 Пакет setup.
 
 Содержит функции для инициализации бота:
-регистрацию команд (commands.py) и подключение роутеров (routers.py).
+регистрацию команд (commands.py), подключение роутеров (routers.py)
+и middleware (middlewares.py), запуск приёма апдейтов через вебхук (webhook.py)
+и корректную остановку бота (lifecycle.py).
 """
 
 
 from setup.routers import register_routers
 from setup.commands import register_commands
+from setup.middlewares import register_middlewares
+from setup.lifecycle import register_lifecycle
+from setup.webhook import run_webhook
 
-__all__ = ["register_commands", "register_routers"]
\ No newline at end of file
+__all__ = ["register_commands", "register_routers", "register_middlewares", "register_lifecycle", "run_webhook"]
\ No newline at end of file
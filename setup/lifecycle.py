@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import signal
+from contextlib import suppress
+
+from aiogram import Bot
+
+from bot_config import dp, rate_limiter
+from database import dispose_engines
+from services import (
+    activity_tracker,
+    outbox_dispatcher,
+    reminder_cleanup,
+    reminder_scheduler,
+    user_cache_notifier,
+)
+from settings import settings
+from workers import background_tasks, update_scheduler
+
+logger = logging.getLogger(__name__)
+
+STOP_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+
+async def graceful_shutdown(bot: Bot) -> None:
+    """
+    Останавливает бота, не теряя принятую работу.
+
+    К моменту вызова приём апдейтов уже остановлен (polling отменён,
+    вебхук-сервер не принимает соединения). Порядок остановки:
+    обработка очереди планировщика, ожидание фоновых задач, остановка
+    доставки outbox, планировщика и очистки напоминаний (напоминания
+    остаются в БД), запись накопленных дат активности, отключение общего
+    сброса кэша пользователей, закрытие HTTP-сессий и пулов соединений с БД. На
+    очередь, задачи и outbox отводится settings.SHUTDOWN_TIMEOUT; всё,
+    что не успело завершиться, попадает в лог. Недоставленные заявки
+    остаются в outbox.
+
+    Args:
+        bot (Bot): Экземпляр бота.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.SHUTDOWN_TIMEOUT
+
+    dropped_updates = await update_scheduler.stop(
+        timeout=settings.SHUTDOWN_TIMEOUT
+    )
+    dropped_tasks = await background_tasks.shutdown(
+        timeout=max(deadline - loop.time(), 0)
+    )
+    for info in dropped_tasks:
+        logger.warning(f"Фоновая задача отменена при остановке: {info}")
+    await outbox_dispatcher.stop(timeout=max(deadline - loop.time(), 0))
+    await reminder_scheduler.stop()
+    await reminder_cleanup.stop()
+    await activity_tracker.stop()
+    await user_cache_notifier.stop()
+
+    await rate_limiter.close()
+    await bot.close()
+    await dispose_engines()
+
+    if dropped_updates or dropped_tasks:
+        logger.warning(
+            f"Остановка завершена с потерями: апдейтов {dropped_updates}, "
+            f"фоновых задач {len(dropped_tasks)}"
+        )
+    else:
+        logger.info("Остановка завершена без потерь")
+
+
+def register_lifecycle() -> None:
+    """
+    Подключает корректную остановку к хукам Dispatcher.
+
+    Вызывается после register_middlewares: запущенный им планировщик
+    апдейтов останавливается в graceful_shutdown. Здесь же запускаются
+    доставка заявок из outbox, планировщик и очистка напоминаний,
+    отложенная запись активности пользователей и общий сброс кэша
+    пользователей (если включён USER_CACHE_NOTIFY).
+    """
+    dp.startup.register(outbox_dispatcher.start)
+    dp.startup.register(reminder_scheduler.start)
+    dp.startup.register(reminder_cleanup.start)
+    dp.startup.register(activity_tracker.start)
+    dp.startup.register(user_cache_notifier.start)
+    dp.shutdown.register(graceful_shutdown)
+
+
+async def wait_for_stop_signal() -> None:
+    """
+    Ждёт SIGTERM или SIGINT.
+
+    На время ожидания сигналы не завершают процесс, а возвращают
+    управление вызывающему коду, который выполняет остановку.
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    installed = []
+    for sig in STOP_SIGNALS:
+        # На Windows обработчики сигналов в event loop не поддерживаются
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop.set)
+            installed.append(sig)
+    try:
+        await stop.wait()
+        logger.info("Получен сигнал остановки")
+    finally:
+        for sig in installed:
+            loop.remove_signal_handler(sig)
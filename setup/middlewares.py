@@ -0,0 +1,72 @@
+from bot_config import bot, dp, http_pool, rate_limiter
+from database.accessor import engine
+from middlewares import (
+    HandlerMetricsMiddleware,
+    OutboundRateLimitMiddleware,
+    TelegramRequestMetricsMiddleware,
+    UpdateMetricsMiddleware,
+    UpdateSchedulerMiddleware,
+)
+from monitoring import MetricsServer, registry, track_db_time
+from services import user_cache
+from settings import settings
+from workers import update_scheduler
+
+
+def collect_scheduler_stats():
+    """
+    Сэмплы метрик планировщика апдейтов для реестра метрик.
+    """
+    for name, value in update_scheduler.stats().items():
+        yield f"update_scheduler_{name}", {}, value
+
+
+def register_middlewares():
+    """
+    Подключает middleware к Dispatcher и сессии бота, запуск планировщика
+    апдейтов и запуск/остановку сервера метрик.
+
+    Внутренний middleware метрик подключается к observers Dispatcher:
+    aiogram применяет его ко всем вложенным роутерам.
+    """
+    # Порядок важен: middleware, подключённые после планировщика,
+    # выполняются уже в воркерах
+    dp.update.outer_middleware(UpdateSchedulerMiddleware(update_scheduler))
+    # Остановка планировщика — в setup.lifecycle.graceful_shutdown
+    dp.startup.register(update_scheduler.start)
+    # Первый middleware сессии — внешний: метрики запросов не включают
+    # ожидание в ограничителе
+    bot.session.middleware(
+        OutboundRateLimitMiddleware(
+            rate_limiter, max_retries=settings.RATE_LIMIT_MAX_RETRIES
+        )
+    )
+
+    if not settings.METRICS_ENABLED:
+        return
+
+    dp.update.outer_middleware(UpdateMetricsMiddleware())
+    handler_metrics = HandlerMetricsMiddleware()
+    for name, observer in dp.observers.items():
+        if name not in ("update", "error"):
+            observer.middleware(handler_metrics)
+    bot.session.middleware(TelegramRequestMetricsMiddleware())
+    track_db_time(engine.sync_engine)
+    registry.register_collector(
+        "update_scheduler", "Состояние планировщика апдейтов",
+        collect_scheduler_stats,
+    )
+    registry.register_collector(
+        "http_pool", "Загрузка пула HTTP-соединений", http_pool.collect
+    )
+    registry.register_collector(
+        "rate_limiter", "Состояние ограничителя исходящих сообщений",
+        rate_limiter.collect,
+    )
+    registry.register_collector(
+        "user_cache", "Состояние кэша пользователей", user_cache.collect
+    )
+
+    metrics_server = MetricsServer(settings.METRICS_HOST, settings.METRICS_PORT)
+    dp.startup.register(metrics_server.start)
+    dp.shutdown.register(metrics_server.stop)
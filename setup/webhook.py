@@ -0,0 +1,96 @@
+import logging
+
+from aiogram import Bot
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+
+from bot_config import bot, dp
+from settings import settings
+from setup.lifecycle import wait_for_stop_signal
+
+logger = logging.getLogger(__name__)
+
+
+async def on_webhook_startup(bot: Bot) -> None:
+    """
+    Устанавливает вебхук в Telegram при старте приложения.
+
+    Args:
+        bot (Bot): Экземпляр бота.
+    """
+    if not settings.WEBHOOK_SET_ON_STARTUP:
+        logger.info("Установка вебхука пропущена (WEBHOOK_SET_ON_STARTUP=False)")
+        return
+    await bot.set_webhook(
+        url=settings.webhook_url,
+        secret_token=settings.WEBHOOK_SECRET,
+        allowed_updates=dp.resolve_used_update_types(),
+    )
+    logger.info(f"Вебхук установлен: {settings.webhook_url}")
+
+
+async def healthcheck(request: web.Request) -> web.Response:
+    """
+    Отвечает балансировщику нагрузки, что инстанс жив.
+
+    Args:
+        request (web.Request): HTTP-запрос.
+
+    Returns:
+        web.Response: Ответ "ok".
+    """
+    return web.Response(text="ok")
+
+
+def create_webhook_app() -> web.Application:
+    """
+    Создаёт aiohttp-приложение, принимающее апдейты Telegram.
+
+    Запросы без корректного заголовка X-Telegram-Bot-Api-Secret-Token
+    отклоняются с кодом 401.
+
+    Returns:
+        web.Application: Настроенное приложение.
+    """
+    if not settings.WEBHOOK_BASE_URL:
+        raise ValueError("WEBHOOK_BASE_URL is required in webhook mode")
+    if not settings.WEBHOOK_SECRET:
+        logger.warning("WEBHOOK_SECRET не задан, входящие запросы не проверяются")
+
+    app = web.Application()
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        # Ответ отдаётся после постановки апдейта в очередь планировщика
+        handle_in_background=False,
+        secret_token=settings.WEBHOOK_SECRET,
+    ).register(app, path=settings.WEBHOOK_PATH)
+    app.router.add_get("/healthz", healthcheck)
+
+    dp.startup.register(on_webhook_startup)
+    setup_application(app, dp, bot=bot)
+    return app
+
+
+async def run_webhook() -> None:
+    """
+    Запускает HTTP-сервер вебхука и работает до SIGTERM/SIGINT.
+
+    При остановке сервер перестаёт принимать соединения, после чего
+    выполняются хуки остановки Dispatcher.
+    """
+    runner = web.AppRunner(create_webhook_app())
+    await runner.setup()
+    site = web.TCPSite(
+        runner, host=settings.WEB_SERVER_HOST, port=settings.WEB_SERVER_PORT
+    )
+    await site.start()
+    logger.info(
+        f"Вебхук-сервер слушает "
+        f"{settings.WEB_SERVER_HOST}:{settings.WEB_SERVER_PORT}"
+        f"{settings.WEBHOOK_PATH}"
+    )
+    try:
+        await wait_for_stop_signal()
+    finally:
+        await runner.cleanup()
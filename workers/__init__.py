@@ -0,0 +1,28 @@
+"""
+Пакет workers.
+
+Содержит инфраструктуру обработки апдейтов: планировщик, который
+сохраняет порядок апдейтов внутри чата и обрабатывает разные чаты
+параллельно, фронт, распределяющий апдейты между процессами по chat_id,
+и реестр фоновых задач, который учитывается при остановке бота.
+"""
+
+
+from workers.background import BackgroundTasks
+from workers.update_scheduler import UpdateScheduler
+from workers.sharding import ShardedFront
+from settings import settings
+
+update_scheduler = UpdateScheduler(
+    workers=settings.UPDATE_WORKERS,
+    max_queue_size=settings.UPDATE_QUEUE_SIZE,
+)
+background_tasks = BackgroundTasks()
+
+__all__ = [
+    "BackgroundTasks",
+    "UpdateScheduler",
+    "ShardedFront",
+    "background_tasks",
+    "update_scheduler",
+]
\ No newline at end of file
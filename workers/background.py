@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from typing import Any, Coroutine, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundTasks:
+    """
+    Реестр фоновых задач, которые продолжают работу после обработки
+    апдейта (например, отложенные напоминания).
+
+    Реестр хранит ссылки на задачи до их завершения (event loop держит
+    только слабые ссылки) и позволяет при остановке дождаться задач или
+    отменить оставшиеся с отчётом о них.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[asyncio.Task, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def spawn(
+        self, coro: Coroutine[Any, Any, Any], name: str, **info: Any
+    ) -> asyncio.Task:
+        """
+        Запускает задачу и регистрирует её.
+
+        Args:
+            coro (Coroutine): Корутина задачи.
+            name (str): Имя задачи.
+            **info (Any): Сведения о задаче для отчёта при остановке.
+
+        Returns:
+            asyncio.Task: Созданная задача.
+        """
+        task = asyncio.create_task(coro, name=name)
+        self._tasks[task] = {"name": name, **info}
+        task.add_done_callback(self._on_done)
+        return task
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """
+        Returns:
+            List[Dict[str, Any]]: Сведения о незавершённых задачах.
+        """
+        return list(self._tasks.values())
+
+    async def shutdown(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Ждёт завершения задач и отменяет те, что не успели завершиться.
+
+        Args:
+            timeout (Optional[float]): Максимальное время ожидания в секундах.
+
+        Returns:
+            List[Dict[str, Any]]: Сведения об отменённых задачах.
+        """
+        if not self._tasks:
+            return []
+        _, pending = await asyncio.wait(list(self._tasks), timeout=timeout)
+        dropped = [self._tasks[task] for task in pending]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        return dropped
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        info = self._tasks.pop(task, {})
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error(
+                f"Ошибка фоновой задачи {info.get('name')}: {error}",
+                exc_info=error,
+            )
@@ -0,0 +1,318 @@
+import asyncio
+import logging
+import multiprocessing
+import queue
+import secrets
+import signal
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Ключи апдейта, в которых объект содержит chat
+CHAT_UPDATE_KEYS = (
+    "message",
+    "edited_message",
+    "channel_post",
+    "edited_channel_post",
+    "business_message",
+    "edited_business_message",
+    "my_chat_member",
+    "chat_member",
+    "chat_join_request",
+    "message_reaction",
+    "chat_boost",
+)
+# Ключи апдейта, в которых есть только пользователь
+USER_UPDATE_KEYS = (
+    "inline_query",
+    "chosen_inline_result",
+    "shipping_query",
+    "pre_checkout_query",
+)
+
+
+def extract_chat_id(update: Dict[str, Any]) -> Optional[int]:
+    """
+    Определяет chat_id сырого апдейта без разбора в модели aiogram.
+
+    Для апдейтов без чата возвращается id пользователя.
+
+    Args:
+        update (Dict[str, Any]): Апдейт в формате Bot API.
+
+    Returns:
+        Optional[int]: chat_id, id пользователя или None.
+    """
+    for key in CHAT_UPDATE_KEYS:
+        event = update.get(key)
+        if event and "chat" in event:
+            return event["chat"]["id"]
+
+    callback = update.get("callback_query")
+    if callback:
+        message = callback.get("message")
+        if message and "chat" in message:
+            return message["chat"]["id"]
+        return callback["from"]["id"]
+
+    for key in USER_UPDATE_KEYS:
+        event = update.get(key)
+        if event:
+            return event["from"]["id"]
+
+    poll_answer = update.get("poll_answer")
+    if poll_answer and poll_answer.get("user"):
+        return poll_answer["user"]["id"]
+    return None
+
+
+def shard_for(update: Dict[str, Any], shards: int) -> int:
+    """
+    Выбирает шард для апдейта.
+
+    Все апдейты одного чата попадают в один шард, поэтому порядок их
+    обработки внутри чата сохраняется.
+
+    Args:
+        update (Dict[str, Any]): Апдейт в формате Bot API.
+        shards (int): Количество шардов.
+
+    Returns:
+        int: Номер шарда.
+    """
+    chat_id = extract_chat_id(update)
+    if chat_id is None:
+        chat_id = update.get("update_id", 0)
+    return chat_id % shards
+
+
+def run_shard_worker(index: int, updates: multiprocessing.Queue) -> None:
+    """
+    Точка входа процесса-воркера.
+
+    Процесс создаёт собственные Dispatcher, пул соединений с БД и
+    TelegramRawClient (модули импортируются заново при spawn).
+    Сигналы остановки воркер игнорирует: он завершается по сигналу
+    фронта, обработав уже полученные апдейты.
+
+    Args:
+        index (int): Номер шарда.
+        updates (multiprocessing.Queue): Очередь апдейтов шарда.
+    """
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, signal.SIG_IGN)
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format=f"%(asctime)s - shard-{index} - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(_shard_worker(index, updates))
+
+
+async def _shard_worker(index: int, updates: multiprocessing.Queue) -> None:
+    from bot_config import bot, dp
+    from setup import register_lifecycle, register_middlewares, register_routers
+
+    # У каждого шарда свой реестр метрик и свой порт эндпоинта
+    settings.METRICS_PORT += index + 1
+    register_routers()
+    register_middlewares()
+    register_lifecycle()
+    await dp.emit_startup(bot=bot, dispatcher=dp)
+    logger.info(f"Шард {index} запущен")
+
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            update = await loop.run_in_executor(None, updates.get)
+            if update is None:
+                break
+            try:
+                await dp.feed_raw_update(bot=bot, update=update)
+            except Exception as e:
+                logger.error(f"Шард {index}: ошибка обработки апдейта: {e}")
+    finally:
+        # Обработка очереди, закрытие сессий и пулов — setup.lifecycle
+        await dp.emit_shutdown(bot=bot, dispatcher=dp)
+        logger.info(f"Шард {index} остановлен")
+
+
+class ShardedFront:
+    """
+    Фронт-процесс: принимает апдейты (polling или вебхук) и раздаёт их
+    процессам-воркерам по chat_id.
+    """
+
+    def __init__(self, shards: int, queue_size: int) -> None:
+        """
+        Инициализация фронта.
+
+        Args:
+            shards (int): Количество процессов-воркеров.
+            queue_size (int): Максимальная длина очереди каждого шарда.
+        """
+        self.shards: int = shards
+        context = multiprocessing.get_context("spawn")
+        self.queues: List[multiprocessing.Queue] = [
+            context.Queue(maxsize=queue_size) for _ in range(shards)
+        ]
+        self.processes: List[multiprocessing.Process] = [
+            context.Process(
+                target=run_shard_worker,
+                args=(index, self.queues[index]),
+                name=f"shard-{index}",
+                daemon=False,
+            )
+            for index in range(shards)
+        ]
+
+    def start(self) -> None:
+        """
+        Запускает процессы-воркеры.
+        """
+        for process in self.processes:
+            process.start()
+        logger.info(f"Запущено шардов: {self.shards}")
+
+    async def stop(self) -> None:
+        """
+        Отправляет воркерам сигнал остановки и дожидается их завершения.
+
+        Сигнал ставится в очередь после уже принятых апдейтов, поэтому
+        воркеры обрабатывают их перед остановкой. Воркер, не успевший
+        завершиться за settings.SHUTDOWN_TIMEOUT с запасом, завершается
+        принудительно.
+        """
+        loop = asyncio.get_running_loop()
+        for updates in self.queues:
+            await loop.run_in_executor(None, updates.put, None)
+        join_timeout = settings.SHUTDOWN_TIMEOUT + 5
+        for process in self.processes:
+            await loop.run_in_executor(None, process.join, join_timeout)
+            if process.is_alive():
+                logger.error(
+                    f"Воркер {process.name} не завершился за {join_timeout} с, "
+                    f"процесс остановлен принудительно"
+                )
+                process.terminate()
+
+    async def dispatch(self, update: Dict[str, Any]) -> None:
+        """
+        Передаёт апдейт в очередь шарда.
+
+        Если очередь шарда заполнена, ожидание выполняется в пуле потоков,
+        не блокируя event loop.
+
+        Args:
+            update (Dict[str, Any]): Апдейт в формате Bot API.
+        """
+        updates = self.queues[shard_for(update, self.shards)]
+        try:
+            updates.put_nowait(update)
+        except queue.Full:
+            await asyncio.get_running_loop().run_in_executor(
+                None, updates.put, update
+            )
+
+    async def run_polling(self, polling_timeout: int = 10) -> None:
+        """
+        Получает апдейты через getUpdates и раздаёт их шардам.
+
+        Args:
+            polling_timeout (int): Таймаут long polling в секундах.
+        """
+        from bot_config import telegram_client, dp
+
+        offset: Optional[int] = None
+        allowed_updates = dp.resolve_used_update_types()
+        await telegram_client.post("deleteWebhook")
+        while True:
+            response = await telegram_client.post(
+                "getUpdates",
+                offset=offset,
+                timeout=polling_timeout,
+                allowed_updates=allowed_updates,
+            )
+            if not response.get("ok"):
+                logger.error(f"Ошибка getUpdates: {response}")
+                await asyncio.sleep(1)
+                continue
+            for update in response["result"]:
+                await self.dispatch(update)
+                offset = update["update_id"] + 1
+
+    async def handle_webhook(self, request: web.Request) -> web.Response:
+        """
+        Принимает апдейт от Telegram и передаёт его шарду.
+
+        Args:
+            request (web.Request): HTTP-запрос Telegram.
+
+        Returns:
+            web.Response: Пустой ответ или 401 при неверном секрете.
+        """
+        if settings.WEBHOOK_SECRET and not secrets.compare_digest(
+            request.headers.get("X-Telegram-Bot-Api-Secret-Token", ""),
+            settings.WEBHOOK_SECRET,
+        ):
+            return web.Response(body="Unauthorized", status=401)
+        await self.dispatch(await request.json())
+        return web.json_response({})
+
+    async def run_webhook(self) -> None:
+        """
+        Запускает HTTP-сервер вебхука и работает до отмены задачи.
+        """
+        from bot_config import bot
+        from setup.webhook import healthcheck, on_webhook_startup
+
+        app = web.Application()
+        app.router.add_post(settings.WEBHOOK_PATH, self.handle_webhook)
+        app.router.add_get("/healthz", healthcheck)
+
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(
+            runner,
+            host=settings.WEB_SERVER_HOST,
+            port=settings.WEB_SERVER_PORT,
+        )
+        await site.start()
+        await on_webhook_startup(bot)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+
+    async def run(self) -> None:
+        """
+        Запускает воркеры и приём апдейтов в режиме settings.BOT_MODE.
+
+        По SIGTERM/SIGINT приём апдейтов прекращается, после чего воркеры
+        обрабатывают полученные апдейты и завершаются.
+        """
+        from bot_config import telegram_client
+        from setup.lifecycle import wait_for_stop_signal
+
+        self.start()
+        if settings.BOT_MODE == "webhook":
+            receiver = asyncio.create_task(self.run_webhook())
+        else:
+            receiver = asyncio.create_task(self.run_polling())
+        stop_signal = asyncio.create_task(wait_for_stop_signal())
+        try:
+            await asyncio.wait(
+                [receiver, stop_signal], return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for task in (receiver, stop_signal):
+                task.cancel()
+            await asyncio.gather(receiver, stop_signal, return_exceptions=True)
+            await self.stop()
+            await telegram_client.close()
+        # Ошибка приёма апдейтов не должна теряться
+        if not receiver.cancelled():
+            receiver.result()
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledUpdate:
+    """
+    Апдейт, ожидающий обработки в очереди своего чата.
+
+    Attributes:
+        handler (Callable): Оставшаяся цепочка middleware и хендлеров.
+        event (Any): Апдейт Telegram.
+        data (Dict[str, Any]): Контекстные данные aiogram.
+        enqueued_at (float): Момент постановки в очередь (monotonic).
+    """
+
+    handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]]
+    event: Any
+    data: Dict[str, Any]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class UpdateScheduler:
+    """
+    Планировщик обработки апдейтов.
+
+    Апдейты одного чата обрабатываются строго по порядку, апдейты разных
+    чатов — параллельно на ограниченном числе воркеров. Общее число
+    апдейтов в очереди ограничено: при переполнении submit() ждёт
+    освобождения места, что замедляет приём новых апдейтов.
+    """
+
+    def __init__(self, workers: int, max_queue_size: int) -> None:
+        """
+        Инициализация планировщика.
+
+        Args:
+            workers (int): Количество воркеров.
+            max_queue_size (int): Максимальное число апдейтов в очереди
+                (включая обрабатываемые).
+        """
+        self.workers: int = workers
+        self.max_queue_size: int = max_queue_size
+        self._pending: Dict[Hashable, Deque[ScheduledUpdate]] = {}
+        self._ready: asyncio.Queue = asyncio.Queue()
+        self._slots: asyncio.Semaphore = asyncio.Semaphore(max_queue_size)
+        self._tasks: List[asyncio.Task] = []
+
+        self.queue_depth: int = 0
+        self.in_flight: int = 0
+        self.processed_total: int = 0
+        self.failed_total: int = 0
+        self.wait_seconds_sum: float = 0.0
+        self.wait_seconds_max: float = 0.0
+
+    @property
+    def running(self) -> bool:
+        """
+        Returns:
+            bool: True, если воркеры запущены.
+        """
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """
+        Запускает воркеры.
+        """
+        if self.running:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"update-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(
+            f"Планировщик апдейтов запущен: воркеров {self.workers}, "
+            f"размер очереди {self.max_queue_size}"
+        )
+
+    async def stop(self, timeout: Optional[float] = None) -> int:
+        """
+        Останавливает воркеры.
+
+        Если задан timeout, сначала ждёт обработки очереди; апдейты, не
+        обработанные к истечению таймаута, отбрасываются и попадают в лог.
+
+        Args:
+            timeout (Optional[float]): Время на обработку очереди в
+                секундах. None — остановить воркеры сразу.
+
+        Returns:
+            int: Количество отброшенных апдейтов (включая прерванные).
+        """
+        if timeout is not None and self.running and self.queue_depth:
+            logger.info(f"Обработка очереди перед остановкой: {self.queue_depth}")
+            await self.join(timeout)
+
+        dropped = self.queue_depth
+        if dropped:
+            update_ids = [
+                getattr(item.event, "update_id", None)
+                for queue in self._pending.values()
+                for item in queue
+            ]
+            logger.warning(
+                f"Отброшено апдейтов: {dropped} (прервано в обработке: "
+                f"{self.in_flight}), update_id в очереди: {update_ids}"
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        return dropped
+
+    async def submit(
+        self,
+        key: Hashable,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: Any,
+        data: Dict[str, Any],
+    ) -> None:
+        """
+        Ставит апдейт в очередь чата.
+
+        Args:
+            key (Hashable): Ключ упорядочивания (обычно chat_id).
+            handler (Callable): Цепочка обработки апдейта.
+            event (Any): Апдейт Telegram.
+            data (Dict[str, Any]): Контекстные данные aiogram.
+        """
+        await self._slots.acquire()
+        self.queue_depth += 1
+        item = ScheduledUpdate(handler=handler, event=event, data=data)
+
+        queue = self._pending.get(key)
+        if queue is None:
+            self._pending[key] = deque([item])
+            self._ready.put_nowait(key)
+        else:
+            queue.append(item)
+
+    async def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Ждёт обработки всех апдейтов в очереди.
+
+        Args:
+            timeout (Optional[float]): Максимальное время ожидания в секундах.
+
+        Returns:
+            bool: True, если очередь опустела до истечения таймаута.
+        """
+        try:
+            await asyncio.wait_for(self._ready.join(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Возвращает текущие показатели очереди.
+
+        Returns:
+            Dict[str, float]: Глубина очереди, число активных чатов,
+            обработанные апдейты и время ожидания в очереди.
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "queue_capacity": self.max_queue_size,
+            "active_chats": len(self._pending),
+            "in_flight": self.in_flight,
+            "processed_total": self.processed_total,
+            "failed_total": self.failed_total,
+            "wait_seconds_sum": self.wait_seconds_sum,
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._ready.get()
+            queue = self._pending[key]
+            item = queue.popleft()
+            try:
+                await self._process(item)
+            finally:
+                self.queue_depth -= 1
+                self._slots.release()
+                # Чат возвращается в конец очереди готовых, чтобы один
+                # активный чат не занимал воркер бесконечно
+                if queue:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._pending[key]
+                self._ready.task_done()
+
+    async def _process(self, item: ScheduledUpdate) -> None:
+        wait = time.monotonic() - item.enqueued_at
+        self.wait_seconds_sum += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        self.in_flight += 1
+        try:
+            await item.handler(item.event, item.data)
+        except Exception as e:
+            self.failed_total += 1
+            logger.error(
+                f"Ошибка обработки апдейта "
+                f"{getattr(item.event, 'update_id', None)}: {e}",
+                exc_info=True,
+            )
+        finally:
+            self.in_flight -= 1
+            self.processed_total += 1